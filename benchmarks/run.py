@@ -0,0 +1,292 @@
+"""Benchmark KokoroTTSEntity against a local stand-in Kokoro server.
+
+Run from the repository root, in an environment with Home Assistant installed:
+
+    python -m benchmarks.run                    # compare with benchmarks/baseline.json
+    python -m benchmarks.run --update-baseline  # record a new baseline
+    python -m benchmarks.run --scenario stream_assist_reply --repeat 10
+
+Every scenario drives the entity exactly as Home Assistant would: one-shot
+announcements through async_get_tts_audio, and Assist replies through
+async_stream_tts_audio fed with a recorded LLM token stream at its recorded
+pace. For each scenario the median over all repeats is reported for:
+
+- ttfa_ms: time to first audio. For streams it is measured from the moment
+  the token stream starts, so it includes the LLM's own first-token delay.
+- gap_max_ms: the longest pause between two audio chunks after the first.
+- wall_ms: total time until the last audio chunk.
+- loop_lag_ms: the worst event loop oversleep seen by a 5 ms ticker.
+- peak_kib: peak Python memory allocated while the scenario ran.
+
+A metric regresses when it exceeds its baseline by more than --tolerance
+(relative) plus a small absolute slack. Any regression makes the run exit
+with status 1. Baselines depend on the machine; record one where you compare.
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+from collections.abc import AsyncGenerator, Awaitable, Callable
+from dataclasses import dataclass
+import json
+from pathlib import Path
+import statistics
+import sys
+import time
+import tracemalloc
+from typing import Any
+
+import aiohttp
+
+from homeassistant.components.tts.entity import TTSAudioRequest
+
+from custom_components.kokoro_tts.backends import Backend, BackendPool
+from custom_components.kokoro_tts.tts import KokoroTTSEntity
+
+from .stand_in import StandInServer, StandInSettings
+
+BENCH_DIR = Path(__file__).parent
+STREAMS_DIR = BENCH_DIR / "streams"
+BASELINE_FILE = BENCH_DIR / "baseline.json"
+
+METRICS = ("ttfa_ms", "gap_max_ms", "wall_ms", "loop_lag_ms", "peak_kib")
+
+# Absolute slack per metric, so scheduler noise on tiny values never fails.
+SLACK = {
+    "ttfa_ms": 20.0,
+    "gap_max_ms": 20.0,
+    "wall_ms": 50.0,
+    "loop_lag_ms": 10.0,
+    "peak_kib": 256.0,
+}
+
+LOOP_TICK = 0.005
+
+BRIEFING = (
+    "Good morning! Here's your briefing for Tuesday. You have three events today: "
+    "a team stand-up at 9:30, lunch with Sam at 12:15, and the dentist at 4 pm. "
+    "The washing machine finished its cycle 20 minutes ago, so the laundry is "
+    "ready to hang. Energy use yesterday was 11.4 kWh, about 8% lower than last "
+    "week's average. Traffic on your commute is light, and the drive should take "
+    "around 25 minutes. Have a great day!"
+)
+
+
+@dataclass
+class Scenario:
+    """One benchmark scenario."""
+
+    name: str
+    fmt: str
+    # Exactly one of message (one-shot) or stream (token stream file stem).
+    message: str | None = None
+    stream: str | None = None
+    # Leading container header that is not audio (the streamed WAV header).
+    header_bytes: int = 0
+
+
+SCENARIOS: tuple[Scenario, ...] = (
+    Scenario("announce_short", "mp3", message="Someone is at the front door."),
+    Scenario("announce_briefing", "mp3", message=BRIEFING),
+    Scenario("stream_assist_short", "mp3", stream="assist_short"),
+    Scenario("stream_assist_reply", "mp3", stream="assist_reply"),
+    Scenario("stream_assist_reply_wav", "wav", stream="assist_reply", header_bytes=44),
+    Scenario("stream_morning_briefing", "mp3", stream="morning_briefing"),
+)
+
+
+def _load_tokens(stem: str) -> list[tuple[float, str]]:
+    """Return (delay in seconds, token) pairs of a recorded token stream."""
+    data = json.loads((STREAMS_DIR / f"{stem}.json").read_text(encoding="utf-8"))
+    return [(delay_ms / 1000, token) for delay_ms, token in data["tokens"]]
+
+
+async def _replay(tokens: list[tuple[float, str]]) -> AsyncGenerator[str]:
+    """Yield tokens at their recorded pace."""
+    for delay, token in tokens:
+        await asyncio.sleep(delay)
+        yield token
+
+
+class _LoopMonitor:
+    """Measures how late a periodic ticker wakes up."""
+
+    def __init__(self) -> None:
+        self.worst = 0.0
+        self._task: asyncio.Task[None] | None = None
+
+    async def _run(self) -> None:
+        while True:
+            started = time.perf_counter()
+            await asyncio.sleep(LOOP_TICK)
+            self.worst = max(self.worst, time.perf_counter() - started - LOOP_TICK)
+
+    def __enter__(self) -> _LoopMonitor:
+        self._task = asyncio.create_task(self._run())
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        if self._task is not None:
+            self._task.cancel()
+
+
+async def _measure(
+    produce: Callable[[], Awaitable[AsyncGenerator[bytes]]], header_bytes: int
+) -> dict[str, float]:
+    """Consume produced audio and return the metrics of one run."""
+    tracemalloc.start()
+    with _LoopMonitor() as monitor:
+        started = time.perf_counter()
+        arrivals: list[float] = []
+        received = 0
+        audio = await produce()
+        async for chunk in audio:
+            received += len(chunk)
+            if chunk and received > header_bytes:
+                arrivals.append(time.perf_counter())
+        finished = time.perf_counter()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    if not arrivals:
+        raise RuntimeError("Scenario produced no audio")
+    gaps = [later - earlier for earlier, later in zip(arrivals, arrivals[1:])]
+    return {
+        "ttfa_ms": (arrivals[0] - started) * 1000,
+        "gap_max_ms": max(gaps, default=0.0) * 1000,
+        "wall_ms": (finished - started) * 1000,
+        "loop_lag_ms": monitor.worst * 1000,
+        "peak_kib": peak / 1024,
+    }
+
+
+def _entity(session: aiohttp.ClientSession, url: str, fmt: str) -> KokoroTTSEntity:
+    """Return an entity wired to the stand-in server, without a cache."""
+    return KokoroTTSEntity(
+        backends=BackendPool([Backend(url, session)]),
+        name="benchmark",
+        api_key="",
+        model="kokoro",
+        persona="af_heart",
+        speed=1.0,
+        fmt=fmt,
+        sample_rate=24000,
+        language="en-us",
+    )
+
+
+async def _run_scenario(
+    scenario: Scenario, url: str, session: aiohttp.ClientSession
+) -> dict[str, float]:
+    """Run one scenario once on a fresh entity."""
+    entity = _entity(session, url, scenario.fmt)
+
+    if scenario.message is not None:
+        message = scenario.message
+
+        async def _produce() -> AsyncGenerator[bytes]:
+            _, audio = await entity.async_get_tts_audio(message, "en", {})
+
+            async def _once() -> AsyncGenerator[bytes]:
+                yield audio
+
+            return _once()
+
+    else:
+        tokens = _load_tokens(scenario.stream or "")
+
+        async def _produce() -> AsyncGenerator[bytes]:
+            response = await entity.async_stream_tts_audio(
+                TTSAudioRequest(language="en", options={}, message_gen=_replay(tokens))
+            )
+            return response.data_gen
+
+    return await _measure(_produce, scenario.header_bytes)
+
+
+async def async_run(names: list[str] | None, repeat: int) -> dict[str, dict[str, float]]:
+    """Run the selected scenarios and return the median of each metric."""
+    server = StandInServer(StandInSettings())
+    url = await server.async_start()
+    results: dict[str, dict[str, float]] = {}
+    try:
+        async with aiohttp.ClientSession() as session:
+            for scenario in SCENARIOS:
+                if names and scenario.name not in names:
+                    continue
+                # One unmeasured run warms up connections and imports.
+                await _run_scenario(scenario, url, session)
+                runs = [
+                    await _run_scenario(scenario, url, session) for _ in range(repeat)
+                ]
+                results[scenario.name] = {
+                    metric: round(statistics.median(run[metric] for run in runs), 1)
+                    for metric in METRICS
+                }
+    finally:
+        await server.async_stop()
+    return results
+
+
+def compare(
+    results: dict[str, dict[str, float]],
+    baseline: dict[str, dict[str, float]],
+    tolerance: float,
+) -> list[str]:
+    """Print results next to the baseline and return the regressions."""
+    regressions: list[str] = []
+    header = f"{'scenario':<26}{'metric':<13}{'result':>10}{'baseline':>10}"
+    print(header)
+    print("-" * len(header))
+    for name, metrics in results.items():
+        for metric, value in metrics.items():
+            base = baseline.get(name, {}).get(metric)
+            marker = ""
+            if base is not None and value > base * (1 + tolerance) + SLACK[metric]:
+                marker = "  REGRESSION"
+                regressions.append(f"{name}.{metric}: {value} > {base}")
+            shown = "-" if base is None else f"{base:.1f}"
+            print(f"{name:<26}{metric:<13}{value:>10.1f}{shown:>10}{marker}")
+    return regressions
+
+
+def main(argv: list[str] | None = None) -> int:
+    """Run the benchmarks from the command line."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--scenario", action="append", help="run only this scenario")
+    parser.add_argument("--repeat", type=int, default=5, help="measured runs per scenario")
+    parser.add_argument(
+        "--tolerance", type=float, default=0.25, help="allowed relative slowdown"
+    )
+    parser.add_argument("--baseline", type=Path, default=BASELINE_FILE)
+    parser.add_argument(
+        "--update-baseline", action="store_true", help="store results as the baseline"
+    )
+    args = parser.parse_args(argv)
+
+    results = asyncio.run(async_run(args.scenario, max(1, args.repeat)))
+
+    if args.update_baseline:
+        stored: dict[str, Any] = {}
+        if args.baseline.exists():
+            stored = json.loads(args.baseline.read_text(encoding="utf-8"))
+        stored.update(results)
+        args.baseline.write_text(json.dumps(stored, indent=2) + "\n", encoding="utf-8")
+        compare(results, {}, args.tolerance)
+        print(f"\nBaseline written to {args.baseline}")
+        return 0
+
+    baseline: dict[str, dict[str, float]] = {}
+    if args.baseline.exists():
+        baseline = json.loads(args.baseline.read_text(encoding="utf-8"))
+    regressions = compare(results, baseline, args.tolerance)
+    if regressions:
+        print("\nPerformance regressions:")
+        for regression in regressions:
+            print(f"  {regression}")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,83 @@
+"""Benchmark the cost per streamed token of sentence segmentation.
+
+Run from the repository root:
+
+    python -m benchmarks.segmenter
+    python -m benchmarks.segmenter --max-growth 3 --repeat 10
+
+Synthetic token streams of growing length are fed, a few characters at a
+time, to an AdaptiveSegmenter configured as for an Assist reply. Two shapes
+are measured: ordinary prose, and a single run-on "sentence" without any
+terminal punctuation, the case where rescanning the whole unterminated
+buffer on every token made the cost grow with the length of the reply.
+
+The best of --repeat runs is reported per length, in microseconds per
+token. The run exits 1 when the cost per token of the longest stream
+exceeds that of the shortest by more than --max-growth times.
+"""
+from __future__ import annotations
+
+import argparse
+import itertools
+import sys
+import time
+
+from custom_components.kokoro_tts.const import DEFAULT_FIRST_CHUNK_CHARS, DEFAULT_MERGE_CHARS
+from custom_components.kokoro_tts.segmenter import AdaptiveSegmenter
+
+# Stream lengths in characters.
+LENGTHS = (2_000, 20_000, 200_000)
+
+# Characters per token; LLM tokens average three to four characters of English.
+TOKEN_CHARS = 4
+
+PROSE = (
+    "Mr. Smith turned the heating down to 19 degrees, e.g. for the night. "
+    "The hall lights are off, and the front door is locked! Anything else? "
+)
+RUN_ON = "and the lights in the hall stay on while the door remains unlocked "
+
+
+def _tokens(pattern: str, length: int) -> list[str]:
+    """Return pattern repeated to length characters, cut into tokens."""
+    text = "".join(itertools.islice(itertools.cycle(pattern), length))
+    return [text[i : i + TOKEN_CHARS] for i in range(0, len(text), TOKEN_CHARS)]
+
+
+def _per_token_us(tokens: list[str], repeat: int) -> float:
+    """Return the best time per token over repeat runs, in microseconds."""
+    best = float("inf")
+    for _ in range(repeat):
+        segmenter = AdaptiveSegmenter(DEFAULT_FIRST_CHUNK_CHARS, DEFAULT_MERGE_CHARS)
+        started = time.perf_counter()
+        for token in tokens:
+            segmenter.feed(token)
+        segmenter.flush()
+        best = min(best, time.perf_counter() - started)
+    return best / len(tokens) * 1e6
+
+
+def main() -> int:
+    """Run the benchmark and return the exit status."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--max-growth", type=float, default=2.0)
+    args = parser.parse_args()
+
+    failed = False
+    print(f"{'shape':<8}" + "".join(f"{length:>12,}" for length in LENGTHS) + "      growth")
+    for shape, pattern in (("prose", PROSE), ("run_on", RUN_ON)):
+        costs = [_per_token_us(_tokens(pattern, length), args.repeat) for length in LENGTHS]
+        growth = costs[-1] / costs[0]
+        status = "" if growth <= args.max_growth else "  REGRESSION"
+        failed = failed or bool(status)
+        print(
+            f"{shape:<8}"
+            + "".join(f"{cost:>10.2f}us" for cost in costs)
+            + f"{growth:>11.2f}x{status}"
+        )
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
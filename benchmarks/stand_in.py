@@ -0,0 +1,91 @@
+"""Local stand-in for a Kokoro FastAPI server, used by the benchmarks."""
+from __future__ import annotations
+
+import asyncio
+from dataclasses import dataclass
+
+from aiohttp import web
+
+# Kokoro's raw PCM: 24 kHz, mono, 16-bit, i.e. 48 000 bytes per second.
+PCM_BYTES_PER_SECOND = 48_000
+
+# A silent MPEG-2 Layer III frame: 24 kHz, 48 kbit/s, mono, 576 samples.
+MP3_FRAME = bytes((0xFF, 0xF3, 0x64, 0xC0)) + bytes(140)
+MP3_FRAME_SECONDS = 576 / 24_000
+
+
+@dataclass
+class StandInSettings:
+    """How the stand-in server behaves."""
+
+    # Synthesis delay before the first audio byte: fixed plus per character.
+    base_delay: float = 0.15
+    per_char_delay: float = 0.002
+    # Seconds of speech produced per input character.
+    speech_per_char: float = 0.06
+    # Size of each streamed chunk and the pause between chunks.
+    chunk_bytes: int = 4800
+    chunk_interval: float = 0.01
+
+
+class StandInServer:
+    """aiohttp server answering /v1/models, /v1/audio/voices and /v1/audio/speech.
+
+    Audio is silence of a duration proportional to the input text, as raw PCM
+    or as valid MP3 frames, so the integration's container handling runs on
+    realistic data without a real model.
+    """
+
+    def __init__(self, settings: StandInSettings | None = None) -> None:
+        """Initialize the server."""
+        self.settings = settings or StandInSettings()
+        self.requests = 0
+        self._runner: web.AppRunner | None = None
+        self.url = ""
+
+    async def async_start(self) -> str:
+        """Start listening on a free local port and return the base URL."""
+        app = web.Application()
+        app.router.add_get("/v1/models", self._models)
+        app.router.add_get("/v1/audio/voices", self._voices)
+        app.router.add_post("/v1/audio/speech", self._speech)
+        self._runner = web.AppRunner(app)
+        await self._runner.setup()
+        site = web.TCPSite(self._runner, "127.0.0.1", 0)
+        await site.start()
+        port = self._runner.addresses[0][1]
+        self.url = f"http://127.0.0.1:{port}"
+        return self.url
+
+    async def async_stop(self) -> None:
+        """Stop the server."""
+        if self._runner is not None:
+            await self._runner.cleanup()
+
+    async def _models(self, request: web.Request) -> web.Response:
+        return web.json_response({"data": [{"id": "kokoro"}]})
+
+    async def _voices(self, request: web.Request) -> web.Response:
+        return web.json_response({"voices": ["af_heart", "af_bella", "bf_emma"]})
+
+    async def _speech(self, request: web.Request) -> web.StreamResponse:
+        body = await request.json()
+        self.requests += 1
+        text = str(body.get("input", ""))
+        fmt = body.get("response_format", "mp3")
+        settings = self.settings
+
+        await asyncio.sleep(settings.base_delay + settings.per_char_delay * len(text))
+        seconds = settings.speech_per_char * len(text)
+        if fmt == "mp3":
+            audio = MP3_FRAME * max(1, round(seconds / MP3_FRAME_SECONDS))
+        else:
+            audio = bytes(int(seconds * PCM_BYTES_PER_SECOND) & ~1)
+
+        response = web.StreamResponse(headers={"Content-Type": f"audio/{fmt}"})
+        await response.prepare(request)
+        for start in range(0, len(audio), settings.chunk_bytes):
+            await response.write(audio[start : start + settings.chunk_bytes])
+            await asyncio.sleep(settings.chunk_interval)
+        await response.write_eof()
+        return response
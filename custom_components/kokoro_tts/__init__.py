@@ -1,33 +1,144 @@
 """Kokoro TTS Home Assistant integration."""
 from __future__ import annotations
 
+from dataclasses import dataclass
+from datetime import datetime
 import logging
 
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import Platform
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers import config_validation as cv
+from homeassistant.helpers.event import async_track_time_interval
 
-from .const import DOMAIN
+from .backends import HEALTH_CHECK_INTERVAL, Backend, BackendPool
+from .cache import SynthesisCache, async_remove_cache
+from .client import PoolSettings, async_acquire_session, async_release_session
+from .const import (
+    CONF_API_KEY,
+    CONF_BACKEND_CONCURRENCY,
+    CONF_BASE_URL,
+    CONF_BASE_URLS,
+    CONF_CACHE_SIZE,
+    CONF_DNS_CACHE_TTL,
+    CONF_POOL_LIMIT,
+    CONF_POOL_LIMIT_PER_HOST,
+    DEFAULT_API_KEY,
+    DEFAULT_BACKEND_CONCURRENCY,
+    DEFAULT_CACHE_SIZE,
+    DEFAULT_DNS_CACHE_TTL,
+    DEFAULT_POOL_LIMIT,
+    DEFAULT_POOL_LIMIT_PER_HOST,
+    DOMAIN,
+)
+from .coordinator import KokoroCatalogCoordinator
+from .metrics import KokoroMetrics
 
-PLATFORMS = [Platform.TTS]
+PLATFORMS = [Platform.SENSOR, Platform.TTS]
 
 CONFIG_SCHEMA = cv.config_entry_only_config_schema(DOMAIN)
 
 _LOGGER = logging.getLogger(__name__)
 
 
+@dataclass
+class KokoroData:
+    """Runtime data shared by the platforms of one config entry."""
+
+    backends: BackendPool
+    cache: SynthesisCache | None
+    metrics: KokoroMetrics
+    catalog: KokoroCatalogCoordinator
+
+
+KokoroConfigEntry = ConfigEntry[KokoroData]
+
+
 async def async_setup(hass: HomeAssistant, config: dict) -> bool:
     """Set up the Kokoro TTS component."""
     return True
 
 
-async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
+async def async_setup_entry(hass: HomeAssistant, entry: KokoroConfigEntry) -> bool:
     """Set up Kokoro TTS from a config entry."""
-    await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
+    merged = {**entry.data, **(entry.options or {})}
+
+    settings = PoolSettings(
+        limit=int(merged.get(CONF_POOL_LIMIT, DEFAULT_POOL_LIMIT)),
+        limit_per_host=int(
+            merged.get(CONF_POOL_LIMIT_PER_HOST, DEFAULT_POOL_LIMIT_PER_HOST)
+        ),
+        dns_cache_ttl=int(merged.get(CONF_DNS_CACHE_TTL, DEFAULT_DNS_CACHE_TTL)),
+    )
+    cache: SynthesisCache | None = None
+    cache_mb = int(merged.get(CONF_CACHE_SIZE, DEFAULT_CACHE_SIZE))
+    if cache_mb > 0:
+        cache = SynthesisCache(hass, entry.entry_id, cache_mb * 1024 * 1024)
+        await cache.async_load()
+
+    api_key = merged.get(CONF_API_KEY, DEFAULT_API_KEY) or DEFAULT_API_KEY
+    base_urls = [
+        url.rstrip("/") for url in merged.get(CONF_BASE_URLS) or [merged[CONF_BASE_URL]]
+    ]
+    backends = BackendPool(
+        [
+            Backend(url, async_acquire_session(hass, url, settings))
+            for url in base_urls
+        ],
+        concurrency=int(
+            merged.get(CONF_BACKEND_CONCURRENCY, DEFAULT_BACKEND_CONCURRENCY)
+        ),
+        api_key=api_key,
+    )
+    catalog = KokoroCatalogCoordinator(hass, entry, backends, api_key)
+    entry.runtime_data = KokoroData(
+        backends=backends, cache=cache, metrics=KokoroMetrics(), catalog=catalog
+    )
+
+    try:
+        await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
+    except Exception:
+        await _async_release_backends(hass, backends)
+        if cache is not None:
+            await cache.async_unload()
+        raise
+
+    # Fetched in the background so a slow server does not delay startup;
+    # requests are not checked against the catalogue until it arrives.
+    entry.async_create_background_task(
+        hass, catalog.async_refresh(), f"{DOMAIN} voice catalogue"
+    )
+
+    async def _async_health_check(_now: datetime) -> None:
+        if await backends.async_probe():
+            # A rejected key is not an outage: ask the user for a new one.
+            entry.async_start_reauth(hass)
+
+    entry.async_on_unload(
+        async_track_time_interval(
+            hass, _async_health_check, HEALTH_CHECK_INTERVAL, cancel_on_shutdown=True
+        )
+    )
     return True
 
 
-async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
+async def _async_release_backends(hass: HomeAssistant, backends: BackendPool) -> None:
+    """Stop background probes and release the pooled sessions of every backend."""
+    backends.shutdown()
+    for backend in backends.backends:
+        await async_release_session(hass, backend.session)
+
+
+async def async_unload_entry(hass: HomeAssistant, entry: KokoroConfigEntry) -> bool:
     """Unload a config entry."""
-    return await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
+    unload_ok = await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
+    if unload_ok:
+        await _async_release_backends(hass, entry.runtime_data.backends)
+        if entry.runtime_data.cache is not None:
+            await entry.runtime_data.cache.async_unload()
+    return unload_ok
+
+
+async def async_remove_entry(hass: HomeAssistant, entry: KokoroConfigEntry) -> None:
+    """Remove cached audio belonging to a deleted config entry."""
+    await async_remove_cache(hass, entry.entry_id)
@@ -0,0 +1,129 @@
+"""Prioritised, fair admission of requests to Kokoro server backends."""
+from __future__ import annotations
+
+import asyncio
+from collections import deque
+from collections.abc import Hashable
+from email.utils import parsedate_to_datetime
+from enum import IntEnum
+import time
+from typing import Generic, TypeVar
+
+_T = TypeVar("_T")
+
+# Statuses a server uses to say "not now"; the request is retried, not failed.
+BUSY_STATUSES = (429, 503)
+
+# Pause applied when a busy response carries no usable Retry-After header.
+DEFAULT_RETRY_AFTER = 1.0
+
+# Busy responses asking for a longer pause than this are not worth waiting for:
+# the caller gets the error instead of a reply that arrives far too late.
+MAX_RETRY_AFTER = 30.0
+
+
+class Priority(IntEnum):
+    """Request classes, most urgent first."""
+
+    # A sentence of an Assist reply someone is listening to right now.
+    STREAM = 0
+    # A one-shot announcement (tts.speak) or one of its segments.
+    INTERACTIVE = 1
+    # Warm phrases and the kokoro_tts.prefetch service.
+    BACKGROUND = 2
+
+
+class BackendBusyError(RuntimeError):
+    """A server answered 429 or 503 and asked to be retried later."""
+
+    def __init__(self, message: str, status: int, retry_after: float) -> None:
+        """Initialize the error."""
+        super().__init__(message)
+        self.status = status
+        self.retry_after = retry_after
+
+
+def parse_retry_after(value: str | None) -> float:
+    """Return the pause requested by a Retry-After header, in seconds.
+
+    Both forms allowed by RFC 9110 are understood: delay-seconds and an
+    HTTP-date. Missing or malformed values give DEFAULT_RETRY_AFTER.
+    """
+    if not value:
+        return DEFAULT_RETRY_AFTER
+    value = value.strip()
+    if value.isdigit():
+        return float(value)
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return DEFAULT_RETRY_AFTER
+    if retry_at.tzinfo is None:
+        return DEFAULT_RETRY_AFTER
+    return max(0.0, retry_at.timestamp() - time.time())
+
+
+class AdmissionQueue(Generic[_T]):
+    """Requests waiting for a backend slot.
+
+    Waiters are served by priority class. Within a class, each flow (one
+    streamed reply, one announcement) has its own FIFO, and flows take turns:
+    a long reply with several look-ahead sentences queued cannot starve the
+    first sentence of another satellite's reply.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the queue."""
+        # priority -> flow -> waiters; dict order is the round-robin order.
+        self._classes: dict[Priority, dict[Hashable, deque[asyncio.Future[_T]]]] = {
+            priority: {} for priority in Priority
+        }
+        self._size = 0
+
+    def __len__(self) -> int:
+        """Return the number of queued waiters."""
+        return self._size
+
+    def push(
+        self,
+        priority: Priority,
+        flow: Hashable,
+        waiter: asyncio.Future[_T],
+        *,
+        first: bool = False,
+    ) -> None:
+        """Queue a waiter behind the others of its flow, or ahead of them."""
+        waiters = self._classes[priority].setdefault(flow, deque())
+        if first:
+            waiters.appendleft(waiter)
+        else:
+            waiters.append(waiter)
+        self._size += 1
+
+    def discard(
+        self, priority: Priority, flow: Hashable, waiter: asyncio.Future[_T]
+    ) -> None:
+        """Remove a waiter that gave up before being served."""
+        flows = self._classes[priority]
+        waiters = flows.get(flow)
+        if waiters is None or waiter not in waiters:
+            return
+        waiters.remove(waiter)
+        self._size -= 1
+        if not waiters:
+            del flows[flow]
+
+    def pop(self) -> asyncio.Future[_T] | None:
+        """Remove and return the next waiter, or None if there is none."""
+        for flows in self._classes.values():
+            while flows:
+                flow, waiters = next(iter(flows.items()))
+                waiter = waiters.popleft()
+                self._size -= 1
+                # Rotate: the flow goes to the back of its class.
+                del flows[flow]
+                if waiters:
+                    flows[flow] = waiters
+                if not waiter.done():
+                    return waiter
+        return None
@@ -0,0 +1,153 @@
+"""Audio container helpers for Kokoro TTS."""
+from __future__ import annotations
+
+import struct
+
+from .mp3 import Mp3FrameFilter
+from .ogg import OggOpusRemuxer
+from .resample import StreamingResampler
+
+# Formats whose separately synthesised parts can be joined into one valid file.
+# flac carries a stream-level header that cannot simply be stitched.
+JOINABLE_FORMATS: tuple[str, ...] = ("mp3", "wav", "pcm", "opus")
+
+# Kokoro's raw "pcm" output: 24 kHz, mono, signed 16-bit little-endian.
+KOKORO_SAMPLE_RATE = 24000
+PCM_CHANNELS = 1
+PCM_SAMPLE_WIDTH = 2
+
+# Size placeholder for a WAV whose length is unknown while it is streamed.
+# Players treat it as "read until the stream ends".
+WAV_UNKNOWN_SIZE = 0xFFFFFFFF
+
+
+def _wav_parts(data: bytes) -> tuple[bytes, bytes]:
+    """Return the raw "fmt " chunk body and the sample data of a WAV file."""
+    if len(data) < 12 or data[:4] != b"RIFF" or data[8:12] != b"WAVE":
+        raise ValueError("Not a RIFF/WAVE file")
+    fmt_chunk = b""
+    offset = 12
+    while offset + 8 <= len(data):
+        chunk_id = data[offset : offset + 4]
+        (size,) = struct.unpack_from("<I", data, offset + 4)
+        body_start = offset + 8
+        if chunk_id == b"data":
+            # Streaming encoders may leave a placeholder size; trust the file end.
+            body_end = min(len(data), body_start + size)
+            if not fmt_chunk:
+                raise ValueError("WAV data chunk precedes its fmt chunk")
+            return fmt_chunk, data[body_start:body_end]
+        if chunk_id == b"fmt ":
+            fmt_chunk = data[body_start : body_start + size]
+        offset = body_start + size + (size & 1)
+    raise ValueError("WAV file has no data chunk")
+
+
+def wav_header(fmt_chunk: bytes, data_size: int) -> bytes:
+    """Return a RIFF/WAVE header for data_size bytes of samples."""
+    return (
+        b"RIFF"
+        + struct.pack("<I", 4 + 8 + len(fmt_chunk) + 8 + data_size)
+        + b"WAVE"
+        + b"fmt "
+        + struct.pack("<I", len(fmt_chunk))
+        + fmt_chunk
+        + b"data"
+        + struct.pack("<I", data_size)
+    )
+
+
+def pcm_fmt_chunk(
+    sample_rate: int,
+    channels: int = PCM_CHANNELS,
+    sample_width: int = PCM_SAMPLE_WIDTH,
+) -> bytes:
+    """Return the body of a "fmt " chunk describing integer PCM."""
+    block_align = channels * sample_width
+    return struct.pack(
+        "<HHIIHH",
+        1,  # WAVE_FORMAT_PCM
+        channels,
+        sample_rate,
+        sample_rate * block_align,
+        block_align,
+        sample_width * 8,
+    )
+
+
+def streaming_wav_header(sample_rate: int) -> bytes:
+    """Return a WAV header for PCM of unknown length that follows it."""
+    fmt_chunk = pcm_fmt_chunk(sample_rate)
+    header = wav_header(fmt_chunk, 0)
+    # Both RIFF and data sizes are unknown until the stream ends.
+    return (
+        header[:4]
+        + struct.pack("<I", WAV_UNKNOWN_SIZE)
+        + header[8:-4]
+        + struct.pack("<I", WAV_UNKNOWN_SIZE)
+    )
+
+
+def resample_audio(fmt: str, data: bytes, sample_rate: int) -> bytes:
+    """Return pcm or wav audio converted to sample_rate.
+
+    Raw pcm is Kokoro's 24 kHz output; a WAV file's own rate is read from its
+    header. Raises ValueError for other formats and for WAV files that are not
+    16-bit mono PCM. CPU-bound: run it in an executor.
+    """
+    if fmt == "pcm":
+        resampler = StreamingResampler(KOKORO_SAMPLE_RATE, sample_rate)
+        return resampler.feed(data) + resampler.flush()
+    if fmt != "wav":
+        raise ValueError(f"Cannot resample {fmt} audio")
+    fmt_chunk, samples = _wav_parts(data)
+    if len(fmt_chunk) < 16:
+        raise ValueError("WAV fmt chunk is too short")
+    tag, channels, rate, _, _, bits = struct.unpack_from("<HHIIHH", fmt_chunk)
+    if (tag, channels, bits) != (1, PCM_CHANNELS, PCM_SAMPLE_WIDTH * 8):
+        raise ValueError("WAV audio is not 16-bit mono PCM")
+    if rate == sample_rate:
+        return data
+    resampler = StreamingResampler(rate, sample_rate)
+    resampled = resampler.feed(samples) + resampler.flush()
+    return wav_header(pcm_fmt_chunk(sample_rate), len(resampled)) + resampled
+
+
+def join_audio(fmt: str, parts: list[bytes]) -> bytes:
+    """Join separately synthesised parts into one file of the given format.
+
+    Raises ValueError for formats listed outside JOINABLE_FORMATS or parts that
+    do not parse.
+    """
+    if len(parts) == 1:
+        return parts[0]
+    if fmt == "pcm":
+        return b"".join(parts)
+    if fmt == "mp3":
+        # MP3 is a sequence of self-contained frames. Each part's tags and
+        # Xing/Info frame describe that part alone, so a player would take the
+        # first part's frame count for the whole file: keep audio frames only.
+        frames = Mp3FrameFilter()
+        data = b"".join(frames.feed(part) for part in parts)
+        frames.flush()
+        if not frames.frames:
+            raise ValueError("MP3 parts contain no audio frames")
+        return data
+    if fmt == "wav":
+        fmt_chunk = b""
+        samples: list[bytes] = []
+        for part in parts:
+            part_fmt, part_samples = _wav_parts(part)
+            if fmt_chunk and part_fmt != fmt_chunk:
+                raise ValueError("WAV parts use different sample formats")
+            fmt_chunk = part_fmt
+            samples.append(part_samples)
+        data = b"".join(samples)
+        return wav_header(fmt_chunk, len(data)) + data
+    if fmt == "opus":
+        remuxer = OggOpusRemuxer()
+        data = b"".join(remuxer.feed(part) for part in parts) + remuxer.flush()
+        if not remuxer.pages:
+            raise ValueError("Opus parts contain no Ogg pages")
+        return data
+    raise ValueError(f"Cannot join {fmt} audio")
@@ -0,0 +1,360 @@
+"""Kokoro server backends with least-outstanding-requests routing."""
+from __future__ import annotations
+
+import asyncio
+from collections.abc import AsyncIterator, Hashable
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+from datetime import timedelta
+import logging
+import time
+from typing import Any
+
+import aiohttp
+
+from .admission import MAX_RETRY_AFTER, AdmissionQueue, BackendBusyError, Priority
+from .client import async_test_connection
+from .const import CONF_API_KEY, DEFAULT_API_KEY, DEFAULT_BACKEND_CONCURRENCY
+
+_LOGGER = logging.getLogger(__name__)
+
+# How often every backend is probed via /v1/models.
+HEALTH_CHECK_INTERVAL = timedelta(seconds=30)
+
+# Weight of the newest sample in the per-backend latency moving average.
+LATENCY_SMOOTHING = 0.2
+
+# Circuit breaker states, shown in the backends entity attribute.
+CIRCUIT_CLOSED = "closed"
+CIRCUIT_OPEN = "open"
+CIRCUIT_HALF_OPEN = "half_open"
+
+# Consecutive 5xx responses, read timeouts or dropped connections that open
+# a circuit. Failing to connect opens it at once: the server is not answering
+# at all, while a slow or cut-off response may only be one long synthesis.
+CIRCUIT_FAILURE_THRESHOLD = 3
+
+# Probe error keys (see client._async_get_models) meaning the server is not
+# answering usefully. Others, such as a rejected API key or a wrong path, come
+# from a server that is up, and would only be hidden behind an open circuit.
+PROBE_UNAVAILABLE_ERRORS = frozenset(("cannot_connect", "ssl_error", "timeout", "server_error"))
+
+# Delay before the first recovery probe of an open circuit, doubled after each
+# failed probe up to the maximum.
+CIRCUIT_RETRY_MIN = 5.0
+CIRCUIT_RETRY_MAX = 60.0
+
+
+class BackendServerError(RuntimeError):
+    """A server answered with a 5xx status other than 503."""
+
+
+class BackendUnavailableError(RuntimeError):
+    """Every server's circuit is open, so the request was not sent."""
+
+
+@dataclass
+class Backend:
+    """One Kokoro FastAPI server and its request counters."""
+
+    base_url: str
+    session: aiohttp.ClientSession
+    circuit: str = CIRCUIT_CLOSED
+    # Consecutive server errors; reset by any successful request.
+    failures: int = 0
+    in_flight: int = 0
+    requests: int = 0
+    errors: int = 0
+    latency: float | None = None
+    # Monotonic time before which the server asked not to be sent requests.
+    retry_at: float = 0.0
+    # Whether the last probe had the API key rejected.
+    auth_failed: bool = False
+
+    @property
+    def healthy(self) -> bool:
+        """Return True if requests may be sent to this server."""
+        return self.circuit == CIRCUIT_CLOSED
+
+    @property
+    def speech_url(self) -> str:
+        """Return the speech endpoint URL."""
+        return f"{self.base_url}/v1/audio/speech"
+
+    def observe_latency(self, seconds: float) -> None:
+        """Fold a time-to-response-headers sample into the moving average."""
+        if self.latency is None:
+            self.latency = seconds
+        else:
+            self.latency += LATENCY_SMOOTHING * (seconds - self.latency)
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the counters shown as entity attributes."""
+        return {
+            "healthy": self.healthy,
+            "circuit": self.circuit,
+            "in_flight": self.in_flight,
+            "requests": self.requests,
+            "errors": self.errors,
+            "latency_ms": None if self.latency is None else round(self.latency * 1000),
+            "paused": self.retry_at > time.monotonic(),
+        }
+
+
+class BackendPool:
+    """Routes each request to the healthy backend with the fewest in flight.
+
+    Every backend runs at most `concurrency` requests at once. Requests beyond
+    that wait in an AdmissionQueue and are admitted as slots free up: streamed
+    sentences first, then announcements, then background rendering, taking
+    turns across streams within each class.
+
+    Each backend has a circuit breaker. Connection failures, timeouts and
+    repeated 5xx responses open it: the backend gets no requests, and while
+    every circuit is open requests fail at once with BackendUnavailableError
+    instead of waiting for a connect timeout. A single background probe per
+    open backend closes the circuit once /v1/models answers again.
+    """
+
+    def __init__(
+        self,
+        backends: list[Backend],
+        concurrency: int = DEFAULT_BACKEND_CONCURRENCY,
+        api_key: str = DEFAULT_API_KEY,
+    ) -> None:
+        """Initialize the pool."""
+        self.backends = backends
+        self._concurrency = max(1, concurrency)
+        self._api_key = api_key
+        self._waiters: AdmissionQueue[Backend] = AdmissionQueue()
+        self._wakeup: asyncio.TimerHandle | None = None
+        # base URL -> background probe of an open circuit
+        self._recoveries: dict[str, asyncio.Task[None]] = {}
+
+    @property
+    def queued(self) -> int:
+        """Return the number of requests waiting for a free slot."""
+        return len(self._waiters)
+
+    def has_free_slot(self) -> bool:
+        """Return True if a request would be sent without waiting."""
+        return not self._waiters and self._pick() is not None
+
+    def _pick(self) -> Backend | None:
+        """Return the least busy healthy backend with a free slot, if any."""
+        now = time.monotonic()
+        free = [
+            backend
+            for backend in self.backends
+            if backend.healthy
+            and backend.in_flight < self._concurrency
+            and backend.retry_at <= now
+        ]
+        if not free:
+            return None
+        return min(
+            free,
+            key=lambda backend: (backend.in_flight, backend.latency or 0.0),
+        )
+
+    def _dispatch(self) -> None:
+        """Hand free slots to queued requests, most urgent first."""
+        if not any(backend.healthy for backend in self.backends):
+            # Nothing will free up until a probe succeeds: fail fast.
+            while (waiter := self._waiters.pop()) is not None:
+                waiter.set_exception(
+                    BackendUnavailableError(
+                        "Kokoro server unavailable - not reachable or failing, "
+                        "retrying in the background"
+                    )
+                )
+
+        while self._waiters and (backend := self._pick()) is not None:
+            if (waiter := self._waiters.pop()) is None:
+                break
+            backend.in_flight += 1
+            backend.requests += 1
+            waiter.set_result(backend)
+
+        if self._wakeup is not None:
+            self._wakeup.cancel()
+            self._wakeup = None
+        if not self._waiters:
+            return
+        # Slots held back only by a Retry-After pause free up without any
+        # request finishing, so look again once the first pause is over.
+        now = time.monotonic()
+        paused = [backend.retry_at for backend in self.backends if backend.retry_at > now]
+        if paused:
+            self._wakeup = asyncio.get_running_loop().call_later(
+                min(paused) - now, self._wake_up
+            )
+
+    def _wake_up(self) -> None:
+        """Admit waiters once a Retry-After pause has passed."""
+        self._wakeup = None
+        self._dispatch()
+
+    def _release(self, backend: Backend) -> None:
+        """Free a backend slot and admit the next waiter."""
+        backend.in_flight -= 1
+        self._dispatch()
+
+    @asynccontextmanager
+    async def async_request(
+        self,
+        priority: Priority = Priority.INTERACTIVE,
+        flow: Hashable | None = None,
+        *,
+        retry: bool = False,
+    ) -> AsyncIterator[Backend]:
+        """Reserve a backend for one request and account for its outcome.
+
+        Requests of the same flow (the sentences of one streamed reply, the
+        segments of one announcement) are admitted in order; without a flow
+        the request is a flow of its own. A retry goes ahead of its flow, as
+        the requests queued behind it were issued after it.
+
+        A failed or timed-out connection attempt opens the backend's circuit,
+        as do CIRCUIT_FAILURE_THRESHOLD consecutive 5xx responses, read
+        timeouts or dropped connections, so the following request goes
+        elsewhere or fails fast. A BackendBusyError
+        (429/503) pauses the backend for its Retry-After, up to
+        MAX_RETRY_AFTER.
+        """
+        waiter: asyncio.Future[Backend] = asyncio.get_running_loop().create_future()
+        flow = waiter if flow is None else flow
+        self._waiters.push(priority, flow, waiter, first=retry)
+        self._dispatch()
+        try:
+            backend = await waiter
+        except asyncio.CancelledError:
+            if waiter.done() and not waiter.cancelled():
+                self._release(waiter.result())
+            else:
+                self._waiters.discard(priority, flow, waiter)
+            raise
+
+        try:
+            yield backend
+        except BackendBusyError as err:
+            backend.errors += 1
+            # Longer pauses are capped so queued requests never hang for long.
+            pause = min(err.retry_after, MAX_RETRY_AFTER)
+            backend.retry_at = max(backend.retry_at, time.monotonic() + pause)
+            _LOGGER.debug(
+                "Kokoro backend %s is busy, pausing it for %.1f s",
+                backend.base_url,
+                pause,
+            )
+            if err.status >= 500:
+                self._count_failure(backend, str(err))
+            raise
+        except (aiohttp.ClientConnectorError, aiohttp.ConnectionTimeoutError) as err:
+            backend.errors += 1
+            self._open_circuit(backend, str(err) or type(err).__name__)
+            raise
+        except (
+            BackendServerError,
+            aiohttp.ClientConnectionError,
+            asyncio.TimeoutError,
+        ) as err:
+            backend.errors += 1
+            self._count_failure(backend, str(err) or type(err).__name__)
+            raise
+        except Exception:
+            backend.errors += 1
+            raise
+        else:
+            backend.failures = 0
+        finally:
+            self._release(backend)
+
+    def _count_failure(self, backend: Backend, reason: str) -> None:
+        """Count a failed request, opening the circuit after too many in a row."""
+        backend.failures += 1
+        if backend.failures >= CIRCUIT_FAILURE_THRESHOLD:
+            self._open_circuit(backend, reason)
+
+    def _open_circuit(self, backend: Backend, reason: str) -> None:
+        """Stop sending requests to a backend until a probe succeeds."""
+        if not backend.healthy:
+            return
+        _LOGGER.warning(
+            "Kokoro backend %s is unavailable (%s), failing fast until it answers",
+            backend.base_url,
+            reason,
+        )
+        backend.circuit = CIRCUIT_OPEN
+        self._recoveries[backend.base_url] = asyncio.get_running_loop().create_task(
+            self._async_recover(backend)
+        )
+        self._dispatch()
+
+    async def _async_recover(self, backend: Backend) -> None:
+        """Probe an open backend until it answers, then close its circuit."""
+        delay = CIRCUIT_RETRY_MIN
+        try:
+            while True:
+                await asyncio.sleep(delay)
+                backend.circuit = CIRCUIT_HALF_OPEN
+                errors = await async_test_connection(
+                    backend.base_url, self._api_key, backend.session
+                )
+                if not _unavailable(errors):
+                    break
+                backend.circuit = CIRCUIT_OPEN
+                delay = min(delay * 2, CIRCUIT_RETRY_MAX)
+        finally:
+            del self._recoveries[backend.base_url]
+        _LOGGER.info("Kokoro backend %s is available again", backend.base_url)
+        backend.circuit = CIRCUIT_CLOSED
+        backend.failures = 0
+        self._dispatch()
+
+    async def async_probe(self) -> bool:
+        """Probe every healthy backend's /v1/models concurrently.
+
+        A probe that cannot connect, times out or gets a 5xx response opens
+        the backend's circuit; open circuits are probed by their own recovery
+        task instead. A rejected API key leaves the circuit alone, so requests
+        fail with the real cause, and is reported by returning True.
+        """
+
+        async def _probe(backend: Backend) -> None:
+            started = time.monotonic()
+            errors = await async_test_connection(
+                backend.base_url, self._api_key, backend.session
+            )
+            auth_failed = errors.get(CONF_API_KEY) == "auth_failed"
+            if auth_failed and not backend.auth_failed:
+                _LOGGER.warning(
+                    "Kokoro backend %s rejected the API key", backend.base_url
+                )
+            backend.auth_failed = auth_failed
+            if _unavailable(errors):
+                self._open_circuit(backend, f"probe failed: {errors}")
+            elif not errors and backend.latency is None:
+                backend.observe_latency(time.monotonic() - started)
+
+        await asyncio.gather(
+            *(_probe(backend) for backend in self.backends if backend.healthy)
+        )
+        return any(backend.auth_failed for backend in self.backends)
+
+    def shutdown(self) -> None:
+        """Cancel background probes and timers when the entry unloads."""
+        for task in list(self._recoveries.values()):
+            task.cancel()
+        if self._wakeup is not None:
+            self._wakeup.cancel()
+            self._wakeup = None
+
+    def as_dict(self) -> dict[str, dict[str, Any]]:
+        """Return per-backend counters keyed by base URL."""
+        return {backend.base_url: backend.as_dict() for backend in self.backends}
+
+
+def _unavailable(errors: dict[str, str]) -> bool:
+    """Return True if probe errors show the server is not answering usefully."""
+    return any(error in PROBE_UNAVAILABLE_ERRORS for error in errors.values())
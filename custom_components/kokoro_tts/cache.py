@@ -0,0 +1,229 @@
+"""Persistent on-disk synthesis cache for Kokoro TTS."""
+from __future__ import annotations
+
+from collections import OrderedDict
+import hashlib
+import json
+import logging
+import os
+from pathlib import Path
+import shutil
+import tempfile
+from typing import Any
+
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.storage import Store
+
+from .const import DOMAIN
+
+_LOGGER = logging.getLogger(__name__)
+
+STORAGE_VERSION = 1
+
+# The index is rewritten at most this often (seconds); Store also flushes any
+# pending write when Home Assistant stops.
+INDEX_SAVE_DELAY = 30
+
+# Payload fields that decide what audio the server returns. "stream" is left
+# out on purpose: streamed and one-shot responses for the same input are the
+# same file, so both paths share entries.
+KEY_FIELDS = (
+    "model",
+    "voice",
+    "speed",
+    "response_format",
+    "lang_code",
+    "volume_multiplier",
+)
+
+
+def _cache_dir(hass: HomeAssistant, entry_id: str) -> Path:
+    """Return the directory holding one entry's cached audio."""
+    return Path(hass.config.path(".cache", DOMAIN, entry_id))
+
+
+def _storage_key(entry_id: str) -> str:
+    """Return the Store key of one entry's cache index."""
+    return f"{DOMAIN}.cache.{entry_id}"
+
+
+def normalize_text(text: str) -> str:
+    """Collapse whitespace so trivially different messages share an entry."""
+    return " ".join(text.split())
+
+
+def payload_key(payload: dict[str, Any]) -> str:
+    """Return the cache key for a /v1/audio/speech payload."""
+    material = {field: payload.get(field) for field in KEY_FIELDS}
+    material["input"] = normalize_text(payload.get("input", ""))
+    encoded = json.dumps(material, sort_keys=True, separators=(",", ":"))
+    return hashlib.sha256(encoded.encode("utf-8")).hexdigest()
+
+
+def _write_atomic(directory: Path, name: str, data: bytes) -> None:
+    """Write a file so readers never observe it half-written."""
+    directory.mkdir(parents=True, exist_ok=True)
+    fd, tmp = tempfile.mkstemp(dir=directory, suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as handle:
+            handle.write(data)
+        os.replace(tmp, directory / name)
+    except BaseException:
+        Path(tmp).unlink(missing_ok=True)
+        raise
+
+
+def _remove_files(directory: Path, names: list[str]) -> None:
+    """Delete evicted cache files, ignoring ones already gone."""
+    for name in names:
+        (directory / name).unlink(missing_ok=True)
+
+
+def _reconcile(directory: Path, known: set[str]) -> set[str]:
+    """Drop files the index does not know about; return the names on disk.
+
+    Runs once at load so a crash between a write and the next index save
+    cannot leak disk space. Lookups never scan the directory.
+    """
+    if not directory.is_dir():
+        return set()
+    present: set[str] = set()
+    for path in directory.iterdir():
+        if not path.is_file():
+            continue
+        if path.name in known:
+            present.add(path.name)
+        else:
+            path.unlink(missing_ok=True)
+    return present
+
+
+class SynthesisCache:
+    """Byte-bounded LRU cache of synthesised audio, persisted across restarts.
+
+    Audio lives in one file per entry; the LRU order and sizes live in a single
+    compact Store index that is loaded once, so a lookup is a dict access plus
+    one file read in the executor.
+    """
+
+    def __init__(self, hass: HomeAssistant, entry_id: str, max_bytes: int) -> None:
+        """Initialize the cache."""
+        self._hass = hass
+        self._directory = _cache_dir(hass, entry_id)
+        self._store: Store[dict[str, Any]] = Store(
+            hass, STORAGE_VERSION, _storage_key(entry_id)
+        )
+        self._max_bytes = max_bytes
+        # key -> size in bytes, least recently used first.
+        self._entries: OrderedDict[str, int] = OrderedDict()
+        self._total_bytes = 0
+        self._writing: set[str] = set()
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    def stats(self) -> dict[str, int]:
+        """Return counters for entity attributes and diagnostics."""
+        return {
+            "cache_hits": self.hits,
+            "cache_misses": self.misses,
+            "cache_entries": len(self._entries),
+            "cache_bytes": self._total_bytes,
+        }
+
+    async def async_load(self) -> None:
+        """Load the index and drop anything it disagrees with on disk."""
+        data = await self._store.async_load() or {}
+        entries = [
+            (key, int(size))
+            for key, size in data.get("entries", [])
+            if isinstance(key, str) and isinstance(size, int)
+        ]
+        present = await self._hass.async_add_executor_job(
+            _reconcile, self._directory, {f"{key}.bin" for key, _ in entries}
+        )
+        for key, size in entries:
+            if f"{key}.bin" in present:
+                self._entries[key] = size
+                self._total_bytes += size
+        await self._async_evict()
+
+    async def async_unload(self) -> None:
+        """Persist the index immediately."""
+        await self._store.async_save(self._data_to_save())
+
+    @callback
+    def _data_to_save(self) -> dict[str, Any]:
+        """Return the compact index: [[key, size], ...] in LRU order."""
+        return {"entries": [[key, size] for key, size in self._entries.items()]}
+
+    async def async_get(self, key: str) -> bytes | None:
+        """Return cached audio for key, or None on a miss."""
+        if key not in self._entries:
+            self.misses += 1
+            return None
+        try:
+            data = await self._hass.async_add_executor_job(
+                (self._directory / f"{key}.bin").read_bytes
+            )
+        except OSError:
+            # Removed behind our back - forget it and treat as a miss.
+            self._total_bytes -= self._entries.pop(key, 0)
+            self.misses += 1
+            return None
+        if key in self._entries:
+            self._entries.move_to_end(key)
+            self._store.async_delay_save(self._data_to_save, INDEX_SAVE_DELAY)
+        self.hits += 1
+        return data
+
+    @callback
+    def async_store(self, key: str, data: bytes) -> None:
+        """Store audio in the background; the caller never waits on disk I/O."""
+        if (
+            not data
+            or len(data) > self._max_bytes
+            or key in self._entries
+            or key in self._writing
+        ):
+            return
+        self._writing.add(key)
+        self._hass.async_create_background_task(
+            self._async_write(key, data), f"{DOMAIN} cache write"
+        )
+
+    async def _async_write(self, key: str, data: bytes) -> None:
+        """Write one entry, then admit it to the index and evict to budget."""
+        try:
+            await self._hass.async_add_executor_job(
+                _write_atomic, self._directory, f"{key}.bin", data
+            )
+        except OSError as err:
+            _LOGGER.warning("Could not write Kokoro TTS cache entry: %s", err)
+            return
+        finally:
+            self._writing.discard(key)
+        self._entries[key] = len(data)
+        self._total_bytes += len(data)
+        await self._async_evict()
+        self._store.async_delay_save(self._data_to_save, INDEX_SAVE_DELAY)
+
+    async def _async_evict(self) -> None:
+        """Remove least recently used entries until within the byte budget."""
+        evicted: list[str] = []
+        while self._entries and self._total_bytes > self._max_bytes:
+            key, size = self._entries.popitem(last=False)
+            self._total_bytes -= size
+            evicted.append(f"{key}.bin")
+        if evicted:
+            await self._hass.async_add_executor_job(
+                _remove_files, self._directory, evicted
+            )
+
+
+async def async_remove_cache(hass: HomeAssistant, entry_id: str) -> None:
+    """Delete an entry's cached audio and index when the entry is removed."""
+    await hass.async_add_executor_job(
+        shutil.rmtree, _cache_dir(hass, entry_id), True
+    )
+    await Store(hass, STORAGE_VERSION, _storage_key(entry_id)).async_remove()
@@ -0,0 +1,247 @@
+"""Shared HTTP connection pools for Kokoro TTS."""
+from __future__ import annotations
+
+import asyncio
+from dataclasses import dataclass
+import logging
+from urllib.parse import urlparse
+
+import aiohttp
+
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.util.ssl import get_default_context
+
+from .const import CONF_API_KEY, CONF_BASE_URL, DOMAIN
+
+_LOGGER = logging.getLogger(__name__)
+
+# Key in hass.data[DOMAIN] holding the pooled sessions.
+DATA_SESSIONS = "sessions"
+
+
+@dataclass(frozen=True)
+class PoolSettings:
+    """Connection pool limits for one shared session."""
+
+    limit: int
+    limit_per_host: int
+    dns_cache_ttl: int
+
+
+@dataclass
+class _SharedSession:
+    """A pooled session and the number of config entries using it."""
+
+    session: aiohttp.ClientSession
+    users: int = 0
+
+
+def _pool_key(base_url: str, settings: PoolSettings) -> tuple:
+    """Return the key under which entries may share a session.
+
+    Entries share a pool when they talk to the same origin with the same pool
+    settings, so changing the limits on one entry never resizes another's.
+    """
+    parsed = urlparse(base_url)
+    port = parsed.port or (443 if parsed.scheme == "https" else 80)
+    return (parsed.scheme, (parsed.hostname or "").lower(), port, settings)
+
+
+@callback
+def async_acquire_session(
+    hass: HomeAssistant, base_url: str, settings: PoolSettings
+) -> aiohttp.ClientSession:
+    """Return a keep-alive session for base_url, creating it on first use.
+
+    The connector keeps idle connections open between utterances, so only the
+    first request to a server pays for DNS, TCP and TLS setup. The SSL context
+    is Home Assistant's shared client context rather than a fresh one per pool.
+    """
+    pools: dict[tuple, _SharedSession] = hass.data.setdefault(DOMAIN, {}).setdefault(
+        DATA_SESSIONS, {}
+    )
+    key = _pool_key(base_url, settings)
+    shared = pools.get(key)
+    if shared is None or shared.session.closed:
+        connector = aiohttp.TCPConnector(
+            limit=settings.limit,
+            limit_per_host=settings.limit_per_host,
+            use_dns_cache=settings.dns_cache_ttl > 0,
+            ttl_dns_cache=settings.dns_cache_ttl or None,
+            ssl=get_default_context(),
+        )
+        shared = _SharedSession(aiohttp.ClientSession(connector=connector))
+        pools[key] = shared
+        _LOGGER.debug("Created connection pool for %s (%s)", base_url, settings)
+    shared.users += 1
+    return shared.session
+
+
+async def async_release_session(
+    hass: HomeAssistant, session: aiohttp.ClientSession
+) -> None:
+    """Drop one reference to a pooled session, closing it when unused."""
+    pools: dict[tuple, _SharedSession] = hass.data.get(DOMAIN, {}).get(
+        DATA_SESSIONS, {}
+    )
+    for key, shared in list(pools.items()):
+        if shared.session is not session:
+            continue
+        shared.users -= 1
+        if shared.users <= 0:
+            del pools[key]
+            await session.close()
+        return
+
+
+def _auth_headers(api_key: str) -> dict[str, str]:
+    """Return the Authorization header for api_key, if one is needed."""
+    headers: dict[str, str] = {}
+    if api_key and api_key not in ("x", "not-needed", ""):
+        headers["Authorization"] = f"Bearer {api_key}"
+    return headers
+
+
+@dataclass
+class ServerProbe:
+    """What one visit to a Kokoro server found."""
+
+    # Config flow error keys; empty when the server answered usefully.
+    errors: dict[str, str]
+    models: list[str]
+    voices: list[str]
+
+
+async def async_test_connection(
+    base_url: str, api_key: str, session: aiohttp.ClientSession | None = None
+) -> dict[str, str]:
+    """Test connection to the Kokoro FastAPI server.
+
+    Returns a dict of errors (empty dict = success). Backend health probes
+    pass their pooled session so the probe reuses a kept-alive connection.
+    """
+    headers = _auth_headers(api_key)
+    timeout = aiohttp.ClientTimeout(total=10, connect=5)
+    if session is None:
+        async with aiohttp.ClientSession() as own_session:
+            errors, _ = await _async_get_models(own_session, base_url, headers, timeout)
+            return errors
+    errors, _ = await _async_get_models(session, base_url, headers, timeout)
+    return errors
+
+
+async def async_probe_server(
+    base_url: str, api_key: str, session: aiohttp.ClientSession | None = None
+) -> ServerProbe:
+    """Test a Kokoro server and read its models and voices in one visit.
+
+    /v1/models and /v1/audio/voices are requested concurrently on one
+    session, so the config flow pays for a single connection setup and the
+    slower of the two requests. Without a session a short-lived one is used.
+    """
+    headers = _auth_headers(api_key)
+    timeout = aiohttp.ClientTimeout(total=10, connect=5)
+    if session is None:
+        async with aiohttp.ClientSession() as own_session:
+            return await _async_probe(own_session, base_url, headers, timeout)
+    return await _async_probe(session, base_url, headers, timeout)
+
+
+async def async_discover(
+    base_url: str, api_key: str, session: aiohttp.ClientSession | None = None
+) -> tuple[list[str], list[str]]:
+    """Return the models and voices a Kokoro server reports.
+
+    Either list is empty when its endpoint could not be read; callers decide
+    on fallbacks. Without a session a short-lived one is used.
+    """
+    probe = await async_probe_server(base_url, api_key, session)
+    return probe.models, probe.voices
+
+
+async def _async_probe(
+    session: aiohttp.ClientSession,
+    base_url: str,
+    headers: dict[str, str],
+    timeout: aiohttp.ClientTimeout,
+) -> ServerProbe:
+    """Request /v1/models and /v1/audio/voices concurrently."""
+    (errors, models), voices = await asyncio.gather(
+        _async_get_models(session, base_url, headers, timeout),
+        _async_get_voices(session, base_url, headers, timeout),
+    )
+    return ServerProbe(errors, models, voices)
+
+
+async def _async_get_models(
+    session: aiohttp.ClientSession,
+    base_url: str,
+    headers: dict[str, str],
+    timeout: aiohttp.ClientTimeout,
+) -> tuple[dict[str, str], list[str]]:
+    """GET /v1/models; return config flow error keys and the model ids."""
+    models: list[str] = []
+    try:
+        async with session.get(
+            f"{base_url}/v1/models", headers=headers, timeout=timeout
+        ) as resp:
+            if resp.status == 401:
+                return {CONF_API_KEY: "auth_failed"}, models
+            if resp.status == 404:
+                return {CONF_BASE_URL: "server_not_found"}, models
+            if resp.status >= 500:
+                return {CONF_BASE_URL: "server_error"}, models
+            # 200 or other - server is reachable
+            if resp.status == 200:
+                try:
+                    data = await resp.json()
+                except (aiohttp.ContentTypeError, ValueError):
+                    _LOGGER.debug("Unreadable model list from %s/v1/models", base_url)
+                    data = None
+                if isinstance(data, dict) and isinstance(data.get("data"), list):
+                    models = [
+                        str(item.get("id"))
+                        for item in data["data"]
+                        if isinstance(item, dict) and item.get("id")
+                    ]
+    except aiohttp.ClientSSLError:
+        return {CONF_BASE_URL: "ssl_error"}, models
+    except aiohttp.ClientConnectorError:
+        return {CONF_BASE_URL: "cannot_connect"}, models
+    except asyncio.TimeoutError:
+        return {CONF_BASE_URL: "timeout"}, models
+    except Exception:
+        return {CONF_BASE_URL: "cannot_connect"}, models
+    return {}, models
+
+
+async def _async_get_voices(
+    session: aiohttp.ClientSession,
+    base_url: str,
+    headers: dict[str, str],
+    timeout: aiohttp.ClientTimeout,
+) -> list[str]:
+    """GET /v1/audio/voices and parse the voice ids."""
+    personas: list[str] = []
+    try:
+        async with session.get(
+            f"{base_url}/v1/audio/voices", headers=headers, timeout=timeout
+        ) as resp:
+            if resp.status == 200:
+                data = await resp.json()
+                if isinstance(data, dict):
+                    voices = data.get("voices", data.get("personas", []))
+                elif isinstance(data, list):
+                    voices = data
+                else:
+                    voices = []
+
+                for voice in voices:
+                    if isinstance(voice, str):
+                        personas.append(voice)
+                    elif isinstance(voice, dict) and voice.get("id"):
+                        personas.append(str(voice["id"]))
+    except Exception:
+        _LOGGER.debug("Failed to discover personas from %s/v1/audio/voices", base_url)
+
+    return personas
@@ -5,36 +5,52 @@ from typing import Any
 import asyncio
 import hashlib
 import logging
+import re
 from urllib.parse import urlparse
 
-import aiohttp
 import voluptuous as vol
 
 from homeassistant import config_entries
-from homeassistant.core import callback
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers import selector
 
 from .const import (
     CONF_API_KEY,
+    CONF_BACKEND_CONCURRENCY,
     CONF_BASE_URL,
+    CONF_BASE_URLS,
+    CONF_CACHE_SIZE,
+    CONF_DNS_CACHE_TTL,
+    CONF_FIRST_CHUNK_CHARS,
     CONF_FORMAT,
+    CONF_HEDGE_REQUESTS,
     CONF_LANGUAGE,
+    CONF_MAX_PAUSE_MS,
+    CONF_MERGE_CHARS,
     CONF_MODEL,
+    CONF_PARALLEL_WORKERS,
     CONF_PERSONA,
+    CONF_POOL_LIMIT,
+    CONF_POOL_LIMIT_PER_HOST,
     CONF_SAMPLE_RATE,
     CONF_SEX,
     CONF_SPEED,
+    CONF_STREAM_LOOKAHEAD,
+    CONF_WARM_PHRASES,
     DEFAULTS,
     DOMAIN,
     LANGUAGE_OPTIONS,
     PERSONA_MAPPINGS,
     SEX_OPTIONS,
 )
+from .client import async_probe_server, async_test_connection
+from .discovery import async_get_discovery_cache
+from .voices import VoiceCatalog
 
 _LOGGER = logging.getLogger(__name__)
 
 _FORMAT_OPTIONS = ["mp3", "wav", "opus", "flac", "pcm"]
-_SAMPLE_RATE_OPTIONS = ["22050", "24000", "44100"]
+_SAMPLE_RATE_OPTIONS = ["16000", "22050", "24000", "44100", "48000"]
 
 # Transient, wizard-only field - never stored in the config entry. Lets the
 # persona step send the user back to the filter step.
@@ -45,77 +61,11 @@ CONF_CHANGE_FILTERS = "change_filters"
 # Persona helpers
 # ---------------------------------------------------------------------------
 
-def get_persona_display_name(
-    technical_name: str,
-    selected_language: str | None = None,
-    selected_sex: str | None = None,
-) -> str:
-    """Convert technical persona name to user-friendly display name."""
-    if technical_name not in PERSONA_MAPPINGS:
-        return technical_name
-
-    language, sex, name = PERSONA_MAPPINGS[technical_name]
-
-    if (
-        selected_language
-        and selected_language != "All Languages"
-        and selected_sex
-        and selected_sex != "All"
-    ):
-        return name
-    if selected_language and selected_language != "All Languages":
-        return f"{name} ({sex})"
-    if selected_sex and selected_sex != "All":
-        return f"{name} ({language})"
-    return f"{name} ({language}, {sex})"
-
-
-def get_technical_persona_name(display_name: str) -> str:
-    """Convert display name back to technical persona name."""
-    # Exact name match first (most common when both filters active)
-    for tech_name, (_, _, name) in PERSONA_MAPPINGS.items():
-        if display_name == name:
-            return tech_name
-    # Then try formatted variants
-    for tech_name, (language, sex, name) in PERSONA_MAPPINGS.items():
-        if display_name in (
-            f"{name} ({sex})",
-            f"{name} ({language})",
-            f"{name} ({language}, {sex})",
-        ):
-            return tech_name
-    return display_name
-
-
-def filter_personas_by_language_and_sex(
-    personas: list[str], selected_language: str, selected_sex: str
-) -> list[str]:
-    """Filter persona list by selected language and sex."""
-    filtered: list[str] = []
-    lang_all = selected_language in ("All Languages", "", None)
-    sex_all = selected_sex in ("All", "", None)
-
-    for persona in personas:
-        if persona in PERSONA_MAPPINGS:
-            language, sex, _ = PERSONA_MAPPINGS[persona]
-            if (lang_all or language == selected_language) and (
-                sex_all or sex == selected_sex
-            ):
-                filtered.append(persona)
-        elif lang_all and sex_all:
-            # Include unmapped personas only when no filters active
-            filtered.append(persona)
-    return filtered
-
-
-def get_persona_options_for_language_and_sex(
-    personas: list[str], selected_language: str, selected_sex: str
+def _persona_options(
+    catalog: VoiceCatalog, selected_language: str, selected_sex: str
 ) -> list[str]:
     """Get user-friendly persona options for specific language and sex."""
-    filtered = filter_personas_by_language_and_sex(personas, selected_language, selected_sex)
-    options = sorted(
-        get_persona_display_name(p, selected_language, selected_sex) for p in filtered
-    )
+    options = catalog.options(selected_language, selected_sex)
     if not options:
         if selected_language != "All Languages" and selected_sex != "All":
             options = [f"No {selected_sex.lower()} personas available for {selected_language}"]
@@ -130,97 +80,35 @@ def get_persona_options_for_language_and_sex(
 # API discovery
 # ---------------------------------------------------------------------------
 
-async def _discover_models_and_personas(
-    base_url: str, api_key: str
-) -> tuple[list[str], list[str]]:
-    """Discover models and personas from Kokoro API endpoints."""
-    headers: dict[str, str] = {}
-    if api_key and api_key not in ("x", "not-needed", ""):
-        headers["Authorization"] = f"Bearer {api_key}"
-
-    models: list[str] = []
-    personas: list[str] = []
-    timeout = aiohttp.ClientTimeout(total=8)
-
-    try:
-        async with aiohttp.ClientSession(timeout=timeout) as session:
-            # Discover models from /v1/models
-            try:
-                async with session.get(f"{base_url}/v1/models", headers=headers) as resp:
-                    if resp.status == 200:
-                        data = await resp.json()
-                        if isinstance(data, dict) and isinstance(data.get("data"), list):
-                            models = [
-                                str(item.get("id"))
-                                for item in data["data"]
-                                if isinstance(item, dict) and item.get("id")
-                            ]
-            except Exception:
-                _LOGGER.debug("Failed to discover models from %s/v1/models", base_url)
-
-            # Discover personas from /v1/audio/voices
-            try:
-                async with session.get(
-                    f"{base_url}/v1/audio/voices", headers=headers
-                ) as resp:
-                    if resp.status == 200:
-                        data = await resp.json()
-                        if isinstance(data, dict):
-                            voices = data.get("voices", data.get("personas", []))
-                        elif isinstance(data, list):
-                            voices = data
-                        else:
-                            voices = []
-
-                        for voice in voices:
-                            if isinstance(voice, str):
-                                personas.append(voice)
-                            elif isinstance(voice, dict) and voice.get("id"):
-                                personas.append(str(voice["id"]))
-            except Exception:
-                _LOGGER.debug("Failed to discover personas from %s/v1/audio/voices", base_url)
-    except Exception:
-        _LOGGER.debug("Error in discovery session for %s", base_url)
-
+def _with_fallbacks(models: list[str], personas: list[str]) -> VoiceCatalog:
+    """Index what the server reported, with static choices for what it did not."""
     # Fallback to static mappings if API discovery failed
-    if not personas:
-        personas = list(PERSONA_MAPPINGS.keys())
-    if not models:
-        models = ["kokoro"]
+    return VoiceCatalog(personas or PERSONA_MAPPINGS, models or ["kokoro"])
 
-    return models, personas
 
+async def _async_discover_catalog(
+    hass: HomeAssistant, base_url: str, api_key: str
+) -> VoiceCatalog:
+    """Discover models and personas, from the discovery cache when known."""
+    models, personas = await async_get_discovery_cache(hass).async_get(
+        base_url, api_key
+    )
+    return _with_fallbacks(models, personas)
 
-async def _test_connection(base_url: str, api_key: str) -> dict[str, str]:
-    """Test connection to the Kokoro FastAPI server.
 
-    Returns a dict of errors (empty dict = success).
-    """
-    headers: dict[str, str] = {}
-    if api_key and api_key not in ("x", "not-needed", ""):
-        headers["Authorization"] = f"Bearer {api_key}"
+def _parse_base_urls(raw: str | None) -> list[str]:
+    """Split the Base URL field into one or more server URLs."""
+    return [url.rstrip("/") for url in re.split(r"[\s,]+", raw or "") if url]
 
-    timeout = aiohttp.ClientTimeout(total=10, connect=5)
+
+def _url_is_valid(url: str) -> bool:
+    """Return True for an http(s) URL with a hostname."""
+    if not url.startswith(("http://", "https://")):
+        return False
     try:
-        async with aiohttp.ClientSession(timeout=timeout) as session:
-            try:
-                async with session.get(f"{base_url}/v1/models", headers=headers) as resp:
-                    if resp.status == 401:
-                        return {CONF_API_KEY: "auth_failed"}
-                    if resp.status == 404:
-                        return {CONF_BASE_URL: "server_not_found"}
-                    if resp.status >= 500:
-                        return {CONF_BASE_URL: "server_error"}
-                    # 200 or other - server is reachable
-            except aiohttp.ClientSSLError:
-                return {CONF_BASE_URL: "ssl_error"}
-            except aiohttp.ClientConnectorError:
-                return {CONF_BASE_URL: "cannot_connect"}
-            except asyncio.TimeoutError:
-                return {CONF_BASE_URL: "timeout"}
+        return bool(urlparse(url).hostname)
     except Exception:
-        return {CONF_BASE_URL: "cannot_connect"}
-    return {}
+        return False
 
 
 # ---------------------------------------------------------------------------
@@ -293,7 +181,7 @@ def _filters_schema(models: list[str], user_input: dict | None = None) -> vol.Sc
 
 
 def _persona_schema(
-    personas: list[str],
+    catalog: VoiceCatalog | None,
     selected_language: str,
     selected_sex: str,
     user_input: dict | None = None,
@@ -312,15 +200,13 @@ def _persona_schema(
     # or sex without restarting the whole flow.
     schema[vol.Optional(CONF_CHANGE_FILTERS, default=False)] = bool
 
-    if personas:
-        persona_options = get_persona_options_for_language_and_sex(
-            personas, selected_language, selected_sex
-        )
+    if catalog:
+        persona_options = _persona_options(catalog, selected_language, selected_sex)
         current_persona = ui.get(CONF_PERSONA, DEFAULTS[CONF_PERSONA])
         if current_persona is None:
             current_persona_display = ""
         else:
-            current_persona_display = get_persona_display_name(
+            current_persona_display = catalog.display_name(
                 current_persona, selected_language, selected_sex
             )
         # Ensure current persona is in the list (only reached here when it
@@ -362,6 +248,111 @@ def _persona_schema(
     return vol.Schema(schema)
 
 
+def _performance_schema(user_input: dict | None = None) -> vol.Schema:
+    """Schema for the connection/performance tuning step (options only)."""
+    ui = user_input or {}
+    schema: dict[vol.Optional | vol.Required, Any] = {}
+
+    # Connection pool shared by every request this entry makes
+    schema[
+        vol.Optional(CONF_POOL_LIMIT, default=ui.get(CONF_POOL_LIMIT, DEFAULTS[CONF_POOL_LIMIT]))
+    ] = selector.selector({"number": {"min": 1, "max": 100, "step": 1, "mode": "box"}})
+
+    schema[
+        vol.Optional(
+            CONF_POOL_LIMIT_PER_HOST,
+            default=ui.get(CONF_POOL_LIMIT_PER_HOST, DEFAULTS[CONF_POOL_LIMIT_PER_HOST]),
+        )
+    ] = selector.selector({"number": {"min": 1, "max": 100, "step": 1, "mode": "box"}})
+
+    schema[
+        vol.Optional(
+            CONF_DNS_CACHE_TTL, default=ui.get(CONF_DNS_CACHE_TTL, DEFAULTS[CONF_DNS_CACHE_TTL])
+        )
+    ] = selector.selector(
+        {"number": {"min": 0, "max": 3600, "step": 1, "mode": "box", "unit_of_measurement": "s"}}
+    )
+
+    # Streamed replies: sentences synthesised ahead of the one being played
+    schema[
+        vol.Optional(
+            CONF_STREAM_LOOKAHEAD,
+            default=ui.get(CONF_STREAM_LOOKAHEAD, DEFAULTS[CONF_STREAM_LOOKAHEAD]),
+        )
+    ] = selector.selector({"number": {"min": 0, "max": 8, "step": 1, "mode": "box"}})
+
+    # Streamed replies: size of the first and of the following text chunks
+    schema[
+        vol.Optional(
+            CONF_FIRST_CHUNK_CHARS,
+            default=ui.get(CONF_FIRST_CHUNK_CHARS, DEFAULTS[CONF_FIRST_CHUNK_CHARS]),
+        )
+    ] = selector.selector({"number": {"min": 0, "max": 200, "step": 1, "mode": "box"}})
+
+    schema[
+        vol.Optional(CONF_MERGE_CHARS, default=ui.get(CONF_MERGE_CHARS, DEFAULTS[CONF_MERGE_CHARS]))
+    ] = selector.selector({"number": {"min": 0, "max": 500, "step": 1, "mode": "box"}})
+
+    # Streamed wav/pcm replies: longest pause kept between sentences
+    schema[
+        vol.Optional(
+            CONF_MAX_PAUSE_MS, default=ui.get(CONF_MAX_PAUSE_MS, DEFAULTS[CONF_MAX_PAUSE_MS])
+        )
+    ] = selector.selector(
+        {"number": {"min": 0, "max": 2000, "step": 10, "mode": "box", "unit_of_measurement": "ms"}}
+    )
+
+    # Long one-shot messages: concurrent segment requests
+    schema[
+        vol.Optional(
+            CONF_PARALLEL_WORKERS,
+            default=ui.get(CONF_PARALLEL_WORKERS, DEFAULTS[CONF_PARALLEL_WORKERS]),
+        )
+    ] = selector.selector({"number": {"min": 1, "max": 16, "step": 1, "mode": "box"}})
+
+    # Requests each server runs at once; the rest wait in priority order
+    schema[
+        vol.Optional(
+            CONF_BACKEND_CONCURRENCY,
+            default=ui.get(CONF_BACKEND_CONCURRENCY, DEFAULTS[CONF_BACKEND_CONCURRENCY]),
+        )
+    ] = selector.selector({"number": {"min": 1, "max": 32, "step": 1, "mode": "box"}})
+
+    # Duplicate requests that are slower than usual
+    schema[
+        vol.Optional(
+            CONF_HEDGE_REQUESTS,
+            default=ui.get(CONF_HEDGE_REQUESTS, DEFAULTS[CONF_HEDGE_REQUESTS]),
+        )
+    ] = selector.selector({"boolean": {}})
+
+    # On-disk synthesis cache budget
+    schema[
+        vol.Optional(CONF_CACHE_SIZE, default=ui.get(CONF_CACHE_SIZE, DEFAULTS[CONF_CACHE_SIZE]))
+    ] = selector.selector(
+        {"number": {"min": 0, "max": 10000, "step": 1, "mode": "box", "unit_of_measurement": "MB"}}
+    )
+
+    # Phrases pre-rendered in the background whenever the entry loads
+    schema[
+        vol.Optional(
+            CONF_WARM_PHRASES, default=ui.get(CONF_WARM_PHRASES, DEFAULTS[CONF_WARM_PHRASES])
+        )
+    ] = selector.selector({"text": {"multiple": True}})
+
+    return vol.Schema(schema)
+
+
+def _coerce_int_fields(user_input: dict, keys: tuple[str, ...]) -> None:
+    """Number selectors return floats; store whole-number settings as int."""
+    for key in keys:
+        if key in user_input:
+            try:
+                user_input[key] = int(user_input[key])
+            except (TypeError, ValueError):
+                pass
+
+
 # ---------------------------------------------------------------------------
 # Config Flow
 # ---------------------------------------------------------------------------
@@ -374,7 +365,7 @@ class KokoroConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
     def __init__(self) -> None:
         """Initialize the config flow."""
         self._base_info: dict[str, Any] = {}
-        self._discovered: dict[str, list[str]] = {}
+        self._catalog: VoiceCatalog | None = None
         self._filters: dict[str, Any] = {}
         self._persona_prefill: dict[str, Any] = {}
 
@@ -389,30 +380,31 @@ class KokoroConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
         errors: dict[str, str] = {}
 
         if user_input is not None:
-            base = (user_input.get(CONF_BASE_URL) or "").strip().rstrip("/")
+            # One or more servers; requests are spread across all of them.
+            urls = _parse_base_urls(user_input.get(CONF_BASE_URL))
 
-            # Validate URL
-            if not base:
+            # Validate URLs
+            if not urls:
                 errors[CONF_BASE_URL] = "base_url_required"
-            elif not base.startswith(("http://", "https://")):
+            elif not all(_url_is_valid(url) for url in urls):
                 errors[CONF_BASE_URL] = "invalid_base_url"
-            else:
-                try:
-                    p = urlparse(base)
-                    if not p.hostname:
-                        errors[CONF_BASE_URL] = "invalid_base_url"
-                except Exception:
-                    errors[CONF_BASE_URL] = "invalid_base_url"
 
             if not errors:
-                # Test connection to the server
+                # Test every server; the same visit reads its models and voices.
                 api_key = user_input.get(CONF_API_KEY, DEFAULTS[CONF_API_KEY])
-                conn_errors = await _test_connection(base, api_key)
-                if conn_errors:
-                    errors.update(conn_errors)
-                else:
+                probes = await asyncio.gather(
+                    *(async_probe_server(url, api_key) for url in urls)
+                )
+                for probe in probes:
+                    errors.update(probe.errors)
+                if not errors:
+                    discovery = async_get_discovery_cache(self.hass)
+                    for url, probe in zip(urls, probes):
+                        await discovery.async_put(url, probe.models, probe.voices)
+                    self._catalog = _with_fallbacks(probes[0].models, probes[0].voices)
                     self._base_info = {
-                        CONF_BASE_URL: base,
+                        CONF_BASE_URL: urls[0],
+                        CONF_BASE_URLS: urls,
                         CONF_API_KEY: api_key,
                     }
                     return await self.async_step_filters()
@@ -427,11 +419,9 @@ class KokoroConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
         api_key = self._base_info.get(CONF_API_KEY, DEFAULTS[CONF_API_KEY])
 
         # Discover models and personas if not cached
-        if "models" not in self._discovered:
-            models, personas = await _discover_models_and_personas(base_url, api_key)
-            self._discovered = {"models": models, "personas": personas}
-        else:
-            models = self._discovered["models"]
+        if self._catalog is None:
+            self._catalog = await _async_discover_catalog(self.hass, base_url, api_key)
+        models = list(self._catalog.models)
 
         if user_input is not None:
             self._filters = {
@@ -449,7 +439,7 @@ class KokoroConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
 
     async def async_step_persona(self, user_input: dict | None = None):
         """Handle persona and audio settings, filtered by the previous step."""
-        personas = self._discovered.get("personas", [])
+        catalog = self._catalog
         selected_language = self._filters.get(CONF_LANGUAGE, DEFAULTS[CONF_LANGUAGE])
         selected_sex = self._filters.get(CONF_SEX, DEFAULTS[CONF_SEX])
 
@@ -476,13 +466,14 @@ class KokoroConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
                 return self.async_show_form(
                     step_id="persona",
                     data_schema=_persona_schema(
-                        personas, selected_language, selected_sex, user_input
+                        catalog, selected_language, selected_sex, user_input
                     ),
                     errors={CONF_PERSONA: "persona_required"},
                 )
 
             # Convert persona display name back to technical name
-            user_input[CONF_PERSONA] = get_technical_persona_name(user_input[CONF_PERSONA])
+            if catalog is not None:
+                user_input[CONF_PERSONA] = catalog.technical_name(user_input[CONF_PERSONA])
 
             # Merge base info, filters and persona/audio settings
             data = {**self._base_info, **self._filters, **user_input}
@@ -494,13 +485,16 @@ class KokoroConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
             self._abort_if_unique_id_configured()
 
             hostname = urlparse(base_url).hostname or base_url
+            extra = len(self._base_info.get(CONF_BASE_URLS, [])) - 1
+            if extra > 0:
+                hostname = f"{hostname} +{extra}"
             title = f"Kokoro TTS ({hostname})"
             return self.async_create_entry(title=title, data=data)
 
         return self.async_show_form(
             step_id="persona",
             data_schema=_persona_schema(
-                personas, selected_language, selected_sex, self._persona_prefill
+                catalog, selected_language, selected_sex, self._persona_prefill
             ),
         )
 
@@ -520,7 +514,7 @@ class KokoroConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
         if user_input is not None:
             api_key = user_input.get(CONF_API_KEY, DEFAULTS[CONF_API_KEY])
             base_url = self._base_info[CONF_BASE_URL]
-            conn_errors = await _test_connection(base_url, api_key)
+            conn_errors = await async_test_connection(base_url, api_key)
             if conn_errors:
                 errors.update(conn_errors)
             else:
@@ -577,25 +571,30 @@ class KokoroOptionsFlow(config_entries.OptionsFlowWithReload):
         """Initialize options flow."""
         self._entry = config_entry
         self._filters: dict[str, Any] = {}
-        self._discovered: dict[str, list[str]] = {}
+        self._catalog: VoiceCatalog | None = None
         self._persona_prefill: dict[str, Any] = {}
+        self._persona_data: dict[str, Any] = {}
 
-    async def _async_discover(self) -> tuple[list[str], list[str]]:
-        """Discover models/personas once per flow session, cached."""
-        if "models" not in self._discovered:
+    async def _async_discover(self) -> VoiceCatalog:
+        """Discover models/personas once per flow session.
+
+        Served from the discovery cache when the server has been seen before,
+        so the dialog opens without waiting on it.
+        """
+        if self._catalog is None:
             base_url = self._entry.data[CONF_BASE_URL]
             api_key = self._entry.data.get(CONF_API_KEY, DEFAULTS[CONF_API_KEY])
-            models, personas = [], []
             try:
-                models, personas = await _discover_models_and_personas(base_url, api_key)
+                self._catalog = await _async_discover_catalog(
+                    self.hass, base_url, api_key
+                )
             except Exception:
-                pass
-            self._discovered = {"models": models, "personas": personas}
-        return self._discovered["models"], self._discovered["personas"]
+                self._catalog = _with_fallbacks([], [])
+        return self._catalog
 
     async def async_step_init(self, user_input: dict | None = None):
         """Handle the model/accent/sex filter step."""
-        models, _personas = await self._async_discover()
+        models = list((await self._async_discover()).models)
 
         if user_input is not None:
             self._filters = {
@@ -623,7 +622,7 @@ class KokoroOptionsFlow(config_entries.OptionsFlowWithReload):
 
     async def async_step_persona(self, user_input: dict | None = None):
         """Handle persona and audio settings, filtered by the previous step."""
-        _models, personas = await self._async_discover()
+        catalog = await self._async_discover()
         selected_language = self._filters.get(CONF_LANGUAGE, DEFAULTS[CONF_LANGUAGE])
         selected_sex = self._filters.get(CONF_SEX, DEFAULTS[CONF_SEX])
 
@@ -650,15 +649,16 @@ class KokoroOptionsFlow(config_entries.OptionsFlowWithReload):
                 return self.async_show_form(
                     step_id="persona",
                     data_schema=_persona_schema(
-                        personas, selected_language, selected_sex, user_input
+                        catalog, selected_language, selected_sex, user_input
                     ),
                     errors={CONF_PERSONA: "persona_required"},
                 )
 
             # Convert persona display name back to technical name
-            user_input[CONF_PERSONA] = get_technical_persona_name(user_input[CONF_PERSONA])
+            user_input[CONF_PERSONA] = catalog.technical_name(user_input[CONF_PERSONA])
 
-            return self.async_create_entry(title="", data={**self._filters, **user_input})
+            self._persona_data = user_input
+            return await self.async_step_performance()
 
         # Pre-fill audio settings from the stored entry. Only pre-fill the
         # persona itself if it still matches the filters just chosen -
@@ -670,8 +670,9 @@ class KokoroOptionsFlow(config_entries.OptionsFlowWithReload):
             CONF_SAMPLE_RATE: data.get(CONF_SAMPLE_RATE, DEFAULTS[CONF_SAMPLE_RATE]),
         }
         stored_persona = data.get(CONF_PERSONA)
-        if stored_persona and stored_persona in PERSONA_MAPPINGS:
-            persona_language, persona_sex, _name = PERSONA_MAPPINGS[stored_persona]
+        described = catalog.describe(stored_persona) if stored_persona else None
+        if described is not None:
+            persona_language, persona_sex, _name = described
             matches_filters = selected_language in ("All Languages", persona_language) and (
                 selected_sex in ("All", persona_sex)
             )
@@ -687,5 +688,32 @@ class KokoroOptionsFlow(config_entries.OptionsFlowWithReload):
 
         return self.async_show_form(
             step_id="persona",
-            data_schema=_persona_schema(personas, selected_language, selected_sex, prefill),
+            data_schema=_persona_schema(catalog, selected_language, selected_sex, prefill),
+        )
+
+    async def async_step_performance(self, user_input: dict | None = None):
+        """Handle connection pool tuning, then save all options."""
+        if user_input is not None:
+            _coerce_int_fields(
+                user_input,
+                (
+                    CONF_POOL_LIMIT,
+                    CONF_POOL_LIMIT_PER_HOST,
+                    CONF_DNS_CACHE_TTL,
+                    CONF_STREAM_LOOKAHEAD,
+                    CONF_FIRST_CHUNK_CHARS,
+                    CONF_MERGE_CHARS,
+                    CONF_MAX_PAUSE_MS,
+                    CONF_PARALLEL_WORKERS,
+                    CONF_BACKEND_CONCURRENCY,
+                    CONF_CACHE_SIZE,
+                ),
+            )
+            return self.async_create_entry(
+                title="", data={**self._filters, **self._persona_data, **user_input}
+            )
+
+        data = {**self._entry.data, **(self._entry.options or {})}
+        return self.async_show_form(
+            step_id="performance", data_schema=_performance_schema(data)
         )
@@ -6,6 +6,7 @@ from typing import Any
 DOMAIN = "kokoro_tts"
 
 CONF_BASE_URL = "base_url"
+CONF_BASE_URLS = "base_urls"
 CONF_API_KEY = "api_key"
 CONF_MODEL = "model"
 CONF_PERSONA = "persona"
@@ -16,6 +17,20 @@ CONF_FORMAT = "format"
 CONF_SAMPLE_RATE = "sample_rate"
 CONF_VOLUME_MULTIPLIER = "volume_multiplier"
 
+# Connection pool tuning (options flow "Performance" step)
+CONF_POOL_LIMIT = "pool_limit"
+CONF_POOL_LIMIT_PER_HOST = "pool_limit_per_host"
+CONF_DNS_CACHE_TTL = "dns_cache_ttl"
+CONF_STREAM_LOOKAHEAD = "stream_lookahead"
+CONF_FIRST_CHUNK_CHARS = "first_chunk_chars"
+CONF_MERGE_CHARS = "merge_chars"
+CONF_MAX_PAUSE_MS = "max_pause_ms"
+CONF_PARALLEL_WORKERS = "parallel_workers"
+CONF_BACKEND_CONCURRENCY = "backend_concurrency"
+CONF_HEDGE_REQUESTS = "hedge_requests"
+CONF_CACHE_SIZE = "cache_size"
+CONF_WARM_PHRASES = "warm_phrases"
+
 # Default values
 DEFAULT_API_KEY = "not-needed"
 DEFAULT_MODEL = "kokoro"
@@ -25,7 +40,21 @@ DEFAULT_SEX = "All"
 DEFAULT_SPEED = 1.0
 DEFAULT_FORMAT = "mp3"
 DEFAULT_SAMPLE_RATE = 24000
+# Range of the per-call sample_rate option, in Hz.
+MIN_SAMPLE_RATE = 8000
+MAX_SAMPLE_RATE = 48000
 DEFAULT_VOLUME_MULTIPLIER = 1.0
+DEFAULT_POOL_LIMIT = 10
+DEFAULT_POOL_LIMIT_PER_HOST = 4
+DEFAULT_DNS_CACHE_TTL = 300
+DEFAULT_STREAM_LOOKAHEAD = 2
+DEFAULT_FIRST_CHUNK_CHARS = 20  # 0 = never cut the first sentence at a clause
+DEFAULT_MERGE_CHARS = 60  # 0 = never merge short follow-up sentences
+DEFAULT_MAX_PAUSE_MS = 0  # 0 = keep the silence Kokoro puts around sentences
+DEFAULT_PARALLEL_WORKERS = 2  # 1 = long messages are a single request
+DEFAULT_BACKEND_CONCURRENCY = 3  # requests per server; the rest are queued
+DEFAULT_HEDGE_REQUESTS = False
+DEFAULT_CACHE_SIZE = 100  # MB; 0 disables the on-disk synthesis cache
 
 # Streaming synthesises one sentence per request and concatenates the audio,
 # so the format must survive concatenation. Container formats that carry a
@@ -33,6 +62,14 @@ DEFAULT_VOLUME_MULTIPLIER = 1.0
 STREAM_SAFE_FORMATS: tuple[str, ...] = ("mp3", "opus", "pcm")
 DEFAULT_STREAM_FORMAT = "mp3"
 
+# Streamed locally into a single container around raw PCM requested from the
+# server, so these keep the user's format choice instead of falling back.
+PCM_STREAM_FORMATS: tuple[str, ...] = ("wav",)
+
+# Formats converted locally to the configured sample rate; Kokoro itself
+# always produces 24 kHz. Compressed formats keep the server's rate.
+RESAMPLED_FORMATS: tuple[str, ...] = ("wav", "pcm")
+
 # Voice mapping: technical_name -> (language, gender, display_name)
 PERSONA_MAPPINGS = {
     # American English (🇺🇸)
@@ -175,4 +212,16 @@ DEFAULTS: dict[str, Any] = {
     CONF_FORMAT: DEFAULT_FORMAT,
     CONF_SAMPLE_RATE: DEFAULT_SAMPLE_RATE,
     CONF_VOLUME_MULTIPLIER: DEFAULT_VOLUME_MULTIPLIER,
+    CONF_POOL_LIMIT: DEFAULT_POOL_LIMIT,
+    CONF_POOL_LIMIT_PER_HOST: DEFAULT_POOL_LIMIT_PER_HOST,
+    CONF_DNS_CACHE_TTL: DEFAULT_DNS_CACHE_TTL,
+    CONF_STREAM_LOOKAHEAD: DEFAULT_STREAM_LOOKAHEAD,
+    CONF_FIRST_CHUNK_CHARS: DEFAULT_FIRST_CHUNK_CHARS,
+    CONF_MERGE_CHARS: DEFAULT_MERGE_CHARS,
+    CONF_MAX_PAUSE_MS: DEFAULT_MAX_PAUSE_MS,
+    CONF_PARALLEL_WORKERS: DEFAULT_PARALLEL_WORKERS,
+    CONF_BACKEND_CONCURRENCY: DEFAULT_BACKEND_CONCURRENCY,
+    CONF_HEDGE_REQUESTS: DEFAULT_HEDGE_REQUESTS,
+    CONF_CACHE_SIZE: DEFAULT_CACHE_SIZE,
+    CONF_WARM_PHRASES: [],
 }
\ No newline at end of file
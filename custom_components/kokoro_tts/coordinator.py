@@ -0,0 +1,73 @@
+"""Periodic refresh of the models and voices Kokoro servers offer."""
+from __future__ import annotations
+
+import asyncio
+from datetime import timedelta
+import logging
+
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
+
+from .backends import BackendPool
+from .client import async_discover
+from .const import DOMAIN
+from .discovery import async_get_discovery_cache
+from .voices import VoiceCatalog
+
+_LOGGER = logging.getLogger(__name__)
+
+# Voices installed on a server after setup are picked up within this time.
+CATALOG_REFRESH_INTERVAL = timedelta(minutes=30)
+
+
+class KokoroCatalogCoordinator(DataUpdateCoordinator[VoiceCatalog]):
+    """Keep the voice catalogue of an entry's servers in memory.
+
+    The TTS entity checks every request's persona and model against it, so a
+    misspelt voice is rejected without contacting a server. Each refresh also
+    updates the discovery cache, so newly installed voices appear in the
+    options dialog without reconfiguring the entry.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        entry: ConfigEntry,
+        backends: BackendPool,
+        api_key: str,
+    ) -> None:
+        """Initialize the coordinator."""
+        super().__init__(
+            hass,
+            _LOGGER,
+            config_entry=entry,
+            name=f"{DOMAIN} voice catalogue",
+            update_interval=CATALOG_REFRESH_INTERVAL,
+        )
+        self._backends = backends
+        self._api_key = api_key
+
+    async def _async_update_data(self) -> VoiceCatalog:
+        """Ask every server for its models and voices.
+
+        Servers of one entry are expected to offer the same voices; the union
+        is kept so a server that is down for the refresh hides nothing.
+        """
+        backends = self._backends.backends
+        results = await asyncio.gather(
+            *(
+                async_discover(backend.base_url, self._api_key, backend.session)
+                for backend in backends
+            )
+        )
+        discovery = async_get_discovery_cache(self.hass)
+        models: list[str] = []
+        voices: list[str] = []
+        for backend, (found_models, found_voices) in zip(backends, results):
+            models.extend(found_models)
+            voices.extend(found_voices)
+            await discovery.async_put(backend.base_url, found_models, found_voices)
+        if not voices:
+            raise UpdateFailed("No Kokoro server reported its voices")
+        return VoiceCatalog(voices, models)
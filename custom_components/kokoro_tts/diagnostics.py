@@ -0,0 +1,43 @@
+"""Diagnostics support for Kokoro TTS."""
+from __future__ import annotations
+
+from typing import Any
+
+from homeassistant.components.diagnostics import async_redact_data
+from homeassistant.core import HomeAssistant
+
+from . import KokoroConfigEntry
+from .const import CONF_API_KEY
+from .discovery import async_get_discovery_cache
+
+TO_REDACT = {CONF_API_KEY}
+
+
+async def async_get_config_entry_diagnostics(
+    hass: HomeAssistant, entry: KokoroConfigEntry
+) -> dict[str, Any]:
+    """Return diagnostics for a config entry.
+
+    Everything comes from state already held: the discovery cache and the
+    catalogue coordinator stand in for asking the servers, so downloading
+    diagnostics neither waits on nor loads a struggling server.
+    """
+    merged = {**entry.data, **(entry.options or {})}
+    data = entry.runtime_data
+    discovery = async_get_discovery_cache(hass)
+
+    return {
+        "config": async_redact_data(merged, TO_REDACT),
+        "discovered": {
+            backend.base_url: await discovery.async_peek(backend.base_url)
+            for backend in data.backends.backends
+        },
+        "catalogue": {
+            "last_update_success": data.catalog.last_update_success,
+            "models": sorted(data.catalog.data.models) if data.catalog.data else None,
+            "voices": sorted(data.catalog.data.voices) if data.catalog.data else None,
+        },
+        "backends": data.backends.as_dict(),
+        "cache": data.cache.stats if data.cache is not None else None,
+        **data.metrics.as_diagnostics(),
+    }
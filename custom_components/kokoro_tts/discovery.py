@@ -0,0 +1,127 @@
+"""Persistent cache of the models and voices Kokoro servers report."""
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from typing import Any
+
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.storage import Store
+
+from .client import async_discover
+from .const import DOMAIN
+
+_LOGGER = logging.getLogger(__name__)
+
+STORAGE_VERSION = 1
+STORAGE_KEY = f"{DOMAIN}.discovery"
+
+# Key in hass.data[DOMAIN] holding the shared DiscoveryCache.
+DATA_DISCOVERY = "discovery"
+
+# A catalogue older than this (seconds) is still shown at once, but the server
+# is asked again in the background so the next dialog sees any new voices.
+DISCOVERY_TTL = 3600
+
+SAVE_DELAY = 10
+
+
+class DiscoveryCache:
+    """Models and voices per base URL, persisted across restarts.
+
+    The config and options flows read from here, so opening a dialog does not
+    wait on a slow or remote server once it has been seen: a stale entry is
+    returned immediately and revalidated in the background. Only answers that
+    include voices are stored; a failed probe never replaces a good entry.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the cache."""
+        self._hass = hass
+        self._store: Store[dict[str, Any]] = Store(hass, STORAGE_VERSION, STORAGE_KEY)
+        # base_url -> {"models": [...], "voices": [...], "fetched_at": epoch}
+        self._catalogues: dict[str, dict[str, Any]] | None = None
+        self._load_lock = asyncio.Lock()
+        self._refreshing: set[str] = set()
+
+    async def _async_load(self) -> dict[str, dict[str, Any]]:
+        """Return the catalogues, reading the Store on first use."""
+        async with self._load_lock:
+            if self._catalogues is None:
+                stored = await self._store.async_load()
+                catalogues = stored.get("catalogues") if isinstance(stored, dict) else None
+                self._catalogues = catalogues if isinstance(catalogues, dict) else {}
+            return self._catalogues
+
+    async def async_get(self, base_url: str, api_key: str) -> tuple[list[str], list[str]]:
+        """Return the models and voices of base_url, from cache when known.
+
+        Either list is empty when the server could not be read and nothing is
+        cached; callers decide on fallbacks.
+        """
+        catalogues = await self._async_load()
+        cached = catalogues.get(base_url)
+        if cached is None:
+            return await self._async_refresh(base_url, api_key)
+        if time.time() - cached.get("fetched_at", 0) > DISCOVERY_TTL:
+            self._schedule_refresh(base_url, api_key)
+        return list(cached.get("models", [])), list(cached.get("voices", []))
+
+    async def async_peek(self, base_url: str) -> dict[str, Any] | None:
+        """Return what is stored for base_url, without asking the server."""
+        catalogues = await self._async_load()
+        cached = catalogues.get(base_url)
+        return None if cached is None else dict(cached)
+
+    async def async_put(self, base_url: str, models: list[str], voices: list[str]) -> None:
+        """Record what a probe made elsewhere (the config flow's user step) found."""
+        catalogues = await self._async_load()
+        if not voices:
+            return
+        catalogues[base_url] = {
+            "models": list(models),
+            "voices": list(voices),
+            "fetched_at": time.time(),
+        }
+        self._store.async_delay_save(self._data_to_save, SAVE_DELAY)
+
+    @callback
+    def _schedule_refresh(self, base_url: str, api_key: str) -> None:
+        """Revalidate one entry in the background, once at a time."""
+        if base_url in self._refreshing:
+            return
+        self._refreshing.add(base_url)
+        self._hass.async_create_background_task(
+            self._async_refresh(base_url, api_key),
+            f"{DOMAIN} discovery refresh {base_url}",
+        )
+
+    async def _async_refresh(
+        self, base_url: str, api_key: str
+    ) -> tuple[list[str], list[str]]:
+        """Ask the server, store a usable answer and return it."""
+        try:
+            models, voices = await async_discover(base_url, api_key)
+        finally:
+            self._refreshing.discard(base_url)
+        if voices:
+            await self.async_put(base_url, models, voices)
+        else:
+            _LOGGER.debug("No voices discovered at %s", base_url)
+        return models, voices
+
+    @callback
+    def _data_to_save(self) -> dict[str, Any]:
+        """Return the Store payload."""
+        return {"catalogues": self._catalogues or {}}
+
+
+@callback
+def async_get_discovery_cache(hass: HomeAssistant) -> DiscoveryCache:
+    """Return the discovery cache shared by all flows."""
+    domain_data: dict[str, Any] = hass.data.setdefault(DOMAIN, {})
+    cache = domain_data.get(DATA_DISCOVERY)
+    if cache is None:
+        cache = domain_data[DATA_DISCOVERY] = DiscoveryCache(hass)
+    return cache
@@ -0,0 +1,178 @@
+"""Hedged Kokoro TTS requests for lower tail latency."""
+from __future__ import annotations
+
+import asyncio
+from collections.abc import AsyncGenerator, Awaitable, Callable
+import time
+
+from .metrics import RollingWindow
+
+# Extra requests allowed per request made: every request earns this many
+# tokens and a hedge spends one, so hedges stay below 10% of all requests.
+HEDGE_BUDGET = 0.1
+
+# Tokens that can be saved up for a burst of slow requests.
+HEDGE_BURST = 5.0
+
+# Percentile of recent response times after which a request is hedged.
+HEDGE_PERCENTILE = 90
+
+# Added to the percentile, so scheduling jitter around a tight distribution
+# does not spend the budget on requests that were about to answer.
+HEDGE_MARGIN = 0.02
+
+# Samples needed before the threshold is trusted.
+HEDGE_MIN_SAMPLES = 20
+
+
+async def _async_first(audio: AsyncGenerator[bytes]) -> bytes | None:
+    """Return the first chunk of a stream, or None if it ends without one."""
+    try:
+        return await anext(audio)
+    except StopAsyncIteration:
+        return None
+
+
+async def _async_discard(task: asyncio.Task, audio: AsyncGenerator[bytes]) -> None:
+    """Cancel a losing request and close its stream."""
+    task.cancel()
+    await asyncio.wait([task])
+    await audio.aclose()
+
+
+class Hedger:
+    """Send a second copy of a request that is slower than usual.
+
+    When a request has not answered within the recent p90 response time of
+    its kind (first audio of a streamed request, the whole of a one-shot one),
+    a duplicate is sent; being a new request it is routed to the least busy
+    backend, normally another server. Whichever answers first is
+    used and the other is cancelled. Hedges are paid for from a token budget
+    and only sent while a backend slot is free, so they cannot amplify an
+    overload.
+    """
+
+    def __init__(
+        self,
+        stream_first_audio: RollingWindow,
+        one_shot_time: RollingWindow,
+        has_free_slot: Callable[[], bool],
+        budget: float = HEDGE_BUDGET,
+    ) -> None:
+        """Initialize the hedger."""
+        self._stream_first_audio = stream_first_audio
+        self._one_shot_time = one_shot_time
+        self._has_free_slot = has_free_slot
+        self._budget = budget
+        self._tokens = 0.0
+        self.hedged = 0
+        self.hedges_won = 0
+
+    def _delay(self, window: RollingWindow) -> float | None:
+        """Earn budget for one request and return how long to wait before
+        hedging it, or None while too few response times are known."""
+        self._tokens = min(HEDGE_BURST, self._tokens + self._budget)
+        if len(window) < HEDGE_MIN_SAMPLES:
+            return None
+        return (window.percentile(HEDGE_PERCENTILE) or 0.0) + HEDGE_MARGIN
+
+    def _may_hedge(self) -> bool:
+        """Spend a token on a hedge if the budget and the backends allow it."""
+        if self._tokens < 1 or not self._has_free_slot():
+            return False
+        self._tokens -= 1
+        self.hedged += 1
+        return True
+
+    async def async_do(self, fetch: Callable[[], Awaitable[bytes]]) -> bytes:
+        """Return fetch()'s audio, hedging a one-shot request that is slow.
+
+        A one-shot response only arrives once its audio is synthesised, so
+        the whole request is raced.
+        """
+        delay = self._delay(self._one_shot_time)
+        primary = asyncio.ensure_future(fetch())
+        if delay is None:
+            return await primary
+
+        tasks = [primary]
+        try:
+            done, _ = await asyncio.wait(tasks, timeout=delay)
+            if done or not self._may_hedge():
+                return await primary
+            tasks.append(asyncio.ensure_future(fetch()))
+
+            errors: list[BaseException] = []
+            pending = set(tasks)
+            while pending:
+                done, pending = await asyncio.wait(
+                    pending, return_when=asyncio.FIRST_COMPLETED
+                )
+                for task in done:
+                    if (error := task.exception()) is not None:
+                        errors.append(error)
+                        continue
+                    if task is not primary:
+                        self.hedges_won += 1
+                    return task.result()
+            # Every copy failed: raise the first error.
+            raise errors[0]
+        finally:
+            for task in tasks:
+                task.cancel()
+
+    async def async_stream(
+        self, fetch: Callable[[], AsyncGenerator[bytes]]
+    ) -> AsyncGenerator[bytes]:
+        """Yield fetch()'s audio, hedging a streamed request that is slow.
+
+        The race is decided by the first audio chunk; the rest of the audio
+        comes from the winning request only. The time to that chunk is what
+        later requests are hedged on.
+        """
+        delay = self._delay(self._stream_first_audio)
+        started = time.monotonic()
+        primary = fetch()
+        # first-chunk task -> the stream it reads from
+        arms = {asyncio.ensure_future(_async_first(primary)): primary}
+        winner: AsyncGenerator[bytes] | None = None
+        first: bytes | None = None
+        try:
+            done, _ = await asyncio.wait(arms, timeout=delay)
+            if not done and delay is not None and self._may_hedge():
+                hedge = fetch()
+                arms[asyncio.ensure_future(_async_first(hedge))] = hedge
+
+            errors: list[BaseException] = []
+            pending = set(arms)
+            while pending and winner is None:
+                done, pending = await asyncio.wait(
+                    pending, return_when=asyncio.FIRST_COMPLETED
+                )
+                for task in done:
+                    if (error := task.exception()) is not None:
+                        errors.append(error)
+                        continue
+                    winner, first = arms[task], task.result()
+                    if winner is not primary:
+                        self.hedges_won += 1
+                    break
+            if winner is None:
+                raise errors[0]
+            # Timed like the hedge delay, admission wait included. When a
+            # hedge wins, this is what the caller waited, a lower bound for
+            # the primary.
+            self._stream_first_audio.add(time.monotonic() - started)
+        finally:
+            for task, audio in arms.items():
+                if audio is not winner:
+                    await _async_discard(task, audio)
+
+        try:
+            if first is None:
+                return
+            yield first
+            async for chunk in winner:
+                yield chunk
+        finally:
+            await winner.aclose()
@@ -0,0 +1,239 @@
+"""Rolling latency and throughput metrics for Kokoro TTS."""
+from __future__ import annotations
+
+from bisect import bisect_left
+from collections import Counter, deque
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from datetime import UTC, datetime
+import time
+from typing import Any
+
+# Samples kept per rolling window. Percentiles and rates describe the most
+# recent requests rather than everything since Home Assistant started.
+WINDOW_SIZE = 200
+
+# Outcome recorded for requests that failed before an HTTP status arrived.
+STATUS_CONNECTION_ERROR = "connection"
+
+# Upper bounds (ms) of the latency histogram buckets; one more counts the rest.
+HISTOGRAM_BUCKETS_MS: tuple[int, ...] = (100, 250, 500, 1000, 2000, 5000, 10000)
+
+# Entity-level requests kept for diagnostics.
+RECENT_REQUESTS = 50
+
+
+class RollingWindow:
+    """The most recent numeric samples of one measurement."""
+
+    def __init__(self, size: int = WINDOW_SIZE) -> None:
+        """Initialize the window."""
+        self._samples: deque[float] = deque(maxlen=size)
+
+    def __len__(self) -> int:
+        """Return the number of samples held."""
+        return len(self._samples)
+
+    def add(self, value: float) -> None:
+        """Add a sample, dropping the oldest one once the window is full."""
+        self._samples.append(value)
+
+    def percentile(self, percent: float) -> float | None:
+        """Return the nearest-rank percentile, or None without samples."""
+        if not self._samples:
+            return None
+        ordered = sorted(self._samples)
+        rank = max(0, min(len(ordered) - 1, round(percent / 100 * len(ordered)) - 1))
+        return ordered[rank]
+
+    def mean(self) -> float | None:
+        """Return the mean, or None without samples."""
+        if not self._samples:
+            return None
+        return sum(self._samples) / len(self._samples)
+
+    def total(self) -> float:
+        """Return the sum of all samples."""
+        return sum(self._samples)
+
+
+class LatencyHistogram:
+    """Counts of latency samples in fixed buckets, never growing in size."""
+
+    __slots__ = ("counts",)
+
+    def __init__(self) -> None:
+        """Initialize empty buckets."""
+        self.counts = [0] * (len(HISTOGRAM_BUCKETS_MS) + 1)
+
+    def add(self, seconds: float) -> None:
+        """Count one sample."""
+        self.counts[bisect_left(HISTOGRAM_BUCKETS_MS, seconds * 1000)] += 1
+
+    def as_dict(self) -> dict[str, int]:
+        """Return the counts keyed by bucket label, e.g. "<=250ms"."""
+        labels = [f"<={bound}ms" for bound in HISTOGRAM_BUCKETS_MS]
+        labels.append(f">{HISTOGRAM_BUCKETS_MS[-1]}ms")
+        return dict(zip(labels, self.counts))
+
+
+class UpstreamTrace:
+    """Timing of one request to a Kokoro server, filled in as it progresses."""
+
+    __slots__ = ("started", "status", "ttfb", "size")
+
+    def __init__(self) -> None:
+        """Start timing."""
+        self.started = time.monotonic()
+        self.status: int | None = None
+        self.ttfb: float | None = None
+        self.size = 0
+
+    def response(self, status: int) -> None:
+        """Record the arrival of the response headers."""
+        self.status = status
+        self.ttfb = time.monotonic() - self.started
+
+
+class KokoroMetrics:
+    """Rolling windows behind the sensor entities of one config entry.
+
+    Upstream requests (one per one-shot message, segment or streamed sentence)
+    feed time to first byte, synthesis time, bytes per request, throughput and
+    the error rate. Requests made to the entity feed time to first audio: how
+    long a synthesised one-shot message took (cache and prefetch hits are left
+    out), or how long a stream waited for its first audio once its first text
+    chunk was ready.
+
+    For diagnostics, upstream latencies are also counted in fixed-bucket
+    histograms per backend and per voice, and the last RECENT_REQUESTS entity
+    requests are kept as plain tuples in a ring buffer.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the windows."""
+        self.ttfb = RollingWindow()
+        # Hedging thresholds: when a streamed request's first audio, or a whole
+        # one-shot request, is later than usual. The Hedger times the former
+        # itself, from before admission, as its timer runs from there.
+        self.stream_first_audio = RollingWindow()
+        self.one_shot_time = RollingWindow()
+        self.ttfa = RollingWindow()
+        self.sentence_time = RollingWindow()
+        self.request_bytes = RollingWindow()
+        self._transfer_time = RollingWindow()
+        self._outcomes: deque[int | str] = deque(maxlen=WINDOW_SIZE)
+        # key -> (time to first byte, total time)
+        self._by_backend: dict[str, tuple[LatencyHistogram, LatencyHistogram]] = {}
+        self._by_voice: dict[str, tuple[LatencyHistogram, LatencyHistogram]] = {}
+        # (wall clock, kind, sentences, bytes, first audio, total, outcome)
+        self._recent: deque[tuple] = deque(maxlen=RECENT_REQUESTS)
+
+    @asynccontextmanager
+    async def async_trace_upstream(
+        self, streamed: bool, backend: str, voice: str
+    ) -> AsyncIterator[UpstreamTrace]:
+        """Time one upstream request and record it when it ends.
+
+        Requests abandoned by their caller (cancellation, early close of a
+        stream) say nothing about the server and are not recorded.
+        """
+        trace = UpstreamTrace()
+        try:
+            yield trace
+        except Exception:
+            self._outcomes.append(
+                STATUS_CONNECTION_ERROR if trace.status is None else trace.status
+            )
+            raise
+        self._outcomes.append(trace.status or STATUS_CONNECTION_ERROR)
+        if trace.ttfb is not None:
+            self.ttfb.add(trace.ttfb)
+        duration = time.monotonic() - trace.started
+        if streamed:
+            self.sentence_time.add(duration)
+        else:
+            self.one_shot_time.add(duration)
+        self.request_bytes.add(trace.size)
+        self._transfer_time.add(duration)
+        for histograms, key in ((self._by_backend, backend), (self._by_voice, voice)):
+            if key not in histograms:
+                histograms[key] = (LatencyHistogram(), LatencyHistogram())
+            first_byte, total = histograms[key]
+            if trace.ttfb is not None:
+                first_byte.add(trace.ttfb)
+            total.add(duration)
+
+    def record_first_audio(self, seconds: float) -> None:
+        """Record how long a caller waited for its first audio."""
+        self.ttfa.add(seconds)
+
+    def record_request(
+        self,
+        kind: str,
+        sentences: int,
+        size: int,
+        first_audio: float | None,
+        total: float,
+        outcome: str,
+    ) -> None:
+        """Keep one entity request in the diagnostics ring buffer."""
+        self._recent.append(
+            (time.time(), kind, sentences, size, first_audio, total, outcome)
+        )
+
+    def as_diagnostics(self) -> dict[str, Any]:
+        """Return histograms and recent requests for config entry diagnostics."""
+
+        def _histograms(
+            source: dict[str, tuple[LatencyHistogram, LatencyHistogram]],
+        ) -> dict[str, dict[str, dict[str, int]]]:
+            return {
+                key: {"ttfb": first_byte.as_dict(), "total": total.as_dict()}
+                for key, (first_byte, total) in source.items()
+            }
+
+        def _ms(seconds: float | None) -> int | None:
+            return None if seconds is None else round(seconds * 1000)
+
+        return {
+            "latency_by_backend": _histograms(self._by_backend),
+            "latency_by_voice": _histograms(self._by_voice),
+            "recent_requests": [
+                {
+                    "time": datetime.fromtimestamp(when, UTC).isoformat(),
+                    "kind": kind,
+                    "sentences": sentences,
+                    "bytes": size,
+                    "first_audio_ms": _ms(first_audio),
+                    "total_ms": _ms(total),
+                    "outcome": outcome,
+                }
+                for when, kind, sentences, size, first_audio, total, outcome in self._recent
+            ],
+        }
+
+    @property
+    def bytes_per_second(self) -> float | None:
+        """Return audio bytes received per second of upstream request time."""
+        seconds = self._transfer_time.total()
+        if not seconds:
+            return None
+        return self.request_bytes.total() / seconds
+
+    @property
+    def error_rate(self) -> float | None:
+        """Return the percentage of recent upstream requests that failed."""
+        if not self._outcomes:
+            return None
+        failed = sum(1 for outcome in self._outcomes if outcome != 200)
+        return 100 * failed / len(self._outcomes)
+
+    @property
+    def errors_by_status(self) -> dict[str, int]:
+        """Return recent failures counted by HTTP status (or connection)."""
+        return {
+            str(outcome): count
+            for outcome, count in Counter(self._outcomes).items()
+            if outcome != 200
+        }
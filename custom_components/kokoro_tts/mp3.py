@@ -0,0 +1,231 @@
+"""Incremental MP3 frame filter for streamed Kokoro TTS audio."""
+from __future__ import annotations
+
+from collections import deque
+
+# Layer III bitrates in kbit/s by bitrate index, for MPEG-1 and MPEG-2/2.5.
+_BITRATES_V1 = (0, 32, 40, 48, 56, 64, 80, 96, 112, 128, 160, 192, 224, 256, 320)
+_BITRATES_V2 = (0, 8, 16, 24, 32, 40, 48, 56, 64, 80, 96, 112, 128, 144, 160)
+
+# Sample rates by version bits (3 = MPEG-1, 2 = MPEG-2, 0 = MPEG-2.5).
+_SAMPLE_RATES = {
+    3: (44100, 48000, 32000),
+    2: (22050, 24000, 16000),
+    0: (11025, 12000, 8000),
+}
+
+_ID3V2_HEADER_BYTES = 10
+_ID3V1_TAG_BYTES = 128
+_FRAME_HEADER_BYTES = 4
+
+# Offset of the encoder delay/padding field inside a LAME extension.
+_LAME_DELAY_OFFSET = 21
+
+
+class _FrameHeader:
+    """The fields of a Layer III frame header this filter needs."""
+
+    __slots__ = ("length", "samples", "sample_rate", "side_info_start", "side_info_end")
+
+    def __init__(
+        self, length: int, samples: int, sample_rate: int, side_info_start: int, side_info: int
+    ) -> None:
+        """Initialize the header."""
+        self.length = length
+        self.samples = samples
+        self.sample_rate = sample_rate
+        self.side_info_start = side_info_start
+        self.side_info_end = side_info_start + side_info
+
+
+def _parse_header(data: bytes | bytearray, pos: int) -> _FrameHeader | None:
+    """Return the Layer III frame header at pos, or None if it is not one."""
+    b0, b1, b2, b3 = data[pos : pos + _FRAME_HEADER_BYTES]
+    if b0 != 0xFF or b1 & 0xE0 != 0xE0:
+        return None
+    version = (b1 >> 3) & 0x03
+    layer = (b1 >> 1) & 0x03
+    bitrate_index = b2 >> 4
+    rate_index = (b2 >> 2) & 0x03
+    # Only Layer III with a fixed bitrate; free format has no computable length.
+    if version == 1 or layer != 1 or bitrate_index in (0, 15) or rate_index == 3:
+        return None
+
+    mpeg1 = version == 3
+    sample_rate = _SAMPLE_RATES[version][rate_index]
+    bitrate = (_BITRATES_V1 if mpeg1 else _BITRATES_V2)[bitrate_index] * 1000
+    padding = (b2 >> 1) & 0x01
+    mono = b3 >> 6 == 3
+    if mpeg1:
+        samples, length = 1152, 144 * bitrate // sample_rate + padding
+        side_info = 17 if mono else 32
+    else:
+        samples, length = 576, 72 * bitrate // sample_rate + padding
+        side_info = 9 if mono else 17
+    crc = 0 if b1 & 0x01 else 2
+    return _FrameHeader(length, samples, sample_rate, _FRAME_HEADER_BYTES + crc, side_info)
+
+
+def _main_data_begin(frame: bytes, header: _FrameHeader) -> int:
+    """Return how many bytes of earlier frames the audio of a frame starts in.
+
+    This is the bit reservoir back pointer: 9 bits for MPEG-1, 8 for MPEG-2.
+    """
+    start = header.side_info_start
+    if header.samples == 1152:
+        return (frame[start] << 1) | (frame[start + 1] >> 7)
+    return frame[start]
+
+
+def _info_frame_gaps(
+    frame: bytes | bytearray, header: _FrameHeader
+) -> tuple[int, int] | None:
+    """Return the encoder delay and padding of a Xing/Info/VBRI frame, None for audio.
+
+    Both are 0 when the frame is metadata but carries no LAME extension.
+    """
+    tag = frame[header.side_info_end : header.side_info_end + 4]
+    if tag not in (b"Xing", b"Info"):
+        return (0, 0) if frame[36:40] == b"VBRI" else None
+
+    flags = int.from_bytes(frame[header.side_info_end + 4 : header.side_info_end + 8], "big")
+    lame = header.side_info_end + 8
+    lame += 4 if flags & 0x01 else 0  # frame count
+    lame += 4 if flags & 0x02 else 0  # byte count
+    lame += 100 if flags & 0x04 else 0  # seek table
+    lame += 4 if flags & 0x08 else 0  # quality
+    field = frame[lame + _LAME_DELAY_OFFSET : lame + _LAME_DELAY_OFFSET + 3]
+    if len(field) < 3 or frame[lame : lame + 4] not in (b"LAME", b"Lavf", b"Lavc"):
+        return (0, 0)
+    return (field[0] << 4) | (field[1] >> 4), ((field[1] & 0x0F) << 8) | field[2]
+
+
+class Mp3FrameFilter:
+    """Turn concatenated per-sentence MP3 files into one plain frame stream.
+
+    Each sentence arrives as a complete MP3 file that may open with an ID3v2
+    tag and a Xing/Info (or VBRI) frame describing only that file. Mid-stream,
+    those make some players reset their decoder or stop early, so only audio
+    frames are forwarded. When the Info frame's LAME extension reports encoder
+    delay or padding of a whole frame or more, those leading and trailing
+    frames hold only silence and are dropped, which keeps sentences closer
+    together. Leading frames are kept when the first frame after them takes
+    part of its audio from them through the bit reservoir. Frame count and
+    duration are tracked for logging. CPU-bound: call it from an executor.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the filter."""
+        self._buffer = bytearray()
+        self._skip = 0
+        self._held: deque[tuple[bytes, float]] = deque()
+        self._hold = 0
+        self._leading: list[tuple[bytes, float]] = []
+        self._delay_frames = 0
+        self.frames = 0
+        self.duration = 0.0
+        self.dropped_bytes = 0
+
+    def feed(self, data: bytes) -> bytes:
+        """Add streamed bytes and return the complete audio frames among them."""
+        if self._skip:
+            skipped = min(self._skip, len(data))
+            self._skip -= skipped
+            self.dropped_bytes += skipped
+            data = data[skipped:]
+        self._buffer += data
+        out: list[bytes] = []
+        buffer = self._buffer
+        pos = 0
+
+        while len(buffer) - pos >= _FRAME_HEADER_BYTES:
+            if buffer[pos : pos + 3] == b"ID3":
+                if len(buffer) - pos < _ID3V2_HEADER_BYTES:
+                    break
+                self._end_file()
+                size = _ID3V2_HEADER_BYTES + (
+                    (buffer[pos + 6] << 21)
+                    | (buffer[pos + 7] << 14)
+                    | (buffer[pos + 8] << 7)
+                    | buffer[pos + 9]
+                )
+                if buffer[pos + 5] & 0x10:
+                    size += _ID3V2_HEADER_BYTES  # footer
+                pos = self._drop(buffer, pos, size)
+                continue
+
+            if buffer[pos : pos + 3] == b"TAG":
+                pos = self._drop(buffer, pos, _ID3V1_TAG_BYTES)
+                continue
+
+            header = _parse_header(buffer, pos)
+            if header is None:
+                # Not at a frame or tag: skip junk up to the next candidate.
+                end = min(
+                    (
+                        found
+                        for marker in (b"\xff", b"ID3", b"TAG")
+                        if (found := buffer.find(marker, pos + 1)) >= 0
+                    ),
+                    default=len(buffer),
+                )
+                self.dropped_bytes += end - pos
+                pos = end
+                continue
+            if len(buffer) - pos < header.length:
+                break
+
+            frame = bytes(buffer[pos : pos + header.length])
+            pos += header.length
+            gaps = _info_frame_gaps(frame, header)
+            if gaps is not None:
+                self._end_file()
+                delay, padding = gaps
+                self._delay_frames = delay // header.samples
+                self._hold = padding // header.samples
+                self.dropped_bytes += header.length
+                continue
+
+            entry = (frame, header.samples / header.sample_rate)
+            if self._delay_frames:
+                if len(self._leading) < self._delay_frames:
+                    self._leading.append(entry)
+                    continue
+                # The delay is over: drop it unless this frame reaches into it.
+                if _main_data_begin(frame, header):
+                    self._held.extend(self._leading)
+                else:
+                    self.dropped_bytes += sum(len(lead) for lead, _seconds in self._leading)
+                self._leading.clear()
+                self._delay_frames = 0
+            self._held.append(entry)
+            while len(self._held) > self._hold:
+                frame, seconds = self._held.popleft()
+                self.frames += 1
+                self.duration += seconds
+                out.append(frame)
+
+        del buffer[:pos]
+        return b"".join(out)
+
+    def flush(self) -> None:
+        """Drop padding frames and any truncated frame at stream end."""
+        self._end_file()
+        self.dropped_bytes += len(self._buffer)
+        self._buffer.clear()
+
+    def _drop(self, buffer: bytearray, pos: int, size: int) -> int:
+        """Skip size bytes at pos, continuing into later feeds if needed."""
+        available = min(size, len(buffer) - pos)
+        self._skip = size - available
+        self.dropped_bytes += available
+        return pos + available
+
+    def _end_file(self) -> None:
+        """Discard the silent frames held back at the end of a sentence file."""
+        for frame, _seconds in (*self._leading, *self._held):
+            self.dropped_bytes += len(frame)
+        self._leading.clear()
+        self._held.clear()
+        self._hold = 0
+        self._delay_frames = 0
@@ -0,0 +1,261 @@
+"""Incremental clean-up of streamed conversation agent text before synthesis."""
+from __future__ import annotations
+
+import re
+
+# Text ending a line that already sounds finished.
+_TERMINAL = frozenset(".!?…:;,")
+
+# An unfinished link is held back at most this many characters; past that
+# the bracket is taken literally.
+MAX_LINK_HOLD = 300
+
+# Markdown at the start of a line. Matched only at real line starts.
+_LINE_START = re.compile(
+    r"""[ \t]*(?:
+        (?P<fence>```|~~~)
+      | (?P<rule>(?:[-*_][ \t]*){3,}$)
+      | (?P<heading>\#{1,6}[ \t]+)
+      | (?P<quote>(?:>[ \t]?)+)
+      | (?P<bullet>[-*+•][ \t]+)
+      | (?P<number>\d{1,2}[.)][ \t]+)
+    )""",
+    re.VERBOSE,
+)
+
+# Lines that read as items and need a pause at their end.
+_ITEM_KINDS = frozenset(("heading", "bullet", "number"))
+
+# Spoken forms of unit symbols after a number: symbol -> (singular, plural).
+# Bare "m", "l", "g" and "h" are left out: "5m" is as often minutes or
+# millions as meters, and "Plan 9 h" is no unit at all.
+UNITS: dict[str, tuple[str, str]] = {
+    "%": ("percent", "percent"),
+    "°C": ("degree Celsius", "degrees Celsius"),
+    "°F": ("degree Fahrenheit", "degrees Fahrenheit"),
+    "°": ("degree", "degrees"),
+    "km/h": ("kilometer per hour", "kilometers per hour"),
+    "mph": ("mile per hour", "miles per hour"),
+    "m/s": ("meter per second", "meters per second"),
+    "kWh": ("kilowatt hour", "kilowatt hours"),
+    "Wh": ("watt hour", "watt hours"),
+    "MW": ("megawatt", "megawatts"),
+    "kW": ("kilowatt", "kilowatts"),
+    "W": ("watt", "watts"),
+    "mA": ("milliamp", "milliamps"),
+    "V": ("volt", "volts"),
+    "hPa": ("hectopascal", "hectopascals"),
+    "mbar": ("millibar", "millibars"),
+    "dB": ("decibel", "decibels"),
+    "ppm": ("part per million", "parts per million"),
+    "µg/m³": ("microgram per cubic meter", "micrograms per cubic meter"),
+    "lx": ("lux", "lux"),
+    "km": ("kilometer", "kilometers"),
+    "cm": ("centimeter", "centimeters"),
+    "mm": ("millimeter", "millimeters"),
+    "mi": ("mile", "miles"),
+    "ft": ("foot", "feet"),
+    "kg": ("kilogram", "kilograms"),
+    "lbs": ("pound", "pounds"),
+    "lb": ("pound", "pounds"),
+    "oz": ("ounce", "ounces"),
+    "ml": ("milliliter", "milliliters"),
+    "mL": ("milliliter", "milliliters"),
+    "L": ("liter", "liters"),
+    "ms": ("millisecond", "milliseconds"),
+    "min": ("minute", "minutes"),
+    "hrs": ("hour", "hours"),
+    "hr": ("hour", "hours"),
+    "TB": ("terabyte", "terabytes"),
+    "GB": ("gigabyte", "gigabytes"),
+    "MB": ("megabyte", "megabytes"),
+    "Mbps": ("megabit per second", "megabits per second"),
+}
+
+_UNIT_SYMBOLS = "|".join(
+    re.escape(symbol) for symbol in sorted(UNITS, key=len, reverse=True)
+)
+
+# Inline constructs, tried left to right in one pass. Links come before URLs
+# (a link contains one) and URLs before emphasis (URLs contain underscores).
+_COMMON = r"""
+    (?P<link>!?\[(?P<text>[^\]\n]*)\]\([^)\n]*\))
+  | (?P<url>\b(?:https?://|www\.)[^\s<>()\[\]]*[^\s<>()\[\].,;:!?'"])
+  | (?P<emoji>[\U0001F000-\U0001FAFF\u2300-\u23FF\u2600-\u27BF\u2B00-\u2BFF\uFE0F\u200D\u20E3]+)
+  | (?P<emphasis>\*{2,}|(?<!\d)\*(?=\S)|(?<=\S)\*(?!\d)|(?<!\w)_+(?=\S)|(?<=\S)_+(?!\w)|~~|`+)
+"""
+_ENGLISH = rf"""
+  | (?P<clock>\b(?P<hour12>1[0-2]|0?[1-9])(?::(?P<minute12>[0-5]\d))?[ ]?
+        (?P<meridiem>[AaPp])\.?[Mm](?:\.(?=\s+[a-z]))?(?!\w))
+  | (?P<time>\b(?P<hour>[01]?\d|2[0-3]):(?P<minute>[0-5]\d)(?![\d:]))
+  | (?P<measure>(?<![\w.,$£€¥])(?P<amount>\d+(?:[.,]\d+)?)[ ]?(?P<unit>{_UNIT_SYMBOLS})
+        (?![\w/²³'’]))
+"""
+_INLINE = re.compile(_COMMON, re.VERBOSE)
+_INLINE_ENGLISH = re.compile(_COMMON + _ENGLISH, re.VERBOSE)
+
+# As much of a link as has been written: "[text", "[text](partial-url", ...
+_LINK_SO_FAR = re.compile(r"\[[^\]\n]*(?:\](?:\([^)\n]*\)?)?)?")
+
+_URL_HOST = re.compile(r"^(?:https?://)?(?:www\.)?([^/?#:]+)")
+
+
+def _ends_word(char: str) -> bool:
+    """Return True if text can be cut after char without splitting a word.
+
+    Japanese and Chinese put no spaces between words, so any ideograph, kana
+    or full-width character ends one.
+    """
+    return char.isspace() or "\u3000" <= char <= "\u9fff" or "\uff00" <= char <= "\uffef"
+
+
+def _spoken_minutes(minutes: str) -> str:
+    """Return minutes as read on a clock: "05" -> "oh 5"."""
+    return f"oh {minutes[1]}" if minutes[0] == "0" else minutes
+
+
+class TextNormalizer:
+    """Make streamed LLM text fit for speech, one chunk at a time.
+
+    Markdown markers, code blocks and emoji are dropped, links are reduced to
+    their text and URLs to their host name. In English, times and units after
+    a number are spelled out ("4:30 pm" -> "4 30 PM", "21 °C" -> "21 degrees
+    Celsius"). List items and headings get a full stop, so they are spoken,
+    and segmented, as separate sentences.
+
+    Text is only rewritten once nothing arriving later can change it: the
+    word being written, a number that a unit may still follow, and an
+    unfinished link are held back until the next chunk or flush().
+    """
+
+    def __init__(self, english: bool = True) -> None:
+        """Initialize the normalizer."""
+        self._inline = _INLINE_ENGLISH if english else _INLINE
+        self._pending = ""
+        self._at_line_start = True
+        self._line_kind: str | None = None
+        self._line_last = ""
+        self._in_fence = False
+        self.chars_in = 0
+        self.chars_out = 0
+
+    def feed(self, text: str) -> str:
+        """Add streamed text and return whatever is ready, normalized."""
+        self.chars_in += len(text)
+        pending = self._pending + text
+        cut = self._safe_end(pending)
+        self._pending = pending[cut:]
+        return self._normalize(pending[:cut])
+
+    def flush(self) -> str:
+        """Return the held-back text once the stream has ended."""
+        pending, self._pending = self._pending, ""
+        return self._normalize(pending)
+
+    @staticmethod
+    def _safe_end(pending: str) -> int:
+        """Return how much of pending can be rewritten without seeing more."""
+        # The last word may be unfinished.
+        cut = len(pending)
+        while cut and not _ends_word(pending[cut - 1]):
+            cut -= 1
+        # Keep a number with the word that may follow it: "4 pm", "21 °C".
+        end = cut
+        while end and pending[end - 1].isspace():
+            end -= 1
+        if end and pending[end - 1].isdigit():
+            cut = end
+            while cut and not _ends_word(pending[cut - 1]):
+                cut -= 1
+        # Keep a link whole until its closing parenthesis has been seen.
+        bracket = pending.rfind("[", 0, cut)
+        if bracket != -1 and len(pending) - bracket <= MAX_LINK_HOLD:
+            link_end = _LINK_SO_FAR.match(pending, bracket).end()
+        else:
+            link_end = -1
+        if link_end > cut or link_end == len(pending):
+            cut = bracket - 1 if pending[bracket - 1 : bracket] == "!" else bracket
+        return cut
+
+    def _normalize(self, text: str) -> str:
+        """Rewrite text that starts where the previous call stopped."""
+        if not text:
+            return ""
+        out: list[str] = []
+        for line in text.split("\n")[:-1]:
+            out.append(self._line(line))
+            out.append(self._end_line())
+        out.append(self._line(text[text.rfind("\n") + 1 :]))
+        result = "".join(out)
+        self.chars_out += len(result)
+        return result
+
+    def _line(self, text: str) -> str:
+        """Rewrite one line, or the part of it that is ready."""
+        if not text:
+            return ""
+        if self._at_line_start:
+            if not text.strip():
+                # Indentation only; the line's markers are still to come.
+                return "" if self._in_fence else text
+            self._at_line_start = False
+            match = _LINE_START.match(text)
+            kind = match.lastgroup if match is not None else None
+            if kind == "fence":
+                self._in_fence = not self._in_fence
+                self._line_kind = "fence"
+                return ""
+            if self._in_fence:
+                return ""
+            if kind == "rule":
+                return ""
+            if match is not None:
+                self._line_kind = kind
+                text = text[match.end() :]
+        elif self._in_fence or self._line_kind == "fence":
+            return ""
+
+        text = self._inline.sub(self._replace, text)
+        if stripped := text.rstrip():
+            self._line_last = stripped[-1]
+        return text
+
+    def _end_line(self) -> str:
+        """Close the current line, ending list items and headings with a stop."""
+        end = "\n"
+        if (
+            self._line_kind in _ITEM_KINDS
+            and self._line_last
+            and self._line_last not in _TERMINAL
+        ):
+            end = ".\n"
+        self._at_line_start = True
+        self._line_kind = None
+        self._line_last = ""
+        return end
+
+    @staticmethod
+    def _replace(match: re.Match[str]) -> str:
+        """Return the spoken form of one inline construct."""
+        kind = match.lastgroup
+        if kind == "link":
+            return match.group("text")
+        if kind == "url":
+            host = _URL_HOST.match(match.group("url"))
+            return host.group(1) if host is not None else ""
+        if kind == "clock":
+            spoken = match.group("hour12")
+            if (minutes := match.group("minute12")) and minutes != "00":
+                spoken += f" {_spoken_minutes(minutes)}"
+            return f"{spoken} {match.group('meridiem').upper()}M"
+        if kind == "time":
+            minutes = match.group("minute")
+            if minutes == "00":
+                return f"{match.group('hour')} o'clock"
+            return f"{match.group('hour')} {_spoken_minutes(minutes)}"
+        if kind == "measure":
+            amount = match.group("amount")
+            singular, plural = UNITS[match.group("unit")]
+            return f"{amount} {singular if amount == '1' else plural}"
+        # Emphasis markers, backticks and emoji are dropped.
+        return ""
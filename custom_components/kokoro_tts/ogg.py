@@ -0,0 +1,243 @@
+"""Incremental Ogg Opus remuxer for streamed Kokoro TTS audio."""
+from __future__ import annotations
+
+import struct
+
+_PAGE_HEADER = struct.Struct("<4sBBqIIIB")
+_CAPTURE_PATTERN = b"OggS"
+
+# header_type flags.
+_CONTINUED = 0x01
+_BOS = 0x02
+_EOS = 0x04
+
+# Granule position of a page on which no packet ends.
+_NO_GRANULE = -1
+
+# Every Opus stream opens with two header packets: OpusHead and OpusTags.
+_HEADER_PACKETS = 2
+
+# Opus frame duration in 48 kHz samples for each TOC configuration (RFC 6716).
+_FRAME_SAMPLES = (
+    [480, 960, 1920, 2880] * 3  # SILK: 10, 20, 40, 60 ms
+    + [480, 960] * 2  # Hybrid: 10, 20 ms
+    + [120, 240, 480, 960] * 4  # CELT: 2.5, 5, 10, 20 ms
+)
+
+
+def _crc_table() -> list[int]:
+    """Return the lookup table for Ogg's CRC-32 (polynomial 0x04C11DB7)."""
+    table = []
+    for index in range(256):
+        crc = index << 24
+        for _ in range(8):
+            crc = ((crc << 1) ^ 0x04C11DB7) if crc & 0x80000000 else crc << 1
+        table.append(crc & 0xFFFFFFFF)
+    return table
+
+
+_CRC_TABLE = _crc_table()
+
+
+def ogg_crc(data: bytes | bytearray) -> int:
+    """Return the Ogg page checksum of data (with its CRC field zeroed)."""
+    crc = 0
+    table = _CRC_TABLE
+    for byte in data:
+        crc = ((crc << 8) & 0xFFFFFFFF) ^ table[(crc >> 24) ^ byte]
+    return crc
+
+
+def _packet_samples(first: int, second: int | None) -> int:
+    """Return the 48 kHz duration of an Opus packet from its first bytes."""
+    frame = _FRAME_SAMPLES[first >> 3]
+    code = first & 0x03
+    if code == 0:
+        return frame
+    if code in (1, 2):
+        return 2 * frame
+    return frame * ((second or 0) & 0x3F)
+
+
+class OggOpusRemuxer:
+    """Turn chained per-sentence Ogg Opus files into one logical stream.
+
+    Each sentence arrives as a complete Ogg Opus file with its own serial
+    number, OpusHead/OpusTags pages and granule positions starting from zero.
+    Concatenated, that is a chained stream which several players re-initialise
+    on or stop after. Only the first file's header pages are kept; every page
+    is rewritten with that file's serial number, a continuous page sequence
+    and granule positions counted across all sentences, and its CRC updated.
+
+    The last page of each file is held back until the next file starts, so
+    on flush the final one can carry the end-of-stream flag and the last
+    file's end trim. Pre-skip and end trim only apply at the ends of an Ogg
+    Opus stream: those of the sentences in between are played, about 6.5 ms
+    of encoder pre-roll and a fraction of a packet of padding per boundary,
+    which fall in Kokoro's silence between sentences. CPU-bound: call it
+    from an executor.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the remuxer."""
+        self._buffer = bytearray()
+        self._serial: int | None = None
+        self._sequence = 0
+        self._samples = 0
+        # Per input file: header packets still expected, and the open packet.
+        self._headers_left = 0
+        self._packet_samples = 0
+        self._packet_open = False
+        # End trim of the last file, taken from its final granule position.
+        self._file_samples = 0
+        self._end_trim = 0
+        # The last page of the latest file: flags, granule, lacing and body.
+        self._last_page: tuple[int, int, bytes, bytes] | None = None
+        self._granule = 0
+        self.pages = 0
+
+    def feed(self, data: bytes) -> bytes:
+        """Add streamed bytes and return the complete remuxed pages among them."""
+        self._buffer += data
+        buffer = self._buffer
+        out: list[bytes] = []
+        pos = 0
+
+        while len(buffer) - pos >= _PAGE_HEADER.size:
+            if buffer[pos : pos + 4] != _CAPTURE_PATTERN:
+                # Lost sync: skip ahead to the next capture pattern.
+                found = buffer.find(_CAPTURE_PATTERN, pos + 1)
+                pos = len(buffer) - 3 if found < 0 else found
+                continue
+            _, _, header_type, granule, serial, _, _, segments = (
+                _PAGE_HEADER.unpack_from(buffer, pos)
+            )
+            table_end = pos + _PAGE_HEADER.size + segments
+            if len(buffer) < table_end:
+                break
+            lacing = buffer[pos + _PAGE_HEADER.size : table_end]
+            page_end = table_end + sum(lacing)
+            if len(buffer) < page_end:
+                break
+
+            out.append(
+                self._remux(
+                    header_type, granule, serial, bytes(lacing), buffer[table_end:page_end]
+                )
+            )
+            pos = page_end
+
+        del buffer[:pos]
+        return b"".join(out)
+
+    def flush(self) -> bytes:
+        """Return the held last page, marked end of stream, once every sentence has been fed."""
+        self._buffer.clear()
+        if self._serial is None:
+            return b""
+        if self._last_page is None:
+            # The last file was cut short: close the stream with an empty page.
+            return self._page(_EOS, self._granule, b"", b"")
+        flags, granule, lacing, body = self._last_page
+        self._last_page = None
+        # End trimming may not reach back past the previous page.
+        granule = max(granule - self._end_trim, self._granule)
+        return self._page(flags | _EOS, granule, lacing, body)
+
+    def _release_last_page(self) -> bytes:
+        """Return the held last page of a file that is followed by another."""
+        if self._last_page is None:
+            return b""
+        flags, granule, lacing, body = self._last_page
+        self._last_page = None
+        return self._page(flags, granule, lacing, body)
+
+    def _remux(
+        self,
+        header_type: int,
+        granule: int,
+        serial: int,
+        lacing: bytes,
+        body: bytearray,
+    ) -> bytes:
+        """Rewrite one input page, or return b"" to drop or hold it."""
+        released = b""
+        if header_type & _BOS:
+            # A new sentence file starts with OpusHead on a page of its own.
+            released = self._release_last_page()
+            self._headers_left = _HEADER_PACKETS
+            self._packet_open = False
+            self._file_samples = 0
+            self._end_trim = 0
+
+        # Walk the packets on this page: count header packets and audio time.
+        header_page = self._headers_left > 0
+        ended = False
+        offset = 0
+        for size in lacing:
+            if not self._packet_open:
+                self._packet_open = True
+                self._packet_samples = 0
+                if not self._headers_left and size:
+                    second = body[offset + 1] if size > 1 else None
+                    self._packet_samples = _packet_samples(body[offset], second)
+            offset += size
+            if size < 255:
+                self._packet_open = False
+                ended = True
+                if self._headers_left:
+                    self._headers_left -= 1
+                else:
+                    self._samples += self._packet_samples
+                    self._file_samples += self._packet_samples
+
+        if header_type & _EOS and granule >= 0:
+            self._end_trim = max(self._file_samples - granule, 0)
+
+        if header_page:
+            if self._serial is not None:
+                return released
+            if not self._headers_left:
+                # The first file's headers are complete: adopt its serial.
+                self._serial = serial
+            return self._page(header_type & (_BOS | _CONTINUED), 0, lacing, body, serial)
+
+        if self._serial is None:
+            # Audio without a preceding OpusHead cannot be decoded.
+            return released
+        flags = header_type & _CONTINUED
+        granule = self._samples if ended else _NO_GRANULE
+        if header_type & _EOS:
+            self._last_page = (flags, granule, lacing, bytes(body))
+            return released
+        return released + self._page(flags, granule, lacing, body)
+
+    def _page(
+        self,
+        header_type: int,
+        granule: int,
+        lacing: bytes,
+        body: bytes | bytearray,
+        serial: int | None = None,
+    ) -> bytes:
+        """Build an output page with the next sequence number and a fresh CRC."""
+        page = bytearray(
+            _PAGE_HEADER.pack(
+                _CAPTURE_PATTERN,
+                0,
+                header_type,
+                granule,
+                self._serial if serial is None else serial,
+                self._sequence,
+                0,
+                len(lacing),
+            )
+        )
+        page += lacing
+        page += body
+        struct.pack_into("<I", page, 22, ogg_crc(page))
+        if granule != _NO_GRANULE:
+            self._granule = granule
+        self._sequence += 1
+        self.pages += 1
+        return bytes(page)
@@ -0,0 +1,86 @@
+"""Ordered look-ahead synthesis for Kokoro TTS streams."""
+from __future__ import annotations
+
+import asyncio
+from collections.abc import AsyncIterable, AsyncIterator, Callable
+
+# Largest amount of not-yet-played audio a single look-ahead sentence may hold.
+# Once full, the sentence stops reading from its response. The shared stream
+# behind it (SingleFlight.async_stream) then stops reading too, after at most
+# singleflight.MAX_LAG_CHUNKS more chunks, and TCP backpressure pauses the
+# server. Buffering is bounded by lookahead * (this + MAX_LAG_CHUNKS chunks).
+LOOKAHEAD_BUFFER_BYTES = 512 * 1024
+
+
+class _SentenceJob:
+    """Synthesis of one sentence running ahead into a bounded chunk queue."""
+
+    def __init__(self, audio: AsyncIterator[bytes], max_chunks: int) -> None:
+        """Start pulling audio immediately."""
+        self._queue: asyncio.Queue[bytes | None] = asyncio.Queue(max_chunks)
+        self._error: Exception | None = None
+        self._task = asyncio.create_task(self._run(audio))
+
+    async def _run(self, audio: AsyncIterator[bytes]) -> None:
+        """Copy audio into the queue, deferring any error to the consumer."""
+        try:
+            async for chunk in audio:
+                await self._queue.put(chunk)
+        except Exception as err:  # noqa: BLE001 - re-raised in chunks()
+            self._error = err
+        await self._queue.put(None)
+
+    async def chunks(self) -> AsyncIterator[bytes]:
+        """Yield the buffered audio in order, then raise any synthesis error."""
+        while (chunk := await self._queue.get()) is not None:
+            yield chunk
+        if self._error is not None:
+            raise self._error
+
+    def cancel(self) -> None:
+        """Abort synthesis that is no longer wanted."""
+        self._task.cancel()
+
+
+async def async_ordered_lookahead(
+    sentences: AsyncIterable[str],
+    synthesise: Callable[[str], AsyncIterator[bytes]],
+    lookahead: int,
+    chunk_bytes: int,
+) -> AsyncIterator[bytes]:
+    """Yield audio for each sentence in order, synthesising up to lookahead ahead.
+
+    While sentence N is being played out, requests for up to `lookahead`
+    following sentences are already in flight, so the gap between sentences is
+    no longer the full synthesis latency of the next one. With lookahead 0 this
+    is exactly the old one-sentence-at-a-time behaviour.
+    """
+    max_chunks = max(1, LOOKAHEAD_BUFFER_BYTES // chunk_bytes)
+    # One slot for the sentence being played plus one per look-ahead sentence.
+    slots = asyncio.Semaphore(lookahead + 1)
+    jobs: asyncio.Queue[_SentenceJob | None] = asyncio.Queue()
+
+    async def _feed() -> None:
+        try:
+            async for sentence in sentences:
+                await slots.acquire()
+                jobs.put_nowait(_SentenceJob(synthesise(sentence), max_chunks))
+        finally:
+            jobs.put_nowait(None)
+
+    feeder = asyncio.create_task(_feed())
+    job: _SentenceJob | None = None
+    try:
+        while (job := await jobs.get()) is not None:
+            async for chunk in job.chunks():
+                yield chunk
+            slots.release()
+        # Surface errors raised by the text stream itself.
+        await feeder
+    finally:
+        feeder.cancel()
+        if job is not None:
+            job.cancel()
+        while not jobs.empty():
+            if (pending := jobs.get_nowait()) is not None:
+                pending.cancel()
@@ -0,0 +1,51 @@
+"""Pre-rendered phrase store for Kokoro TTS."""
+from __future__ import annotations
+
+import asyncio
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable
+
+# Phrases kept in memory per entity; the oldest rendered phrase is dropped first.
+MAX_PHRASES = 100
+
+# Pre-rendering never competes with live announcements for more than this many
+# server slots at once.
+PREFETCH_CONCURRENCY = 2
+
+
+class PhraseStore:
+    """Audio rendered ahead of time, served for exact payload matches.
+
+    Unlike the synthesis cache this is filled on purpose (warm phrases and the
+    kokoro_tts.prefetch service), lives in memory and is never evicted by
+    unrelated announcements.
+    """
+
+    def __init__(self, max_phrases: int = MAX_PHRASES) -> None:
+        """Initialize the store."""
+        self._phrases: OrderedDict[str, bytes] = OrderedDict()
+        self._max_phrases = max_phrases
+        self._semaphore = asyncio.Semaphore(PREFETCH_CONCURRENCY)
+
+    def __len__(self) -> int:
+        """Return the number of pre-rendered phrases."""
+        return len(self._phrases)
+
+    def get(self, key: str) -> bytes | None:
+        """Return pre-rendered audio for a payload key, if any."""
+        return self._phrases.get(key)
+
+    async def async_render(
+        self, key: str, fetch: Callable[[], Awaitable[bytes]]
+    ) -> None:
+        """Render and keep the audio for key unless it is already stored."""
+        if key in self._phrases:
+            self._phrases.move_to_end(key)
+            return
+        async with self._semaphore:
+            if key in self._phrases:
+                return
+            audio = await fetch()
+        self._phrases[key] = audio
+        while len(self._phrases) > self._max_phrases:
+            self._phrases.popitem(last=False)
@@ -0,0 +1,189 @@
+"""Streaming sample-rate conversion of Kokoro's 16-bit mono PCM."""
+from __future__ import annotations
+
+from array import array
+import logging
+from math import gcd
+import sys
+
+try:
+    import numpy as np
+except ImportError:  # Optional: linear interpolation is used instead.
+    np = None
+
+# Taps of the anti-aliasing filter per polyphase branch.
+TAPS_PER_PHASE = 24
+
+# Pass band edge as a fraction of the lower of the two Nyquist frequencies;
+# the transition band above it is what the taps have to fit.
+CUTOFF = 0.9
+
+# Kaiser window shape: about 80 dB of stop-band attenuation.
+KAISER_BETA = 8.0
+
+_BIG_ENDIAN = sys.byteorder == "big"
+
+_LOGGER = logging.getLogger(__name__)
+
+# Whether the missing-NumPy warning has been logged.
+_warned_linear = False
+
+
+class StreamingResampler:
+    """Convert a stream of 16-bit little-endian mono PCM to another rate.
+
+    Input may be cut anywhere, even inside a sample: filter history and the
+    output position carry over between feed() calls, so the chunks and
+    sentences of one reply resample as a single continuous signal.
+
+    With NumPy available this is a polyphase windowed-sinc filter, computed
+    in bulk per chunk. Without it, samples are linearly interpolated, which
+    is cheap enough in pure Python but does not filter aliasing out when
+    lowering the rate. Both are CPU-bound: call them from an executor.
+    """
+
+    def __init__(self, src_rate: int, dst_rate: int) -> None:
+        """Initialize the resampler."""
+        common = gcd(src_rate, dst_rate)
+        self._up = dst_rate // common
+        self._down = src_rate // common
+        self._odd_byte = b""
+        # Input samples received, samples run through the filter (including
+        # the silence flush() adds) and output samples emitted.
+        self._samples_in = 0
+        self._consumed = 0
+        self._samples_out = 0
+        if np is not None:
+            # The filter's delay is a whole number of output samples, which
+            # are skipped, so the output lines up with the input exactly.
+            delay = max(1, round(TAPS_PER_PHASE * self._up / 2 / self._down)) * self._down
+            self._phases = _polyphase_filter(self._up, self._down, delay)
+            self._taps = self._phases.shape[1]
+            self._history = np.zeros(self._taps - 1)
+            self._next = delay // self._down
+            self._flush_samples = delay // self._up + 2
+        else:
+            if not self.passthrough:
+                _warn_linear()
+            self._taps = 2
+            self._linear_history = array("h", [0])
+            self._next = 0
+            self._flush_samples = 1
+
+    @property
+    def passthrough(self) -> bool:
+        """Return True if input and output rates are the same."""
+        return self._up == self._down
+
+    def feed(self, data: bytes) -> bytes:
+        """Add PCM bytes and return the resampled PCM that is ready."""
+        if self.passthrough:
+            return data
+        data = self._odd_byte + data
+        usable = len(data) - len(data) % 2
+        self._odd_byte = data[usable:]
+        if not usable:
+            return b""
+        samples = data[:usable]
+        self._samples_in += usable // 2
+        return self._process(samples)
+
+    def flush(self) -> bytes:
+        """Return the samples still held in the filter once the input has ended."""
+        if self.passthrough:
+            return b""
+        self._odd_byte = b""
+        expected = -(-self._samples_in * self._up // self._down)
+        if np is not None:
+            tail = bytes(2 * self._flush_samples)
+        else:
+            # Repeat the last sample so the final positions have a neighbour.
+            tail = self._linear_history.tobytes() * self._flush_samples
+            if _BIG_ENDIAN:
+                swapped = array("h", tail)
+                swapped.byteswap()
+                tail = swapped.tobytes()
+        emitted = self._samples_out
+        out = self._process(tail)
+        # Drop what the padding produced beyond the length of the input.
+        return out[: max(0, expected - emitted) * 2]
+
+    def _process(self, samples: bytes) -> bytes:
+        """Resample whole samples with the available implementation."""
+        if np is not None:
+            out = self._process_numpy(samples)
+        else:
+            out = self._process_linear(samples)
+        self._consumed += len(samples) // 2
+        self._samples_out += len(out) // 2
+        return out
+
+    def _process_numpy(self, samples: bytes) -> bytes:
+        """Run the polyphase filter over new samples plus the kept history."""
+        x = np.concatenate((self._history, np.frombuffer(samples, "<i2")))
+        # Absolute index of x[0]: the history precedes the new samples.
+        first = self._consumed - (self._taps - 1)
+        end = first + len(x)
+        stop = (end * self._up - 1) // self._down + 1
+        self._history = x[len(x) - (self._taps - 1) :]
+        if stop <= self._next:
+            return b""
+        positions = np.arange(self._next, stop, dtype=np.int64) * self._down
+        self._next = stop
+        newest = positions // self._up - first
+        window = x[newest[:, None] - np.arange(self._taps)]
+        y = np.einsum("nk,nk->n", window, self._phases[positions % self._up])
+        return np.clip(np.rint(y), -32768, 32767).astype("<i2").tobytes()
+
+    def _process_linear(self, samples: bytes) -> bytes:
+        """Interpolate between neighbouring samples; the last one is kept."""
+        new = array("h", samples)
+        if _BIG_ENDIAN:
+            new.byteswap()
+        x = self._linear_history + new
+        first = self._consumed - 1
+        end = first + len(x)
+        # Output n needs input n * down // up and the sample after it.
+        stop = ((end - 1) * self._up - 1) // self._down + 1
+        up, down = self._up, self._down
+        out = array("h")
+        for n in range(self._next, stop):
+            position = n * down
+            index, phase = divmod(position, up)
+            index -= first
+            left = x[index]
+            out.append(left + (x[index + 1] - left) * phase // up)
+        self._next = max(self._next, stop)
+        self._linear_history = x[-1:]
+        if _BIG_ENDIAN:
+            out.byteswap()
+        return out.tobytes()
+
+
+def _warn_linear() -> None:
+    """Log once that rate conversion runs without an anti-aliasing filter."""
+    global _warned_linear  # noqa: PLW0603 - module-wide, once per process
+    if _warned_linear:
+        return
+    _warned_linear = True
+    _LOGGER.warning(
+        "NumPy is not installed: audio is resampled by linear interpolation, "
+        "which lets high frequencies alias when lowering the sample rate"
+    )
+
+
+def _polyphase_filter(up: int, down: int, delay: int) -> np.ndarray:
+    """Return a windowed-sinc low-pass split into (up, taps) polyphase branches.
+
+    The filter is centred on tap `delay`, at the upsampled rate.
+    """
+    length = 2 * delay + 1
+    taps = -(-length // up)
+    # Normalised to the upsampled rate, whose Nyquist is up times the input's.
+    cutoff = CUTOFF / 2 / max(up, down)
+    t = np.arange(length) - delay
+    h = 2 * cutoff * np.sinc(2 * cutoff * t) * np.kaiser(length, KAISER_BETA)
+    # Zero-stuffing divides the signal by up; the filter restores it.
+    h *= up / h.sum()
+    h = np.concatenate((h, np.zeros(taps * up - length)))
+    return h.reshape(taps, up).T.copy()
@@ -0,0 +1,314 @@
+"""Text segmentation for streamed Kokoro TTS synthesis."""
+from __future__ import annotations
+
+import re
+
+# A sentence ends on terminal punctuation followed by whitespace. Requiring the
+# trailing whitespace keeps decimals ("12.5") and mid-generation abbreviations
+# from being treated as sentence boundaries.
+SENTENCE_END_PATTERN = re.compile(r"[.!?…]+[\"'”’)\]]*\s+")
+
+# A clause ends on a comma, semicolon, colon or dash followed by whitespace.
+# As with sentences, the trailing whitespace keeps "1,000" and "12:30" intact.
+CLAUSE_END_PATTERN = re.compile(r"(?:[,;:—–]|\s-)[\"'”’)\]]*\s+")
+
+# Japanese and Chinese write no space after a sentence or clause, so their
+# full-width marks end one on their own. Latin marks still need whitespace.
+_FULL_WIDTH_CLOSERS = r"[\"'”’)\]」』）】》]*"
+CJK_SENTENCE_END_PATTERN = re.compile(
+    rf"[。！？]+{_FULL_WIDTH_CLOSERS}\s*|[.!?…]+{_FULL_WIDTH_CLOSERS}\s+"
+)
+CJK_CLAUSE_END_PATTERN = re.compile(
+    rf"[，、；：]{_FULL_WIDTH_CLOSERS}\s*|(?:[,;:—–]|\s-){_FULL_WIDTH_CLOSERS}\s+"
+)
+
+# Hindi ends sentences with the danda, usually but not always followed by a space.
+HINDI_SENTENCE_END_PATTERN = re.compile(r"[।॥]+[\"'”’)\]]*\s*|[.!?…]+[\"'”’)\]]*\s+")
+
+# Segmentation rules per API lang_code; other languages use the patterns above.
+SENTENCE_END_PATTERNS: dict[str, re.Pattern[str]] = {
+    "h": HINDI_SENTENCE_END_PATTERN,
+    "j": CJK_SENTENCE_END_PATTERN,
+    "z": CJK_SENTENCE_END_PATTERN,
+}
+CLAUSE_END_PATTERNS: dict[str, re.Pattern[str]] = {
+    "j": CJK_CLAUSE_END_PATTERN,
+    "z": CJK_CLAUSE_END_PATTERN,
+}
+
+
+# Full stops after these words do not end a sentence, per API lang_code.
+# Lowercase, without the final full stop.
+ABBREVIATIONS: dict[str, frozenset[str]] = {
+    "a": frozenset((
+        "mr", "mrs", "ms", "mx", "dr", "prof", "sr", "jr", "st", "mt", "vs",
+        "e.g", "i.e", "cf", "approx", "fig", "dept", "gen", "gov", "lt", "col",
+        "capt", "sgt", "rev", "hon",
+    )),
+    "e": frozenset((
+        "sr", "sra", "srta", "dr", "dra", "d", "dña", "ud", "uds", "prof",
+        "p.ej", "cf", "aprox", "núm",
+    )),
+    "f": frozenset((
+        "m", "mme", "mlle", "mm", "dr", "pr", "st", "ste", "p.ex", "cf", "env",
+    )),
+    "i": frozenset(("sig", "sigg", "sig.ra", "dott", "prof", "ing", "avv", "es", "cfr")),
+    "p": frozenset(("sr", "sra", "dr", "dra", "prof", "ex", "cf", "aprox")),
+}
+ABBREVIATIONS["b"] = ABBREVIATIONS["a"]
+
+# Abbreviations that often close a sentence as well: their full stop ends one
+# only when the next word starts with a capital ("... and so on, etc. Then").
+FINAL_ABBREVIATIONS: dict[str, frozenset[str]] = {
+    "a": frozenset(("etc", "no", "inc", "ltd", "co", "corp", "a.m", "p.m")),
+    "e": frozenset(("etc",)),
+    "f": frozenset(("etc",)),
+    "i": frozenset(("ecc",)),
+    "p": frozenset(("etc",)),
+}
+FINAL_ABBREVIATIONS["b"] = FINAL_ABBREVIATIONS["a"]
+
+# Words longer than this are never looked up as abbreviations.
+_MAX_ABBREVIATION = 8
+
+# At most this much of the last word is carried into the next scan.
+_MAX_CARRY = 64
+
+_OPENERS = "\"'“‘(["
+
+
+class SentenceScanner:
+    """Find sentence boundaries in streamed text, scanning each character once.
+
+    Each feed() only scans the new text plus the word it continues, so the
+    cost per token stays constant however long the sentence being written
+    gets. The unterminated sentence is kept as a list of pieces and joined
+    once, when it completes.
+
+    Boundaries follow the rules of the language: Japanese, Chinese and Hindi
+    sentences end on their own punctuation ("。", "！", "।") without a space.
+    A full stop after a known abbreviation of the language ("Mr.", "e.g.")
+    is not a boundary. After one that may also end a sentence ("etc."), the
+    decision waits for the first letter of the next word.
+    """
+
+    def __init__(self, lang_code: str | None = None) -> None:
+        """Initialize the scanner for an API lang_code; None means English."""
+        code = lang_code or "a"
+        self._sentence_end = SENTENCE_END_PATTERNS.get(code, SENTENCE_END_PATTERN)
+        # Read by AdaptiveSegmenter to cut its first chunk at a clause.
+        self.clause_end = CLAUSE_END_PATTERNS.get(code, CLAUSE_END_PATTERN)
+        self._abbreviations = ABBREVIATIONS.get(code, frozenset())
+        self._final_abbreviations = FINAL_ABBREVIATIONS.get(code, frozenset())
+        # The unterminated sentence: _parts, then _carry, which is rescanned
+        # with the next text because a boundary may still form in it.
+        self._parts: list[str] = []
+        self._parts_chars = 0
+        self._carry = ""
+        # What the last feed() left pending; the only text cut_clause() scans.
+        self._recent = ""
+
+    @property
+    def pending(self) -> str:
+        """Return the text not yet terminated by a sentence boundary."""
+        return "".join(self._parts) + self._carry
+
+    def feed(self, text: str) -> list[str]:
+        """Add streamed text and return the sentences it completes."""
+        window = self._carry + text
+        sentences: list[str] = []
+        start = 0
+        undecided: int | None = None
+        for match in self._sentence_end.finditer(window):
+            ends = self._ends_sentence(window, match)
+            if ends is None:
+                undecided = max(start, _word_start(window, match.start()))
+                break
+            if ends:
+                self._parts.append(window[start : match.end()])
+                sentence = "".join(self._parts).strip()
+                self._parts = []
+                self._parts_chars = 0
+                if sentence:
+                    sentences.append(sentence)
+                start = match.end()
+
+        rest = window[start:]
+        carry_from = _last_word_start(rest) if undecided is None else undecided - start
+        if carry_from:
+            self._parts.append(rest[:carry_from])
+            self._parts_chars += carry_from
+        self._carry = rest[carry_from:]
+        self._recent = rest
+        return sentences
+
+    def flush(self) -> str:
+        """Return the unterminated text and start over."""
+        pending = self.pending
+        self._parts = []
+        self._parts_chars = 0
+        self._carry = self._recent = ""
+        return pending
+
+    def cut_clause(self, min_chars: int) -> str | None:
+        """Remove and return the pending text up to its first clause end.
+
+        The clause must be at least min_chars long and followed by more text.
+        """
+        recent = self._recent
+        offset = self._parts_chars + len(self._carry) - len(recent)
+        end = len(recent.rstrip())
+        for match in self.clause_end.finditer(
+            recent, max(0, min_chars - offset)
+        ):
+            if match.end() < end:
+                break
+        else:
+            return None
+        pending = self.flush()
+        cut = offset + match.end()
+        # The rest holds no boundary a feed() has not already ruled out.
+        self.feed(pending[cut:])
+        return pending[:cut].strip()
+
+    def _ends_sentence(self, window: str, match: re.Match[str]) -> bool | None:
+        """Return whether a match ends a sentence; None until the next word is seen."""
+        if match.end() == len(window) and not window[-1].isspace():
+            # Closing quotes or brackets may still follow a full-width mark.
+            return None
+        if window[match.start()] != "." or window.startswith("..", match.start()):
+            return True
+        word_start = _word_start(window, match.start())
+        if match.start() - word_start > _MAX_ABBREVIATION:
+            return True
+        word = window[word_start : match.start()].lstrip(_OPENERS)
+        key = word.lower()
+        if key in self._abbreviations or (len(word) == 1 and word.isupper() and word != "I"):
+            # Titles, "e.g." and initials ("J. R. R. Tolkien").
+            return False
+        if key not in self._final_abbreviations:
+            return True
+        following = window[match.end() :].lstrip(_OPENERS)
+        if not following:
+            return None
+        return following[0].isupper()
+
+
+def _word_start(text: str, end: int) -> int:
+    """Return where the word ending at end starts, looking back a short way."""
+    start = end
+    while start and end - start <= _MAX_ABBREVIATION and not text[start - 1].isspace():
+        start -= 1
+    return start
+
+
+def _last_word_start(text: str) -> int:
+    """Return where the last word of text starts; trailing whitespace is kept with it."""
+    end = len(text.rstrip())
+    start = end
+    while start and end - start < _MAX_CARRY and not text[start - 1].isspace():
+        start -= 1
+    return start
+
+
+def split_sentences(buffer: str, lang_code: str | None = None) -> tuple[list[str], str]:
+    """Split a text buffer into complete sentences plus a trailing remainder.
+
+    The remainder is text that has not yet been terminated by punctuation; it is
+    kept in the buffer until more text arrives, or flushed when the stream ends.
+    """
+    scanner = SentenceScanner(lang_code)
+    sentences = scanner.feed(buffer)
+    return sentences, scanner.flush()
+
+
+def count_sentences(text: str, lang_code: str | None = None) -> int:
+    """Return how many sentences text holds, counting an unterminated tail."""
+    sentences, remainder = split_sentences(text, lang_code)
+    return len(sentences) + (1 if remainder.strip() else 0)
+
+
+def _clause_cut(text: str, min_chars: int, pattern: re.Pattern[str]) -> int | None:
+    """Return the end of the first clause at least min_chars long, if any."""
+    for match in pattern.finditer(text, min_chars):
+        if match.end() < len(text.rstrip()):
+            return match.end()
+    return None
+
+
+class AdaptiveSegmenter:
+    """Turn streamed text into synthesis chunks sized for latency, then throughput.
+
+    The first chunk is cut at a clause boundary as soon as it is at least
+    `first_chunk_chars` long, so the first audio does not wait for a long
+    opening sentence to be generated and synthesised. Every later chunk gathers
+    whole sentences until it is at least `merge_chars` long, so replies like
+    "Done. Anything else?" cost one request instead of two. Either behaviour is
+    disabled by setting its threshold to 0.
+    """
+
+    def __init__(
+        self, first_chunk_chars: int, merge_chars: int, lang_code: str | None = None
+    ) -> None:
+        """Initialize the segmenter for the language the text is written in."""
+        self._first_chunk_chars = first_chunk_chars
+        self._merge_chars = merge_chars
+        self._scanner = SentenceScanner(lang_code)
+        self._started = False
+        self._pending: list[str] = []
+        self._pending_chars = 0
+
+    def feed(self, text: str) -> list[str]:
+        """Add streamed text and return the chunks that are ready."""
+        sentences = self._scanner.feed(text)
+        chunks: list[str] = []
+
+        if not self._started:
+            first = self._take_first_chunk(sentences)
+            if first is None:
+                return chunks
+            chunks.append(first)
+            self._started = True
+
+        for sentence in sentences:
+            chunks.extend(self._merge(sentence))
+        return chunks
+
+    def flush(self) -> list[str]:
+        """Return everything still held back once the text stream has ended."""
+        # The last sentence often has no trailing whitespace.
+        tail = self._scanner.flush().strip()
+        if tail:
+            self._pending.append(tail)
+        chunks = [" ".join(self._pending)] if self._pending else []
+        self._pending = []
+        self._pending_chars = 0
+        return chunks
+
+    def _take_first_chunk(self, sentences: list[str]) -> str | None:
+        """Remove and return the opening chunk, or None if it is not ready yet."""
+        if sentences:
+            head = sentences[0]
+            cut = (
+                _clause_cut(head, self._first_chunk_chars, self._scanner.clause_end)
+                if self._first_chunk_chars
+                else None
+            )
+            if cut is None:
+                return sentences.pop(0)
+            sentences[0] = head[cut:].strip()
+            return head[:cut].strip()
+        if self._first_chunk_chars:
+            return self._scanner.cut_clause(self._first_chunk_chars)
+        return None
+
+    def _merge(self, sentence: str) -> list[str]:
+        """Hold a sentence back until enough text has gathered to send."""
+        self._pending.append(sentence)
+        self._pending_chars += len(sentence)
+        if self._pending_chars < self._merge_chars:
+            return []
+        chunk = " ".join(self._pending)
+        self._pending = []
+        self._pending_chars = 0
+        return [chunk]
@@ -0,0 +1,168 @@
+"""Latency and throughput sensors for Kokoro TTS."""
+from __future__ import annotations
+
+from collections.abc import Callable
+from dataclasses import dataclass
+from datetime import timedelta
+from typing import Any
+
+from homeassistant.components.sensor import (
+    SensorDeviceClass,
+    SensorEntity,
+    SensorEntityDescription,
+    SensorStateClass,
+)
+from homeassistant.const import (
+    PERCENTAGE,
+    EntityCategory,
+    UnitOfDataRate,
+    UnitOfInformation,
+    UnitOfTime,
+)
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.device_registry import DeviceEntryType, DeviceInfo
+from homeassistant.helpers.entity_platform import AddEntitiesCallback
+from homeassistant.helpers.typing import StateType
+
+from . import KokoroConfigEntry, KokoroData
+from .const import DOMAIN
+
+# The metrics are rolling windows updated by every request; polling them keeps
+# state writes bounded no matter how many sentences are being synthesised.
+SCAN_INTERVAL = timedelta(seconds=10)
+
+
+def _ms(seconds: float | None) -> float | None:
+    """Convert seconds to milliseconds, keeping None."""
+    return None if seconds is None else seconds * 1000
+
+
+@dataclass(frozen=True, kw_only=True)
+class KokoroSensorEntityDescription(SensorEntityDescription):
+    """Describes a Kokoro TTS metrics sensor."""
+
+    value_fn: Callable[[KokoroData], StateType]
+    attributes_fn: Callable[[KokoroData], dict[str, Any]] | None = None
+
+
+_LATENCY = {
+    "device_class": SensorDeviceClass.DURATION,
+    "native_unit_of_measurement": UnitOfTime.MILLISECONDS,
+    "state_class": SensorStateClass.MEASUREMENT,
+    "suggested_display_precision": 0,
+}
+
+SENSORS: tuple[KokoroSensorEntityDescription, ...] = (
+    KokoroSensorEntityDescription(
+        key="ttfb_p50",
+        translation_key="ttfb_p50",
+        value_fn=lambda data: _ms(data.metrics.ttfb.percentile(50)),
+        **_LATENCY,
+    ),
+    KokoroSensorEntityDescription(
+        key="ttfb_p95",
+        translation_key="ttfb_p95",
+        value_fn=lambda data: _ms(data.metrics.ttfb.percentile(95)),
+        **_LATENCY,
+    ),
+    KokoroSensorEntityDescription(
+        key="ttfa_p50",
+        translation_key="ttfa_p50",
+        value_fn=lambda data: _ms(data.metrics.ttfa.percentile(50)),
+        **_LATENCY,
+    ),
+    KokoroSensorEntityDescription(
+        key="ttfa_p95",
+        translation_key="ttfa_p95",
+        value_fn=lambda data: _ms(data.metrics.ttfa.percentile(95)),
+        **_LATENCY,
+    ),
+    KokoroSensorEntityDescription(
+        key="sentence_time",
+        translation_key="sentence_time",
+        value_fn=lambda data: _ms(data.metrics.sentence_time.percentile(50)),
+        **_LATENCY,
+    ),
+    KokoroSensorEntityDescription(
+        key="throughput",
+        translation_key="throughput",
+        device_class=SensorDeviceClass.DATA_RATE,
+        native_unit_of_measurement=UnitOfDataRate.BYTES_PER_SECOND,
+        state_class=SensorStateClass.MEASUREMENT,
+        suggested_display_precision=0,
+        value_fn=lambda data: data.metrics.bytes_per_second,
+    ),
+    KokoroSensorEntityDescription(
+        key="bytes_per_request",
+        translation_key="bytes_per_request",
+        device_class=SensorDeviceClass.DATA_SIZE,
+        native_unit_of_measurement=UnitOfInformation.BYTES,
+        state_class=SensorStateClass.MEASUREMENT,
+        suggested_display_precision=0,
+        value_fn=lambda data: data.metrics.request_bytes.mean(),
+    ),
+    KokoroSensorEntityDescription(
+        key="in_flight",
+        translation_key="in_flight",
+        state_class=SensorStateClass.MEASUREMENT,
+        value_fn=lambda data: sum(
+            backend.in_flight for backend in data.backends.backends
+        ),
+    ),
+    KokoroSensorEntityDescription(
+        key="error_rate",
+        translation_key="error_rate",
+        native_unit_of_measurement=PERCENTAGE,
+        state_class=SensorStateClass.MEASUREMENT,
+        suggested_display_precision=1,
+        value_fn=lambda data: data.metrics.error_rate,
+        attributes_fn=lambda data: data.metrics.errors_by_status,
+    ),
+)
+
+
+async def async_setup_entry(
+    hass: HomeAssistant,
+    config_entry: KokoroConfigEntry,
+    async_add_entities: AddEntitiesCallback,
+) -> None:
+    """Set up the metrics sensors of a config entry."""
+    async_add_entities(
+        KokoroMetricSensor(config_entry, description) for description in SENSORS
+    )
+
+
+class KokoroMetricSensor(SensorEntity):
+    """One rolling-window metric of a Kokoro TTS config entry."""
+
+    entity_description: KokoroSensorEntityDescription
+    _attr_has_entity_name = True
+    _attr_entity_category = EntityCategory.DIAGNOSTIC
+
+    def __init__(
+        self,
+        config_entry: KokoroConfigEntry,
+        description: KokoroSensorEntityDescription,
+    ) -> None:
+        """Initialize the sensor."""
+        self.entity_description = description
+        self._data = config_entry.runtime_data
+        self._attr_unique_id = f"{config_entry.entry_id}_{description.key}"
+        self._attr_device_info = DeviceInfo(
+            identifiers={(DOMAIN, config_entry.entry_id)},
+            name=config_entry.title,
+            manufacturer="Kokoro",
+            entry_type=DeviceEntryType.SERVICE,
+        )
+
+    @property
+    def native_value(self) -> StateType:
+        """Return the current value of the metric."""
+        return self.entity_description.value_fn(self._data)
+
+    @property
+    def extra_state_attributes(self) -> dict[str, Any] | None:
+        """Return metric details, such as failures by HTTP status."""
+        if self.entity_description.attributes_fn is None:
+            return None
+        return self.entity_description.attributes_fn(self._data)
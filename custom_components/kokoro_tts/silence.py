@@ -0,0 +1,102 @@
+"""Trimming of silence in streamed 16-bit mono PCM."""
+from __future__ import annotations
+
+from array import array
+from collections import deque
+import math
+import sys
+
+try:
+    import numpy as np
+except ImportError:  # Optional: levels are then summed in pure Python.
+    np = None
+
+# Frames quieter than this RMS level, about -50 dBFS, count as silence.
+SILENCE_RMS = 100.0
+
+# Length of the frames the level is measured over.
+FRAME_MS = 10
+
+# Silence kept in front of the first sound, so its onset is not clipped.
+LEAD_IN_MS = 20
+
+_BIG_ENDIAN = sys.byteorder == "big"
+
+
+class SilenceTrimmer:
+    """Drop leading silence and cap pauses in a stream of PCM.
+
+    Audio is measured in 10 ms frames. Sound passes straight through; silent
+    frames are held back, and only the last max_pause_ms of them are played
+    once sound resumes. Kokoro pads every sentence with silence at both ends,
+    so streamed sentences otherwise meet with a long pause. Before the first
+    sound only LEAD_IN_MS is kept. Nothing audible is delayed by more than
+    one frame. CPU-bound: call it from an executor.
+    """
+
+    def __init__(self, sample_rate: int, max_pause_ms: int) -> None:
+        """Initialize the trimmer."""
+        self._frame_samples = max(1, sample_rate * FRAME_MS // 1000)
+        self._max_pause_frames = max(1, max_pause_ms // FRAME_MS)
+        self._partial = b""
+        self._held: deque[bytes] = deque(maxlen=max(1, LEAD_IN_MS // FRAME_MS))
+        self._started = False
+        self.dropped_frames = 0
+
+    @property
+    def dropped_ms(self) -> int:
+        """Return how much silence has been left out so far."""
+        return self.dropped_frames * FRAME_MS
+
+    def feed(self, data: bytes) -> bytes:
+        """Add PCM bytes and return the audio that is ready."""
+        data = self._partial + data
+        frame_bytes = 2 * self._frame_samples
+        usable = len(data) - len(data) % frame_bytes
+        self._partial = data[usable:]
+        if not usable:
+            return b""
+        out: list[bytes] = []
+        held = self._held
+        for start, silent in zip(
+            range(0, usable, frame_bytes), _silent_frames(data[:usable], self._frame_samples)
+        ):
+            frame = data[start : start + frame_bytes]
+            if silent:
+                if len(held) == held.maxlen:
+                    self.dropped_frames += 1
+                held.append(frame)
+                continue
+            if not self._started:
+                self._started = True
+                held = self._held = deque(held, maxlen=self._max_pause_frames)
+            out.extend(held)
+            held.clear()
+            out.append(frame)
+        return b"".join(out)
+
+    def flush(self) -> bytes:
+        """Return the held silence and the last partial frame."""
+        tail = b"".join(self._held) + self._partial
+        self._held.clear()
+        self._partial = b""
+        return tail
+
+
+def _silent_frames(data: bytes, frame_samples: int) -> list[bool]:
+    """Return, for each whole frame of data, whether its RMS level is below SILENCE_RMS."""
+    if np is not None:
+        frames = np.frombuffer(data, "<i2").astype(np.float32).reshape(-1, frame_samples)
+        rms = np.sqrt(np.mean(np.square(frames), axis=1))
+        return (rms < SILENCE_RMS).tolist()
+    samples = array("h", data)
+    if _BIG_ENDIAN:
+        samples.byteswap()
+    threshold = SILENCE_RMS * SILENCE_RMS * frame_samples
+    return [
+        math.sumprod(frame, frame) < threshold
+        for frame in (
+            samples[start : start + frame_samples]
+            for start in range(0, len(samples), frame_samples)
+        )
+    ]
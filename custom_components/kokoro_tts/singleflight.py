@@ -0,0 +1,162 @@
+"""Coalescing of identical in-flight Kokoro TTS synthesis requests."""
+from __future__ import annotations
+
+import asyncio
+from collections.abc import AsyncGenerator, AsyncIterator, Awaitable, Callable, Hashable
+from dataclasses import dataclass, field
+
+# Chunks the slowest caller of a shared stream may fall behind before the
+# upstream response stops being read, leaving TCP backpressure to pause the
+# server as it would for a single caller.
+MAX_LAG_CHUNKS = 8
+
+
+@dataclass
+class _Call:
+    """One upstream request and the callers waiting for its audio."""
+
+    task: asyncio.Task[bytes]
+    waiters: int = 0
+
+
+@dataclass
+class _Stream:
+    """One upstream streamed request and the audio it has produced so far."""
+
+    chunks: list[bytes] = field(default_factory=list)
+    done: bool = False
+    error: Exception | None = None
+    changed: asyncio.Event = field(default_factory=asyncio.Event)
+    task: asyncio.Task[None] | None = None
+    waiters: int = 0
+    # Index of the next chunk of each caller, and an event set when one moves.
+    cursors: dict[object, int] = field(default_factory=dict)
+    advanced: asyncio.Event = field(default_factory=asyncio.Event)
+
+
+class SingleFlight:
+    """Share one upstream synthesis between concurrent identical requests.
+
+    Requests are keyed by their payload key, so announcing the same message on
+    several media players at once costs the server one synthesis. One-shot
+    keys also carry the request's priority, so a live announcement never
+    joins a prefetch queued behind live traffic. The upstream request runs in
+    its own task: a caller that is cancelled simply stops waiting, and the
+    request is only aborted once every caller has gone.
+    Finished requests are forgotten immediately; repeats are the synthesis
+    cache's job.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the coalescer."""
+        self._calls: dict[Hashable, _Call] = {}
+        self._streams: dict[str, _Stream] = {}
+        self.coalesced = 0
+
+    async def async_do(self, key: Hashable, fetch: Callable[[], Awaitable[bytes]]) -> bytes:
+        """Return fetch()'s audio, sharing a request already in flight for key."""
+        call = self._calls.get(key)
+        if call is None:
+            call = _Call(asyncio.ensure_future(fetch()))
+            self._calls[key] = call
+            call.task.add_done_callback(lambda task: self._call_done(key, call, task))
+        else:
+            self.coalesced += 1
+
+        call.waiters += 1
+        try:
+            return await asyncio.shield(call.task)
+        finally:
+            call.waiters -= 1
+            if not call.waiters and not call.task.done():
+                self._forget(self._calls, key, call)
+                call.task.cancel()
+
+    async def async_stream(
+        self, key: str, produce: Callable[[], AsyncGenerator[bytes]]
+    ) -> AsyncIterator[bytes]:
+        """Yield produce()'s audio, sharing a stream already in flight for key.
+
+        A caller joining late first receives every chunk produced so far. The
+        upstream response is read ahead of the callers by at most
+        MAX_LAG_CHUNKS past the slowest of them, so a stream nobody is playing
+        is paused at the server instead of buffered in memory.
+        """
+        stream = self._streams.get(key)
+        if stream is None:
+            stream = _Stream()
+            stream.task = asyncio.create_task(self._async_pump(stream, produce()))
+            self._streams[key] = stream
+            stream.task.add_done_callback(
+                lambda _: self._forget(self._streams, key, stream)
+            )
+        else:
+            self.coalesced += 1
+
+        stream.waiters += 1
+        cursor = object()
+        stream.cursors[cursor] = index = 0
+        try:
+            while True:
+                changed = stream.changed
+                if index < len(stream.chunks):
+                    index += 1
+                    stream.cursors[cursor] = index
+                    self._wake_pump(stream)
+                    yield stream.chunks[index - 1]
+                    continue
+                if stream.done:
+                    break
+                await changed.wait()
+            if stream.error is not None:
+                raise stream.error
+        finally:
+            stream.waiters -= 1
+            del stream.cursors[cursor]
+            self._wake_pump(stream)
+            if not stream.waiters and stream.task is not None and not stream.task.done():
+                self._forget(self._streams, key, stream)
+                stream.task.cancel()
+
+    def _call_done(self, key: Hashable, call: _Call, task: asyncio.Task[bytes]) -> None:
+        """Forget a finished call; its callers re-raise any error themselves."""
+        self._forget(self._calls, key, call)
+        if not task.cancelled():
+            # Mark the error retrieved even if every caller has already left.
+            task.exception()
+
+    @staticmethod
+    def _wake_pump(stream: _Stream) -> None:
+        """Tell a paused pump that a caller has moved on or left."""
+        stream.advanced.set()
+        stream.advanced = asyncio.Event()
+
+    @staticmethod
+    async def _async_pump(stream: _Stream, audio: AsyncGenerator[bytes]) -> None:
+        """Read the upstream audio into the shared stream, waking every caller.
+
+        Reading pauses while the slowest caller is MAX_LAG_CHUNKS behind.
+        """
+        try:
+            async for chunk in audio:
+                stream.chunks.append(chunk)
+                stream.changed.set()
+                stream.changed = asyncio.Event()
+                while (
+                    stream.cursors
+                    and len(stream.chunks) - min(stream.cursors.values()) >= MAX_LAG_CHUNKS
+                ):
+                    await stream.advanced.wait()
+        except Exception as err:  # noqa: BLE001 - re-raised in async_stream()
+            stream.error = err
+        finally:
+            stream.done = True
+            stream.changed.set()
+            # Release the backend slot even when every caller has gone.
+            await audio.aclose()
+
+    @staticmethod
+    def _forget(flights: dict, key: Hashable, flight: _Call | _Stream) -> None:
+        """Drop a finished or abandoned flight so new requests start afresh."""
+        if flights.get(key) is flight:
+            del flights[key]
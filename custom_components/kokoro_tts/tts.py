@@ -5,9 +5,12 @@ from collections.abc import AsyncGenerator
 from typing import Any
 
 import aiohttp
+import asyncio
 import base64
 import logging
-import re
+import time
+
+import voluptuous as vol
 
 from homeassistant.components.tts.entity import (
     TextToSpeechEntity,
@@ -15,68 +18,116 @@ from homeassistant.components.tts.entity import (
     TTSAudioResponse,
     TtsAudioType,
 )
-from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
-
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.exceptions import ServiceValidationError
+from homeassistant.helpers import config_validation as cv, entity_platform
+
+from . import KokoroConfigEntry
+from .admission import (
+    BUSY_STATUSES,
+    MAX_RETRY_AFTER,
+    BackendBusyError,
+    Priority,
+    parse_retry_after,
+)
+from .audio import (
+    JOINABLE_FORMATS,
+    KOKORO_SAMPLE_RATE,
+    join_audio,
+    resample_audio,
+    streaming_wav_header,
+)
+from .backends import BackendPool, BackendServerError
+from .cache import SynthesisCache, payload_key
 from .const import (
-    CONF_BASE_URL,
     CONF_API_KEY,
+    CONF_FIRST_CHUNK_CHARS,
     CONF_FORMAT,
+    CONF_HEDGE_REQUESTS,
     CONF_LANGUAGE,
+    CONF_MAX_PAUSE_MS,
+    CONF_MERGE_CHARS,
     CONF_MODEL,
+    CONF_PARALLEL_WORKERS,
     CONF_PERSONA,
     CONF_SAMPLE_RATE,
     CONF_SPEED,
+    CONF_STREAM_LOOKAHEAD,
+    CONF_WARM_PHRASES,
     DEFAULT_API_KEY,
+    DEFAULT_FIRST_CHUNK_CHARS,
     DEFAULT_FORMAT,
     DEFAULT_HA_LANGUAGE,
+    DEFAULT_HEDGE_REQUESTS,
+    DEFAULT_MAX_PAUSE_MS,
+    DEFAULT_MERGE_CHARS,
     DEFAULT_MODEL,
+    DEFAULT_PARALLEL_WORKERS,
     DEFAULT_SAMPLE_RATE,
     DEFAULT_SPEED,
     DEFAULT_STREAM_FORMAT,
+    DEFAULT_STREAM_LOOKAHEAD,
     DEFAULT_VOLUME_MULTIPLIER,
     DOMAIN,
     LANGUAGE_CODE_MAP,
     LANGUAGE_HA_CODE_MAP,
+    MAX_SAMPLE_RATE,
+    MIN_SAMPLE_RATE,
+    PCM_STREAM_FORMATS,
+    RESAMPLED_FORMATS,
     STREAM_SAFE_FORMATS,
     SUPPORTED_LANGUAGES,
 )
+from .coordinator import KokoroCatalogCoordinator
+from .hedging import Hedger
+from .metrics import KokoroMetrics
+from .mp3 import Mp3FrameFilter
+from .normalizer import TextNormalizer
+from .ogg import OggOpusRemuxer
+from .pipeline import async_ordered_lookahead
+from .prefetch import PhraseStore
+from .resample import StreamingResampler
+from .segmenter import AdaptiveSegmenter, count_sentences
+from .silence import SilenceTrimmer
+from .singleflight import SingleFlight
+from .voices import STATIC_CATALOG, blend_voices
 
 _LOGGER = logging.getLogger(__name__)
 
 # Per-call TTS options exposed to HA services
-SUPPORTED_OPTIONS = ["persona", "speed", "format", "sample_rate", "volume_multiplier"]
+SUPPORTED_OPTIONS = [
+    "persona",
+    "model",
+    "speed",
+    "format",
+    "sample_rate",
+    "volume_multiplier",
+]
 
 # Default entity name
 DEFAULT_NAME = "kokoro"
 
+# Entity service that renders a phrase ahead of time
+SERVICE_PREFETCH = "prefetch"
+
 # Size of the audio chunks yielded while streaming a sentence.
 STREAM_CHUNK_BYTES = 4096
 
-# A sentence ends on terminal punctuation followed by whitespace. Requiring the
-# trailing whitespace keeps decimals ("12.5") and mid-generation abbreviations
-# from being treated as sentence boundaries.
-SENTENCE_END_PATTERN = re.compile(r"[.!?…]+[\"'”’)\]]*\s+")
-
+# One-shot messages at least this long are synthesised as concurrent segments
+# of roughly PARALLEL_SEGMENT_CHARS each, then joined back into one file.
+PARALLEL_MIN_CHARS = 300
+PARALLEL_SEGMENT_CHARS = 150
 
-def split_sentences(buffer: str) -> tuple[list[str], str]:
-    """Split a text buffer into complete sentences plus a trailing remainder.
+# Times a request refused with 429/503 is queued again before the error is raised.
+BUSY_RETRIES = 3
 
-    The remainder is text that has not yet been terminated by punctuation; it is
-    kept in the buffer until more text arrives, or flushed when the stream ends.
-    """
-    sentences: list[str] = []
-    last_end = 0
-    for match in SENTENCE_END_PATTERN.finditer(buffer):
-        sentence = buffer[last_end : match.end()].strip()
-        if sentence:
-            sentences.append(sentence)
-        last_end = match.end()
-    return sentences, buffer[last_end:]
+# No total timeout while streaming: the generator lives as long as the agent is
+# talking, so only connecting and each individual read are bounded.
+STREAM_TIMEOUT = aiohttp.ClientTimeout(total=None, connect=10, sock_read=60)
 
 
 async def async_setup_entry(
-    hass: HomeAssistant, config_entry: ConfigEntry, async_add_entities: Any
+    hass: HomeAssistant, config_entry: KokoroConfigEntry, async_add_entities: Any
 ) -> None:
     """Set up TTS platform via config entry."""
     config_data = config_entry.data
@@ -86,7 +137,6 @@ async def async_setup_entry(
     merged = {**config_data, **options}
 
     name = merged.get("name", DEFAULT_NAME)
-    base_url = merged[CONF_BASE_URL].rstrip("/")
     api_key = merged.get(CONF_API_KEY, DEFAULT_API_KEY) or DEFAULT_API_KEY
     model = merged.get(CONF_MODEL, DEFAULT_MODEL)
     persona = merged.get(CONF_PERSONA)
@@ -94,10 +144,21 @@ async def async_setup_entry(
     fmt = (merged.get(CONF_FORMAT, DEFAULT_FORMAT) or DEFAULT_FORMAT).lower()
     sample_rate = int(merged.get(CONF_SAMPLE_RATE, DEFAULT_SAMPLE_RATE))
     language = merged.get(CONF_LANGUAGE)
+    lookahead = int(merged.get(CONF_STREAM_LOOKAHEAD, DEFAULT_STREAM_LOOKAHEAD))
+    first_chunk_chars = int(merged.get(CONF_FIRST_CHUNK_CHARS, DEFAULT_FIRST_CHUNK_CHARS))
+    merge_chars = int(merged.get(CONF_MERGE_CHARS, DEFAULT_MERGE_CHARS))
+    max_pause_ms = int(merged.get(CONF_MAX_PAUSE_MS, DEFAULT_MAX_PAUSE_MS))
+    parallel_workers = int(merged.get(CONF_PARALLEL_WORKERS, DEFAULT_PARALLEL_WORKERS))
+    hedging = bool(merged.get(CONF_HEDGE_REQUESTS, DEFAULT_HEDGE_REQUESTS))
+    warm_phrases = [
+        phrase.strip() for phrase in merged.get(CONF_WARM_PHRASES) or [] if phrase.strip()
+    ]
 
     entity = KokoroTTSEntity(
+        backends=config_entry.runtime_data.backends,
+        cache=config_entry.runtime_data.cache,
+        metrics=config_entry.runtime_data.metrics,
         name=name,
-        base_url=base_url,
         api_key=api_key,
         model=model,
         persona=persona,
@@ -105,17 +166,35 @@ async def async_setup_entry(
         fmt=fmt,
         sample_rate=sample_rate,
         language=language,
+        lookahead=lookahead,
+        first_chunk_chars=first_chunk_chars,
+        merge_chars=merge_chars,
+        max_pause_ms=max_pause_ms,
+        parallel_workers=parallel_workers,
+        warm_phrases=warm_phrases,
+        hedging=hedging,
+        catalog=config_entry.runtime_data.catalog,
     )
     async_add_entities([entity])
 
+    platform = entity_platform.async_get_current_platform()
+    platform.async_register_entity_service(
+        SERVICE_PREFETCH,
+        {
+            vol.Required("message"): cv.string,
+            vol.Optional("options", default={}): dict,
+        },
+        "async_prefetch",
+    )
+
 
 class KokoroTTSEntity(TextToSpeechEntity):
     """Kokoro TTS Entity - generates speech via a Kokoro FastAPI server."""
 
     def __init__(
         self,
+        backends: BackendPool,
         name: str,
-        base_url: str,
         api_key: str,
         model: str,
         persona: str | None,
@@ -123,12 +202,24 @@ class KokoroTTSEntity(TextToSpeechEntity):
         fmt: str,
         sample_rate: int,
         language: str | None = None,
+        lookahead: int = DEFAULT_STREAM_LOOKAHEAD,
+        first_chunk_chars: int = DEFAULT_FIRST_CHUNK_CHARS,
+        merge_chars: int = DEFAULT_MERGE_CHARS,
+        max_pause_ms: int = DEFAULT_MAX_PAUSE_MS,
+        parallel_workers: int = DEFAULT_PARALLEL_WORKERS,
+        cache: SynthesisCache | None = None,
+        warm_phrases: list[str] | None = None,
+        metrics: KokoroMetrics | None = None,
+        hedging: bool = False,
+        catalog: KokoroCatalogCoordinator | None = None,
     ) -> None:
         """Initialize the TTS entity."""
         super().__init__()
         self._attr_name = name
         self._attr_unique_id = f"kokoro_tts_{name}"
-        self._base_url = base_url
+        # Servers owned by the config entry (see __init__.py); every request,
+        # including each streamed sentence, is routed through them.
+        self._backends = backends
         self._api_key = api_key
         self._model = model
         self._persona = persona
@@ -136,6 +227,24 @@ class KokoroTTSEntity(TextToSpeechEntity):
         self._fmt = fmt
         self._sample_rate = sample_rate
         self._language = language
+        self._lookahead = max(0, lookahead)
+        self._first_chunk_chars = max(0, first_chunk_chars)
+        self._merge_chars = max(0, merge_chars)
+        self._max_pause_ms = max(0, max_pause_ms)
+        self._parallel_workers = max(1, parallel_workers)
+        self._cache = cache
+        self._phrases = PhraseStore()
+        self._inflight = SingleFlight()
+        self._metrics = metrics or KokoroMetrics()
+        self._warm_phrases = warm_phrases or []
+        self._catalog = catalog
+        self._hedger: Hedger | None = None
+        if hedging:
+            self._hedger = Hedger(
+                self._metrics.stream_first_audio,
+                self._metrics.one_shot_time,
+                backends.has_free_slot,
+            )
 
         # Required TTS entity attributes.
         # Advertise every language Kokoro can speak: Home Assistant hides the
@@ -146,6 +255,44 @@ class KokoroTTSEntity(TextToSpeechEntity):
         )
         self._attr_supported_options = SUPPORTED_OPTIONS
 
+    async def async_added_to_hass(self) -> None:
+        """Start pre-rendering warm phrases once the entity is registered."""
+        await super().async_added_to_hass()
+        if self._catalog is not None:
+            # Listening keeps the coordinator refreshing on its interval.
+            self.async_on_remove(
+                self._catalog.async_add_listener(self._handle_catalog_update)
+            )
+        if self._warm_phrases and self.platform.config_entry is not None:
+            self.platform.config_entry.async_create_background_task(
+                self.hass, self._async_warm_up(), f"{DOMAIN} warm phrases"
+            )
+
+    @callback
+    def _handle_catalog_update(self) -> None:
+        """Note a refreshed voice catalogue."""
+        if self._catalog is not None and self._catalog.data is not None:
+            _LOGGER.debug(
+                "Voice catalogue refreshed: %d voice(s), %d model(s)",
+                len(self._catalog.data.voices),
+                len(self._catalog.data.models),
+            )
+
+    @property
+    def extra_state_attributes(self) -> dict[str, Any]:
+        """Expose synthesis cache and per-backend counters."""
+        attributes: dict[str, Any] = {
+            "backends": self._backends.as_dict(),
+            "coalesced_requests": self._inflight.coalesced,
+            "queued_requests": self._backends.queued,
+        }
+        if self._hedger is not None:
+            attributes["hedged_requests"] = self._hedger.hedged
+            attributes["hedges_won"] = self._hedger.hedges_won
+        if self._cache is not None:
+            attributes.update(self._cache.stats)
+        return attributes
+
     @staticmethod
     def _handle_http_error(status: int, text: str) -> str:
         """Map HTTP status codes to user-friendly error messages."""
@@ -166,23 +313,60 @@ class KokoroTTSEntity(TextToSpeechEntity):
     def _get_lang_code(self, persona: str | None) -> str | None:
         """Determine the lang_code to send to the API.
 
-        Priority: configured language > first letter of voice name.
-        The API uses single-letter codes: a, b, j, z, e, f, h, i, p.
+        Priority: configured language > language of the (first) voice. The
+        API uses single-letter codes: a, b, j, z, e, f, h, i, p.
         """
         if self._language and self._language in LANGUAGE_CODE_MAP:
             return LANGUAGE_CODE_MAP[self._language]
-        # Fallback: derive from voice name prefix (e.g. "af_heart" -> "a")
-        if persona and len(persona) >= 1:
-            return persona[0].lower()
-        return None
+        catalog = self._catalog.data if self._catalog is not None else None
+        return (catalog or STATIC_CATALOG).lang_code(persona)
+
+    @staticmethod
+    def _validate_sample_rate(sample_rate: int) -> None:
+        """Reject a sample rate the resampler is not meant for."""
+        if not MIN_SAMPLE_RATE <= sample_rate <= MAX_SAMPLE_RATE:
+            raise ServiceValidationError(
+                f"Sample rate {sample_rate} Hz is outside "
+                f"{MIN_SAMPLE_RATE}-{MAX_SAMPLE_RATE} Hz"
+            )
+
+    def _validate(self, persona: str | None, model: str) -> None:
+        """Reject a persona or model the servers do not offer.
+
+        Checked against the catalogue in memory, so a misspelt option fails
+        at once instead of after a round trip ending in a 422. Nothing is
+        checked until the catalogue has been fetched.
+        """
+        if self._catalog is None or (catalog := self._catalog.data) is None:
+            return
+        if catalog.models and model not in catalog.models:
+            raise ServiceValidationError(
+                f"Model {model!r} is not offered by the Kokoro server; "
+                f"available: {', '.join(sorted(catalog.models))}"
+            )
+        if not persona or persona in catalog:
+            return
+        for voice in blend_voices(persona):
+            if voice not in catalog:
+                raise ServiceValidationError(
+                    f"Voice {voice!r} is not offered by the Kokoro server"
+                )
 
     def _resolve_options(self, options: dict[str, Any] | None) -> dict[str, Any]:
-        """Merge entity defaults with per-call options."""
+        """Merge entity defaults with per-call options and validate them."""
         opts = options or {}
+        persona = opts.get("persona", opts.get("voice", self._persona))
+        model = opts.get("model") or self._model
+        self._validate(persona, model)
+        sample_rate = int(opts.get("sample_rate", self._sample_rate))
+        self._validate_sample_rate(sample_rate)
         return {
-            "persona": opts.get("persona", opts.get("voice", self._persona)),
+            "persona": persona,
+            "model": model,
+            "lang_code": self._get_lang_code(persona),
             "speed": float(opts.get("speed", self._speed)),
             "fmt": (opts.get("format", self._fmt) or self._fmt).lower(),
+            "sample_rate": sample_rate,
             "volume_multiplier": float(
                 opts.get("volume_multiplier", DEFAULT_VOLUME_MULTIPLIER)
             ),
@@ -194,7 +378,7 @@ class KokoroTTSEntity(TextToSpeechEntity):
         """Build the /v1/audio/speech request payload."""
         persona = resolved["persona"]
         payload: dict[str, Any] = {
-            "model": self._model,
+            "model": resolved["model"],
             "input": message,
             "voice": persona or "af_heart",
             "response_format": resolved["fmt"],
@@ -203,10 +387,8 @@ class KokoroTTSEntity(TextToSpeechEntity):
             "stream": stream,
         }
 
-        # Add lang_code if we can determine one
-        lang_code = self._get_lang_code(persona)
-        if lang_code:
-            payload["lang_code"] = lang_code
+        if resolved["lang_code"]:
+            payload["lang_code"] = resolved["lang_code"]
 
         if resolved["volume_multiplier"] != 1.0:
             payload["volume_multiplier"] = resolved["volume_multiplier"]
@@ -220,11 +402,6 @@ class KokoroTTSEntity(TextToSpeechEntity):
             headers["Authorization"] = f"Bearer {self._api_key}"
         return headers
 
-    @property
-    def _speech_url(self) -> str:
-        """Return the speech endpoint URL."""
-        return f"{self._base_url}/v1/audio/speech"
-
     async def async_get_tts_audio(
         self, message: str, language: str, options: dict[str, Any] | None = None
     ) -> TtsAudioType:
@@ -232,22 +409,177 @@ class KokoroTTSEntity(TextToSpeechEntity):
         if not message.strip():
             raise ValueError("Message cannot be empty")
 
+        started = time.monotonic()
         resolved = self._resolve_options(options)
+        try:
+            audio_bytes, outcome = await self._async_get_audio(message, resolved)
+            audio_bytes = await self._async_resample(resolved, audio_bytes)
+        except Exception as err:
+            self._metrics.record_request(
+                "announcement",
+                count_sentences(message, resolved["lang_code"]),
+                0,
+                None,
+                time.monotonic() - started,
+                f"{type(err).__name__}: {err}",
+            )
+            raise
+
+        elapsed = time.monotonic() - started
+        # Replayed audio would drag the percentiles below what synthesis takes.
+        if outcome == "synthesised":
+            self._metrics.record_first_audio(elapsed)
+        self._metrics.record_request(
+            "announcement",
+            count_sentences(message, resolved["lang_code"]),
+            len(audio_bytes),
+            elapsed,
+            elapsed,
+            outcome,
+        )
+        return resolved["fmt"], audio_bytes
+
+    async def _async_get_audio(
+        self, message: str, resolved: dict[str, Any]
+    ) -> tuple[bytes, str]:
+        """Return the audio for a one-shot message and where it came from."""
         fmt = resolved["fmt"]
         payload = self._build_payload(message, resolved, stream=False)
+        key = payload_key(payload)
+
+        if (prefetched := self._phrases.get(key)) is not None:
+            _LOGGER.debug("TTS prefetched phrase: %d bytes, format: %s", len(prefetched), fmt)
+            return prefetched, "prefetched"
+
+        if self._cache is not None:
+            if (cached := await self._cache.async_get(key)) is not None:
+                _LOGGER.debug("TTS cache hit: %d bytes, format: %s", len(cached), fmt)
+                return cached, "cached"
+
+        # Identical announcements made at the same time (the same message on
+        # several media players) share one synthesis. The priority is part of
+        # the key, so an announcement never waits behind a queued prefetch.
+        audio_bytes = await self._inflight.async_do(
+            (key, Priority.INTERACTIVE),
+            lambda: self._async_synthesise(
+                message, resolved, payload, key, Priority.INTERACTIVE
+            ),
+        )
+
+        _LOGGER.debug("TTS audio generated: %d bytes, format: %s", len(audio_bytes), fmt)
+        return audio_bytes, "synthesised"
+
+    async def _async_resample(self, resolved: dict[str, Any], audio_bytes: bytes) -> bytes:
+        """Convert one-shot pcm or wav audio to the configured sample rate.
+
+        The cache and prefetched phrases keep the server's audio, so changing
+        the rate does not invalidate them. Audio that cannot be converted is
+        returned unchanged.
+        """
+        fmt, sample_rate = resolved["fmt"], resolved["sample_rate"]
+        if sample_rate == KOKORO_SAMPLE_RATE or fmt not in RESAMPLED_FORMATS:
+            return audio_bytes
+        try:
+            return await self.hass.async_add_executor_job(
+                resample_audio, fmt, audio_bytes, sample_rate
+            )
+        except ValueError as err:
+            _LOGGER.warning("Could not resample %s audio to %d Hz: %s", fmt, sample_rate, err)
+            return audio_bytes
+
+    async def _async_synthesise(
+        self,
+        message: str,
+        resolved: dict[str, Any],
+        payload: dict[str, Any],
+        key: str,
+        priority: Priority,
+    ) -> bytes:
+        """Synthesise a one-shot message and store it in the synthesis cache."""
+        if (
+            self._parallel_workers > 1
+            and resolved["fmt"] in JOINABLE_FORMATS
+            and len(message) >= PARALLEL_MIN_CHARS
+        ):
+            audio_bytes = await self._async_fetch_segmented(message, resolved, priority)
+        else:
+            audio_bytes = await self._async_fetch_audio(payload, priority)
+        if self._cache is not None:
+            self._cache.async_store(key, audio_bytes)
+        return audio_bytes
+
+    async def _async_raise_for_status(self, response: aiohttp.ClientResponse) -> None:
+        """Raise for a failed synthesis response.
+
+        429 and 503 raise BackendBusyError carrying the server's Retry-After,
+        so the request can be queued again instead of failing. Other 5xx
+        statuses raise BackendServerError, which counts towards opening the
+        server's circuit breaker.
+        """
+        if response.status == 200:
+            return
+        error_text = await response.text()
+        error_msg = self._handle_http_error(response.status, error_text)
+        if response.status in BUSY_STATUSES:
+            raise BackendBusyError(
+                error_msg,
+                response.status,
+                parse_retry_after(response.headers.get("Retry-After")),
+            )
+        _LOGGER.warning("Kokoro TTS API error %d: %s", response.status, error_text[:200])
+        if response.status >= 500:
+            raise BackendServerError(error_msg)
+        raise RuntimeError(error_msg)
+
+    async def _async_fetch_audio(
+        self,
+        payload: dict[str, Any],
+        priority: Priority = Priority.INTERACTIVE,
+        flow: object | None = None,
+    ) -> bytes:
+        """POST a non-streaming synthesis request and return the audio.
+
+        A request the server refuses as busy is queued again once the server's
+        Retry-After has passed, at most BUSY_RETRIES times. With hedging on,
+        a slow request that is not background work is raced against a copy.
+        """
+        hedger = self._hedger if priority is not Priority.BACKGROUND else None
+        retries = 0
+        while True:
+            retry = retries > 0
+            try:
+                if hedger is None:
+                    return await self._async_post_audio(payload, priority, flow, retry)
+                return await hedger.async_do(
+                    lambda: self._async_post_audio(payload, priority, flow, retry)
+                )
+            except BackendBusyError as err:
+                retries += 1
+                if retries > BUSY_RETRIES or err.retry_after > MAX_RETRY_AFTER:
+                    raise
+
+    async def _async_post_audio(
+        self, payload: dict[str, Any], priority: Priority, flow: object | None, retry: bool
+    ) -> bytes:
+        """POST one non-streaming synthesis request and return the audio."""
         timeout = aiohttp.ClientTimeout(total=60, connect=10)
 
-        async with aiohttp.ClientSession(timeout=timeout) as session:
+        async with (
+            self._backends.async_request(priority, flow, retry=retry) as backend,
+            self._metrics.async_trace_upstream(
+                streamed=False, backend=backend.base_url, voice=payload["voice"]
+            ) as trace,
+        ):
+            session = backend.session
             async with session.post(
-                self._speech_url, json=payload, headers=self._build_headers()
+                backend.speech_url,
+                json=payload,
+                headers=self._build_headers(),
+                timeout=timeout,
             ) as response:
-                if response.status != 200:
-                    error_text = await response.text()
-                    _LOGGER.warning(
-                        "Kokoro TTS API error %d: %s", response.status, error_text[:200]
-                    )
-                    error_msg = self._handle_http_error(response.status, error_text)
-                    raise RuntimeError(error_msg)
+                trace.response(response.status)
+                backend.observe_latency(trace.ttfb)
+                await self._async_raise_for_status(response)
 
                 content_type = response.headers.get("content-type", "").lower()
 
@@ -280,8 +612,104 @@ class KokoroTTSEntity(TextToSpeechEntity):
                 if not audio_bytes:
                     raise RuntimeError("Received empty audio data")
 
-                _LOGGER.debug("TTS audio generated: %d bytes, format: %s", len(audio_bytes), fmt)
-                return fmt, audio_bytes
+                trace.size = len(audio_bytes)
+                return audio_bytes
+
+    async def _async_fetch_segmented(
+        self, message: str, resolved: dict[str, Any], priority: Priority
+    ) -> bytes:
+        """Synthesise a long message as concurrent segments and join them.
+
+        Segments are whole sentences grouped to about PARALLEL_SEGMENT_CHARS.
+        At most `parallel_workers` are in flight at once, each routed to the
+        least busy backend, so wall-clock time scales with the number of
+        workers instead of the length of the text. The segments form one flow,
+        so they take turns with other requests waiting for the same servers.
+        """
+        segmenter = AdaptiveSegmenter(0, PARALLEL_SEGMENT_CHARS, resolved["lang_code"])
+        segments = segmenter.feed(message) + segmenter.flush()
+        if len(segments) < 2:
+            return await self._async_fetch_audio(
+                self._build_payload(message, resolved, stream=False), priority
+            )
+
+        semaphore = asyncio.Semaphore(self._parallel_workers)
+        flow = object()
+
+        async def _segment(text: str) -> bytes:
+            async with semaphore:
+                return await self._async_fetch_audio(
+                    self._build_payload(text, resolved, stream=False), priority, flow
+                )
+
+        tasks = [asyncio.create_task(_segment(text)) for text in segments]
+        try:
+            parts = await asyncio.gather(*tasks)
+        finally:
+            for task in tasks:
+                task.cancel()
+
+        try:
+            # Joining copies, and for opus re-checksums, the whole message.
+            audio_bytes = await self.hass.async_add_executor_job(
+                join_audio, resolved["fmt"], parts
+            )
+        except ValueError as err:
+            _LOGGER.warning(
+                "Could not join %d segments (%s), synthesising in one request",
+                len(parts),
+                err,
+            )
+            return await self._async_fetch_audio(
+                self._build_payload(message, resolved, stream=False), priority
+            )
+        _LOGGER.debug(
+            "TTS audio synthesised as %d segment(s) with %d worker(s)",
+            len(parts),
+            self._parallel_workers,
+        )
+        return audio_bytes
+
+    async def async_prefetch(
+        self, message: str, options: dict[str, Any] | None = None
+    ) -> None:
+        """Render a phrase ahead of time (kokoro_tts.prefetch service).
+
+        The payload is built exactly as async_get_tts_audio would build it for
+        the same message and options, so a later announcement of the phrase is
+        answered from the phrase store without contacting the server. A phrase
+        already in the synthesis cache is loaded from disk instead of being
+        synthesised again.
+        """
+        if not message.strip():
+            raise ValueError("Message cannot be empty")
+        resolved = self._resolve_options(options)
+        payload = self._build_payload(message, resolved, stream=False)
+        key = payload_key(payload)
+
+        async def _async_render() -> bytes:
+            if self._cache is not None:
+                if (cached := await self._cache.async_get(key)) is not None:
+                    return cached
+            return await self._inflight.async_do(
+                (key, Priority.BACKGROUND),
+                lambda: self._async_synthesise(
+                    message, resolved, payload, key, Priority.BACKGROUND
+                ),
+            )
+
+        await self._phrases.async_render(key, _async_render)
+
+    async def _async_warm_up(self) -> None:
+        """Pre-render the configured warm phrases in the background."""
+        results = await asyncio.gather(
+            *(self.async_prefetch(phrase) for phrase in self._warm_phrases),
+            return_exceptions=True,
+        )
+        for phrase, result in zip(self._warm_phrases, results):
+            if isinstance(result, Exception):
+                _LOGGER.warning("Could not pre-render %r: %s", phrase, result)
+        _LOGGER.debug("Pre-rendered %d warm phrase(s)", len(self._phrases))
 
     def async_supports_streaming_input(self) -> bool:
         """Return True - text can be consumed as it is generated.
@@ -299,8 +727,18 @@ class KokoroTTSEntity(TextToSpeechEntity):
         resolved = self._resolve_options(request.options)
         fmt = resolved["fmt"]
 
+        # WAV is assembled locally: the server only sends raw PCM, which costs
+        # it no encoding, and a single header is written in front of it.
+        if fmt in PCM_STREAM_FORMATS:
+            return TTSAudioResponse(
+                extension=fmt,
+                data_gen=self._async_stream_wav(
+                    request.message_gen, {**resolved, "fmt": "pcm"}
+                ),
+            )
+
         # Streaming issues one request per sentence and concatenates the audio.
-        # Container formats carrying a per-file header (wav, flac) cannot be
+        # Other container formats carrying a per-file header (flac) cannot be
         # concatenated that way, so fall back to a stream-safe format.
         if fmt not in STREAM_SAFE_FORMATS:
             _LOGGER.debug(
@@ -311,65 +749,265 @@ class KokoroTTSEntity(TextToSpeechEntity):
             fmt = DEFAULT_STREAM_FORMAT
             resolved = {**resolved, "fmt": fmt}
 
+        if fmt == "mp3":
+            return TTSAudioResponse(
+                extension=fmt,
+                data_gen=self._async_stream_mp3(request.message_gen, resolved),
+            )
+        if fmt == "opus":
+            return TTSAudioResponse(
+                extension=fmt,
+                data_gen=self._async_stream_opus(request.message_gen, resolved),
+            )
+
         return TTSAudioResponse(
             extension=fmt,
-            data_gen=self._async_stream_audio(request.message_gen, resolved),
+            data_gen=self._async_stream_pcm(request.message_gen, resolved),
         )
 
+    async def _async_stream_wav(
+        self, message_gen: AsyncGenerator[str], resolved: dict[str, Any]
+    ) -> AsyncGenerator[bytes]:
+        """Yield one streaming WAV header, then the PCM of every chunk."""
+        yield streaming_wav_header(resolved["sample_rate"])
+        async for audio in self._async_stream_pcm(message_gen, resolved):
+            yield audio
+
+    def _async_stream_pcm(
+        self, message_gen: AsyncGenerator[str], resolved: dict[str, Any]
+    ) -> AsyncGenerator[bytes]:
+        """Return the streamed PCM of a reply, trimmed and at the requested rate."""
+        audio = self._async_stream_audio(message_gen, resolved)
+        if self._max_pause_ms:
+            audio = self._async_trim_stream(audio)
+        return self._async_resample_stream(audio, resolved["sample_rate"])
+
+    async def _async_trim_stream(
+        self, audio: AsyncGenerator[bytes]
+    ) -> AsyncGenerator[bytes]:
+        """Yield streamed PCM without leading silence and with pauses capped.
+
+        Kokoro pads every sentence with silence; where two streamed sentences
+        meet, at most `max_pause_ms` of it is played. Runs in the executor.
+        """
+        trimmer = SilenceTrimmer(KOKORO_SAMPLE_RATE, self._max_pause_ms)
+        async for chunk in audio:
+            if data := await self.hass.async_add_executor_job(trimmer.feed, chunk):
+                yield data
+        if data := await self.hass.async_add_executor_job(trimmer.flush):
+            yield data
+        _LOGGER.debug("TTS stream: %d ms of silence left out", trimmer.dropped_ms)
+
+    async def _async_resample_stream(
+        self, audio: AsyncGenerator[bytes], sample_rate: int
+    ) -> AsyncGenerator[bytes]:
+        """Yield streamed PCM converted to the configured sample rate.
+
+        One resampler serves the whole reply, so its filter runs on across
+        sentence boundaries without clicks. Conversion runs in the executor.
+        """
+        resampler = StreamingResampler(KOKORO_SAMPLE_RATE, sample_rate)
+        if resampler.passthrough:
+            async for chunk in audio:
+                yield chunk
+            return
+        async for chunk in audio:
+            if data := await self.hass.async_add_executor_job(resampler.feed, chunk):
+                yield data
+        if data := await self.hass.async_add_executor_job(resampler.flush):
+            yield data
+
+    async def _async_stream_mp3(
+        self, message_gen: AsyncGenerator[str], resolved: dict[str, Any]
+    ) -> AsyncGenerator[bytes]:
+        """Yield the audio frames of every chunk as one continuous MP3 stream.
+
+        Frames are parsed in the executor.
+        """
+        frames = Mp3FrameFilter()
+        async for audio in self._async_stream_audio(message_gen, resolved):
+            if data := await self.hass.async_add_executor_job(frames.feed, audio):
+                yield data
+        await self.hass.async_add_executor_job(frames.flush)
+        _LOGGER.debug(
+            "TTS mp3 stream: %d frame(s), %.2f s, %d byte(s) of headers/padding dropped",
+            frames.frames,
+            frames.duration,
+            frames.dropped_bytes,
+        )
+
+    async def _async_stream_opus(
+        self, message_gen: AsyncGenerator[str], resolved: dict[str, Any]
+    ) -> AsyncGenerator[bytes]:
+        """Yield the pages of every chunk remuxed into one Ogg Opus stream.
+
+        Remuxing checksums every page in pure Python, so it runs in the executor.
+        """
+        remuxer = OggOpusRemuxer()
+        async for audio in self._async_stream_audio(message_gen, resolved):
+            if data := await self.hass.async_add_executor_job(remuxer.feed, audio):
+                yield data
+        if data := await self.hass.async_add_executor_job(remuxer.flush):
+            yield data
+        _LOGGER.debug("TTS opus stream: %d Ogg page(s)", remuxer.pages)
+
     async def _async_stream_audio(
         self, message_gen: AsyncGenerator[str], resolved: dict[str, Any]
     ) -> AsyncGenerator[bytes]:
-        """Consume the text stream and yield audio for each complete sentence."""
-        # No total timeout: the generator lives as long as the agent is talking.
-        timeout = aiohttp.ClientTimeout(total=None, connect=10, sock_read=60)
+        """Consume the text stream and yield audio for each text chunk.
+
+        Text is cleaned up for speech by a TextNormalizer (markdown, URLs,
+        emoji, units), then cut into chunks by an AdaptiveSegmenter: a short
+        first chunk for fast first audio, then merged sentences. Up to `lookahead` chunks
+        are synthesised while the current one is still being yielded; audio
+        always comes out in text order. The chunks form one flow, so they are
+        admitted in order and take turns with other streams.
+        """
+        flow = object()
+        chunk_count = 0
         sentence_count = 0
+        # Units and times are spelled out in English only.
+        normalizer = TextNormalizer(english=resolved["lang_code"] in (None, "a", "b"))
+        segmenter = AdaptiveSegmenter(
+            self._first_chunk_chars, self._merge_chars, resolved["lang_code"]
+        )
+        # Timings start when the first text chunk is ready, so they exclude
+        # how long the conversation agent took to write it.
+        started = time.monotonic()
+        first_text: float | None = None
+        first_audio: float | None = None
+        size = 0
+        outcome = "streamed"
+
+        async def _chunks() -> AsyncGenerator[str]:
+            nonlocal chunk_count, sentence_count, first_text
+            async for text in message_gen:
+                for chunk in segmenter.feed(normalizer.feed(text)):
+                    chunk_count += 1
+                    sentence_count += count_sentences(chunk, resolved["lang_code"])
+                    first_text = first_text or time.monotonic()
+                    yield chunk
 
-        async with aiohttp.ClientSession(timeout=timeout) as session:
-            buffer = ""
-            async for chunk in message_gen:
-                buffer += chunk
-                sentences, buffer = split_sentences(buffer)
-                for sentence in sentences:
-                    sentence_count += 1
-                    async for audio in self._async_stream_sentence(
-                        session, sentence, resolved
-                    ):
-                        yield audio
-
-            # Flush the tail: the last sentence often has no trailing whitespace.
-            tail = buffer.strip()
-            if tail:
-                sentence_count += 1
-                async for audio in self._async_stream_sentence(session, tail, resolved):
-                    yield audio
+            for chunk in segmenter.feed(normalizer.flush()) + segmenter.flush():
+                chunk_count += 1
+                sentence_count += count_sentences(chunk, resolved["lang_code"])
+                first_text = first_text or time.monotonic()
+                yield chunk
+
+        try:
+            async for audio in async_ordered_lookahead(
+                _chunks(),
+                lambda sentence: self._async_stream_sentence(sentence, resolved, flow),
+                self._lookahead,
+                STREAM_CHUNK_BYTES,
+            ):
+                if first_audio is None and first_text is not None:
+                    first_audio = time.monotonic() - first_text
+                    self._metrics.record_first_audio(first_audio)
+                size += len(audio)
+                yield audio
+        except (asyncio.CancelledError, GeneratorExit):
+            outcome = "cancelled"
+            raise
+        except Exception as err:
+            outcome = f"{type(err).__name__}: {err}"
+            raise
+        finally:
+            self._metrics.record_request(
+                "stream",
+                sentence_count,
+                size,
+                first_audio,
+                time.monotonic() - (first_text or started),
+                outcome,
+            )
 
         _LOGGER.debug(
-            "TTS stream complete: %d sentence(s), format: %s",
-            sentence_count,
+            "TTS stream complete: %d chunk(s), format: %s, %d of %d character(s) "
+            "left after normalization",
+            chunk_count,
             resolved["fmt"],
+            normalizer.chars_out,
+            normalizer.chars_in,
         )
 
     async def _async_stream_sentence(
-        self,
-        session: aiohttp.ClientSession,
-        message: str,
-        resolved: dict[str, Any],
+        self, message: str, resolved: dict[str, Any], flow: object
     ) -> AsyncGenerator[bytes]:
-        """Synthesise one sentence and yield its audio as it arrives."""
+        """Synthesise one sentence and yield its audio as it arrives.
+
+        Sentences found in the synthesis cache are replayed from disk. Others
+        share one upstream request with any identical sentence being streamed
+        at the same time, and are cached once fully read.
+        """
         payload = self._build_payload(message, resolved, stream=True)
+        key = payload_key(payload)
 
-        async with session.post(
-            self._speech_url, json=payload, headers=self._build_headers()
-        ) as response:
-            if response.status != 200:
-                error_text = await response.text()
-                _LOGGER.warning(
-                    "Kokoro TTS API error %d: %s", response.status, error_text[:200]
-                )
-                raise RuntimeError(
-                    self._handle_http_error(response.status, error_text)
-                )
+        if self._cache is not None:
+            if (cached := await self._cache.async_get(key)) is not None:
+                for start in range(0, len(cached), STREAM_CHUNK_BYTES):
+                    yield cached[start : start + STREAM_CHUNK_BYTES]
+                return
 
-            async for chunk in response.content.iter_chunked(STREAM_CHUNK_BYTES):
-                if chunk:
+        async for chunk in self._inflight.async_stream(
+            key, lambda: self._async_stream_payload(payload, key, flow)
+        ):
+            yield chunk
+
+    async def _async_stream_payload(
+        self, payload: dict[str, Any], key: str, flow: object
+    ) -> AsyncGenerator[bytes]:
+        """POST a streaming synthesis request and yield the audio as it arrives.
+
+        Busy responses are retried as in _async_fetch_audio; they always come
+        before any audio has been yielded. With hedging on, a slow sentence is
+        raced against a copy.
+        """
+        retries = 0
+        while True:
+            retry = retries > 0
+            if self._hedger is None:
+                audio = self._async_post_stream(payload, key, flow, retry)
+            else:
+                audio = self._hedger.async_stream(
+                    lambda: self._async_post_stream(payload, key, flow, retry)
+                )
+            try:
+                async for chunk in audio:
                     yield chunk
+                return
+            except BackendBusyError as err:
+                retries += 1
+                if retries > BUSY_RETRIES or err.retry_after > MAX_RETRY_AFTER:
+                    raise
+
+    async def _async_post_stream(
+        self, payload: dict[str, Any], key: str, flow: object, retry: bool
+    ) -> AsyncGenerator[bytes]:
+        """POST one streaming synthesis request and yield the audio as it arrives."""
+        async with (
+            self._backends.async_request(Priority.STREAM, flow, retry=retry) as backend,
+            self._metrics.async_trace_upstream(
+                streamed=True, backend=backend.base_url, voice=payload["voice"]
+            ) as trace,
+        ):
+            async with backend.session.post(
+                backend.speech_url,
+                json=payload,
+                headers=self._build_headers(),
+                timeout=STREAM_TIMEOUT,
+            ) as response:
+                trace.response(response.status)
+                backend.observe_latency(trace.ttfb)
+                await self._async_raise_for_status(response)
+
+                parts: list[bytes] = []
+                async for chunk in response.content.iter_chunked(STREAM_CHUNK_BYTES):
+                    if chunk:
+                        trace.size += len(chunk)
+                        if self._cache is not None:
+                            parts.append(chunk)
+                        yield chunk
+
+        if self._cache is not None:
+            self._cache.async_store(key, b"".join(parts))
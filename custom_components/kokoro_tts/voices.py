@@ -0,0 +1,173 @@
+"""Indexed catalogue of the voices a Kokoro server offers."""
+from __future__ import annotations
+
+from collections.abc import Iterable
+import re
+
+from .const import LANGUAGE_CODE_MAP, LANGUAGE_OPTIONS, PERSONA_MAPPINGS, SEX_OPTIONS
+
+ALL_LANGUAGES = "All Languages"
+ALL_SEXES = "All"
+
+# Single-letter language codes the API accepts as lang_code.
+LANG_CODES = frozenset(LANGUAGE_CODE_MAP.values())
+
+_LANGUAGE_BY_CODE = {code: language for language, code in LANGUAGE_CODE_MAP.items()}
+_SEX_BY_CODE = {"f": "Female", "m": "Male"}
+
+# Kokoro's naming scheme: language letter, sex letter, underscore, name.
+_VOICE_NAME = re.compile(r"^([a-z])([fm])_(\w+)$")
+
+# Separators and weights of a blended persona such as "af_bella(2)+af_sky(1)".
+_BLEND_SEPARATOR = re.compile(r"[+-]")
+_BLEND_WEIGHT = re.compile(r"\(\s*[\d.]+\s*\)\s*$")
+
+
+def blend_voices(persona: str) -> list[str]:
+    """Return the voices a persona names: itself, or each voice of a blend."""
+    return [
+        _BLEND_WEIGHT.sub("", part).strip()
+        for part in _BLEND_SEPARATOR.split(persona)
+    ]
+
+
+def _describe(voice: str) -> tuple[str, str, str] | None:
+    """Return (language, sex, name) of a voice, or None if it is unknown.
+
+    Voices missing from PERSONA_MAPPINGS but following Kokoro's naming
+    scheme (e.g. "zf_xiaoni") are described from their name, so voices a
+    server adds later still land under the right filters.
+    """
+    if (mapped := PERSONA_MAPPINGS.get(voice)) is not None:
+        return mapped
+    match = _VOICE_NAME.match(voice)
+    if match is None or match.group(1) not in _LANGUAGE_BY_CODE:
+        return None
+    code, sex, name = match.groups()
+    return (
+        _LANGUAGE_BY_CODE[code],
+        _SEX_BY_CODE[sex],
+        name.replace("_", " ").title(),
+    )
+
+
+def _display_name(
+    description: tuple[str, str, str], language: str, sex: str
+) -> str:
+    """Return a voice's name, qualified by whatever the filters leave open."""
+    voice_language, voice_sex, name = description
+    if language != ALL_LANGUAGES and sex != ALL_SEXES:
+        return name
+    if language != ALL_LANGUAGES:
+        return f"{name} ({voice_sex})"
+    if sex != ALL_SEXES:
+        return f"{name} ({voice_language})"
+    return f"{name} ({voice_language}, {voice_sex})"
+
+
+class VoiceCatalog:
+    """Voices and models of a server, indexed once for constant-time lookups.
+
+    PERSONA_MAPPINGS supplies language, sex and display name; voices the
+    mapping does not know are described from their name when they follow
+    Kokoro's scheme. The config flow reads the filtered, sorted dropdown
+    options and the display-name index; the TTS entity reads membership and
+    lang_code.
+    """
+
+    def __init__(self, voices: Iterable[str], models: Iterable[str] = ()) -> None:
+        """Build the indexes."""
+        self.models: tuple[str, ...] = tuple(dict.fromkeys(models))
+        ordered = list(dict.fromkeys(voices))
+        self.voices: frozenset[str] = frozenset(ordered)
+        self._descriptions: dict[str, tuple[str, str, str]] = {}
+        for voice in ordered:
+            if (description := _describe(voice)) is not None:
+                self._descriptions[voice] = description
+
+        # (language filter, sex filter) -> voices, including the "All" rows.
+        # Voices without a description are only listed when nothing is filtered.
+        self._by_filter: dict[tuple[str, str], list[str]] = {
+            (language, sex): [] for language in LANGUAGE_OPTIONS for sex in SEX_OPTIONS
+        }
+        for voice in ordered:
+            description = self._descriptions.get(voice)
+            if description is None:
+                self._by_filter[(ALL_LANGUAGES, ALL_SEXES)].append(voice)
+                continue
+            language, sex, _ = description
+            for key in (
+                (language, sex),
+                (language, ALL_SEXES),
+                (ALL_LANGUAGES, sex),
+                (ALL_LANGUAGES, ALL_SEXES),
+            ):
+                self._by_filter.setdefault(key, []).append(voice)
+
+        # Every display variant -> technical name. Plain names come first so
+        # they win over a qualified variant that happens to read the same.
+        self._by_display: dict[str, str] = {}
+        for voice, (language, sex, name) in self._descriptions.items():
+            self._by_display.setdefault(name, voice)
+        for voice, (language, sex, name) in self._descriptions.items():
+            for variant in (
+                f"{name} ({sex})",
+                f"{name} ({language})",
+                f"{name} ({language}, {sex})",
+            ):
+                self._by_display.setdefault(variant, voice)
+
+        self._options: dict[tuple[str, str], list[str]] = {}
+
+    def __contains__(self, voice: object) -> bool:
+        """Return True if the catalogue offers this exact voice."""
+        return voice in self.voices
+
+    def __len__(self) -> int:
+        """Return the number of voices."""
+        return len(self.voices)
+
+    def describe(self, voice: str) -> tuple[str, str, str] | None:
+        """Return (language, sex, display name) of a voice, if known."""
+        return self._descriptions.get(voice)
+
+    def filtered(self, language: str | None, sex: str | None) -> list[str]:
+        """Return the voices matching a language and a sex filter."""
+        key = (language or ALL_LANGUAGES, sex or ALL_SEXES)
+        return self._by_filter.get(key, [])
+
+    def display_name(
+        self, voice: str, language: str | None = None, sex: str | None = None
+    ) -> str:
+        """Return the dropdown label of a voice under the given filters."""
+        description = self._descriptions.get(voice)
+        if description is None:
+            return voice
+        return _display_name(description, language or ALL_LANGUAGES, sex or ALL_SEXES)
+
+    def options(self, language: str | None, sex: str | None) -> list[str]:
+        """Return the sorted dropdown labels for a filter; computed once each."""
+        key = (language or ALL_LANGUAGES, sex or ALL_SEXES)
+        if (options := self._options.get(key)) is None:
+            options = self._options[key] = sorted(
+                self.display_name(voice, *key) for voice in self.filtered(*key)
+            )
+        return list(options)
+
+    def technical_name(self, display_name: str) -> str:
+        """Return the voice behind a dropdown label; custom values pass through."""
+        return self._by_display.get(display_name, display_name)
+
+    def lang_code(self, persona: str | None) -> str | None:
+        """Return the API lang_code of a voice or blend, from its first voice."""
+        if not persona:
+            return None
+        voice = blend_voices(persona)[0]
+        if (description := self._descriptions.get(voice)) is not None:
+            return LANGUAGE_CODE_MAP.get(description[0])
+        code = voice[:1].lower()
+        return code if code in LANG_CODES else None
+
+
+# Used before a server's voices are known.
+STATIC_CATALOG = VoiceCatalog(PERSONA_MAPPINGS)
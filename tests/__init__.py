@@ -0,0 +1 @@
+"""Tests for the Kokoro TTS integration."""
@@ -0,0 +1,17 @@
+"""Shared test setup for Kokoro TTS."""
+from __future__ import annotations
+
+import importlib.util
+from pathlib import Path
+import sys
+import types
+
+COMPONENT_DIR = Path(__file__).resolve().parents[1] / "custom_components" / "kokoro_tts"
+
+if importlib.util.find_spec("homeassistant") is None:
+    # The integration's __init__ needs Home Assistant, but the audio and text
+    # units tested here do not: register the package without running it, so
+    # they can be tested with nothing but pytest installed.
+    package = types.ModuleType("custom_components.kokoro_tts")
+    package.__path__ = [str(COMPONENT_DIR)]
+    sys.modules.setdefault("custom_components.kokoro_tts", package)
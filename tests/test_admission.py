@@ -0,0 +1,121 @@
+"""Tests for request admission."""
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Iterator
+from email.utils import formatdate
+import time
+
+import pytest
+
+from custom_components.kokoro_tts.admission import (
+    DEFAULT_RETRY_AFTER,
+    AdmissionQueue,
+    Priority,
+    parse_retry_after,
+)
+
+
+@pytest.fixture
+def loop() -> Iterator[asyncio.AbstractEventLoop]:
+    """Return an event loop to create waiters on; it never needs to run."""
+    loop = asyncio.new_event_loop()
+    yield loop
+    loop.close()
+
+
+def _drain(queue: AdmissionQueue[None]) -> list[asyncio.Future[None]]:
+    """Pop every waiter in the order the queue serves them."""
+    served = []
+    while (waiter := queue.pop()) is not None:
+        served.append(waiter)
+    return served
+
+
+def test_classes_are_served_by_priority(loop: asyncio.AbstractEventLoop) -> None:
+    """Streamed sentences go first, then announcements, then background work."""
+    queue: AdmissionQueue[None] = AdmissionQueue()
+    background, interactive, stream = (loop.create_future() for _ in range(3))
+    queue.push(Priority.BACKGROUND, "warm", background)
+    queue.push(Priority.INTERACTIVE, "speak", interactive)
+    queue.push(Priority.STREAM, "reply", stream)
+
+    assert len(queue) == 3
+    assert _drain(queue) == [stream, interactive, background]
+    assert len(queue) == 0
+
+
+def test_flows_take_turns_within_a_class(loop: asyncio.AbstractEventLoop) -> None:
+    """A reply with look-ahead queued cannot hold back another reply's first sentence."""
+    queue: AdmissionQueue[None] = AdmissionQueue()
+    a1, a2, a3, b1, b2, c1 = (loop.create_future() for _ in range(6))
+    for waiter in (a1, a2, a3):
+        queue.push(Priority.STREAM, "a", waiter)
+    queue.push(Priority.STREAM, "b", b1)
+    queue.push(Priority.STREAM, "b", b2)
+    queue.push(Priority.STREAM, "c", c1)
+
+    assert _drain(queue) == [a1, b1, c1, a2, b2, a3]
+
+
+def test_first_goes_ahead_of_its_flow(loop: asyncio.AbstractEventLoop) -> None:
+    """A retried request is queued before the later sentences of its own flow."""
+    queue: AdmissionQueue[None] = AdmissionQueue()
+    later, retried = loop.create_future(), loop.create_future()
+    queue.push(Priority.STREAM, "a", later)
+    queue.push(Priority.STREAM, "a", retried, first=True)
+
+    assert _drain(queue) == [retried, later]
+
+
+def test_discard(loop: asyncio.AbstractEventLoop) -> None:
+    """A discarded waiter is never served; unknown waiters are ignored."""
+    queue: AdmissionQueue[None] = AdmissionQueue()
+    kept, gone, stranger = (loop.create_future() for _ in range(3))
+    queue.push(Priority.INTERACTIVE, "a", gone)
+    queue.push(Priority.INTERACTIVE, "a", kept)
+
+    queue.discard(Priority.INTERACTIVE, "a", gone)
+    queue.discard(Priority.INTERACTIVE, "a", stranger)
+    queue.discard(Priority.STREAM, "a", kept)
+
+    assert len(queue) == 1
+    assert _drain(queue) == [kept]
+
+
+def test_done_waiters_are_skipped(loop: asyncio.AbstractEventLoop) -> None:
+    """Waiters cancelled or already resolved are dropped when reached."""
+    queue: AdmissionQueue[None] = AdmissionQueue()
+    cancelled, resolved, waiting = (loop.create_future() for _ in range(3))
+    for waiter in (cancelled, resolved, waiting):
+        queue.push(Priority.BACKGROUND, "a", waiter)
+    cancelled.cancel()
+    resolved.set_result(None)
+
+    assert queue.pop() is waiting
+    assert len(queue) == 0
+    assert queue.pop() is None
+
+
+@pytest.mark.parametrize(
+    ("value", "expected"),
+    [
+        (None, DEFAULT_RETRY_AFTER),
+        ("", DEFAULT_RETRY_AFTER),
+        ("7", 7.0),
+        (" 2 ", 2.0),
+        ("-1", DEFAULT_RETRY_AFTER),
+        ("soon", DEFAULT_RETRY_AFTER),
+        ("Wed, 21 Oct 2015 07:28:00 GMT", 0.0),
+    ],
+)
+def test_parse_retry_after(value: str | None, expected: float) -> None:
+    """Delay-seconds and past dates are read; anything else gets the default."""
+    assert parse_retry_after(value) == expected
+
+
+def test_parse_retry_after_future_date() -> None:
+    """An HTTP-date gives the time left until it."""
+    value = formatdate(time.time() + 60, usegmt=True)
+
+    assert parse_retry_after(value) == pytest.approx(60, abs=2)
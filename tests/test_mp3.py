@@ -0,0 +1,122 @@
+"""Tests for the MP3 frame filter."""
+from __future__ import annotations
+
+import pytest
+
+from custom_components.kokoro_tts.mp3 import Mp3FrameFilter
+
+# MPEG-2 Layer III, 24 kHz mono, no CRC: 576 samples per frame. At 48 kbit/s
+# a frame is 144 bytes; at 160 kbit/s (used for the Info frame) 480 bytes.
+AUDIO_HEADER = bytes([0xFF, 0xF3, 0x64, 0xC0])
+AUDIO_FRAME_BYTES = 144
+INFO_HEADER = bytes([0xFF, 0xF3, 0xE4, 0xC0])
+INFO_FRAME_BYTES = 480
+FRAME_SAMPLES = 576
+# Header (4 bytes) plus mono MPEG-2 side information (9 bytes).
+SIDE_INFO_END = 13
+
+ID3_TAG = b"ID3\x04\x00\x00\x00\x00\x00\x05hello"
+
+
+def _audio(marker: int, main_data_begin: int = 1) -> bytes:
+    """Return an audio frame whose payload is filled with marker."""
+    return (
+        AUDIO_HEADER
+        + bytes([main_data_begin])
+        + bytes([marker]) * (AUDIO_FRAME_BYTES - 5)
+    )
+
+
+def _info(delay: int, padding: int, encoder: bytes = b"LAME3.100") -> bytes:
+    """Return an Info frame with a LAME extension reporting delay and padding."""
+    frame = bytearray(INFO_HEADER + bytes(INFO_FRAME_BYTES - 4))
+    frame[SIDE_INFO_END : SIDE_INFO_END + 4] = b"Info"
+    # Frame count, byte count, seek table and quality fields are present.
+    frame[SIDE_INFO_END + 4 : SIDE_INFO_END + 8] = (0x0F).to_bytes(4, "big")
+    lame = SIDE_INFO_END + 8 + 4 + 4 + 100 + 4
+    frame[lame : lame + len(encoder)] = encoder
+    frame[lame + 21 : lame + 24] = ((delay << 12) | padding).to_bytes(3, "big")
+    return bytes(frame)
+
+
+def _markers(data: bytes) -> list[int]:
+    """Return the marker of every audio frame in data, checking frame alignment."""
+    assert len(data) % AUDIO_FRAME_BYTES == 0
+    frames = [data[i : i + AUDIO_FRAME_BYTES] for i in range(0, len(data), AUDIO_FRAME_BYTES)]
+    assert all(frame.startswith(AUDIO_HEADER) for frame in frames)
+    return [frame[-1] for frame in frames]
+
+
+def _filter(data: bytes, step: int) -> tuple[bytes, Mp3FrameFilter]:
+    """Feed data to a new filter step bytes at a time and flush it."""
+    frames = Mp3FrameFilter()
+    out = b"".join(frames.feed(data[i : i + step]) for i in range(0, len(data), step))
+    frames.flush()
+    return out, frames
+
+
+@pytest.mark.parametrize("step", [1, 7, 500, 1 << 20])
+def test_tags_and_info_frames_are_dropped(step: int) -> None:
+    """Only audio frames pass; every byte is either forwarded or counted as dropped."""
+    stream = (
+        ID3_TAG + _info(0, 0) + _audio(1) + _audio(2)
+        + ID3_TAG + _info(0, 0) + _audio(3)
+        + b"TAG" + bytes(125)
+    )
+
+    out, frames = _filter(stream, step)
+
+    assert _markers(out) == [1, 2, 3]
+    assert frames.frames == 3
+    assert frames.duration == pytest.approx(3 * FRAME_SAMPLES / 24000)
+    assert frames.dropped_bytes + len(out) == len(stream)
+
+
+@pytest.mark.parametrize("step", [1, 500, 1 << 20])
+def test_trailing_padding_frames_are_dropped(step: int) -> None:
+    """Whole frames of encoder padding at the end of each file are left out."""
+    stream = (
+        _info(0, 2 * FRAME_SAMPLES + 100) + b"".join(_audio(n) for n in (1, 2, 3, 4))
+        + _info(0, FRAME_SAMPLES - 1) + b"".join(_audio(n) for n in (5, 6))
+    )
+
+    out, _ = _filter(stream, step)
+
+    assert _markers(out) == [1, 2, 5, 6]
+
+
+@pytest.mark.parametrize("step", [1, 500, 1 << 20])
+def test_leading_delay_frames_are_dropped(step: int) -> None:
+    """Whole frames of encoder delay are dropped when nothing refers back to them."""
+    stream = _info(FRAME_SAMPLES + 100, 0) + _audio(1) + _audio(2, main_data_begin=0) + _audio(3)
+
+    out, _ = _filter(stream, step)
+
+    assert _markers(out) == [2, 3]
+
+
+def test_delay_frames_kept_for_the_bit_reservoir() -> None:
+    """Delay frames stay when the next frame takes audio data from them."""
+    stream = _info(FRAME_SAMPLES, 0) + _audio(1) + _audio(2, main_data_begin=20) + _audio(3)
+
+    out, _ = _filter(stream, 1 << 20)
+
+    assert _markers(out) == [1, 2, 3]
+
+
+def test_info_frame_without_lame_extension() -> None:
+    """An Info frame from an unknown encoder is dropped without trimming audio."""
+    stream = _info(FRAME_SAMPLES, FRAME_SAMPLES, encoder=b"XXXX") + _audio(1) + _audio(2, 0)
+
+    out, _ = _filter(stream, 1 << 20)
+
+    assert _markers(out) == [1, 2]
+
+
+def test_junk_between_frames_is_skipped() -> None:
+    """Bytes that are not a frame or tag are skipped up to the next frame."""
+    stream = _audio(1) + b"\x00junk\xff\x00" + _audio(2)
+
+    out, _ = _filter(stream, 3)
+
+    assert _markers(out) == [1, 2]
@@ -0,0 +1,127 @@
+"""Tests for the Ogg Opus remuxer."""
+from __future__ import annotations
+
+import struct
+
+import pytest
+
+from custom_components.kokoro_tts.ogg import _PAGE_HEADER, OggOpusRemuxer, ogg_crc
+
+BOS, EOS = 0x02, 0x04
+
+# One 20 ms CELT frame (TOC config 31, code 0): 960 samples at 48 kHz.
+PACKET = bytes([0xF8]) + bytes(40)
+PACKET_SAMPLES = 960
+
+
+def _page(
+    header_type: int, granule: int, serial: int, sequence: int, packets: list[bytes]
+) -> bytes:
+    """Return an Ogg page holding whole packets, with a valid CRC."""
+    lacing = b"".join(
+        bytes([255] * (len(packet) // 255) + [len(packet) % 255]) for packet in packets
+    )
+    page = bytearray(
+        _PAGE_HEADER.pack(b"OggS", 0, header_type, granule, serial, sequence, 0, len(lacing))
+    )
+    page += lacing + b"".join(packets)
+    struct.pack_into("<I", page, 22, ogg_crc(page))
+    return bytes(page)
+
+
+def _opus_file(serial: int, packets: int, end_trim: int = 0, per_page: int = 3) -> bytes:
+    """Return a complete Ogg Opus file as Kokoro sends for one sentence."""
+    head = b"OpusHead" + bytes([1, 1]) + struct.pack("<HIhB", 312, 24000, 0, 0)
+    pages = [_page(BOS, 0, serial, 0, [head]), _page(0, 0, serial, 1, [b"OpusTags" + bytes(8)])]
+    granule = 0
+    for sequence, start in enumerate(range(0, packets, per_page), start=2):
+        count = min(per_page, packets - start)
+        granule += count * PACKET_SAMPLES
+        last = start + count >= packets
+        pages.append(
+            _page(
+                EOS if last else 0,
+                granule - end_trim if last else granule,
+                serial,
+                sequence,
+                [PACKET] * count,
+            )
+        )
+    return b"".join(pages)
+
+
+def _parse(data: bytes) -> list[tuple[int, int, int, int]]:
+    """Return (header_type, granule, serial, sequence) of every page, checking CRCs."""
+    pages = []
+    pos = 0
+    while pos < len(data):
+        capture, _, header_type, granule, serial, sequence, crc, segments = (
+            _PAGE_HEADER.unpack_from(data, pos)
+        )
+        assert capture == b"OggS"
+        table_end = pos + _PAGE_HEADER.size + segments
+        end = table_end + sum(data[pos + _PAGE_HEADER.size : table_end])
+        page = bytearray(data[pos:end])
+        struct.pack_into("<I", page, 22, 0)
+        assert ogg_crc(page) == crc
+        pages.append((header_type, granule, serial, sequence))
+        pos = end
+    return pages
+
+
+def _remux(data: bytes, step: int) -> bytes:
+    """Feed data to a new remuxer step bytes at a time and flush it."""
+    remuxer = OggOpusRemuxer()
+    out = b"".join(remuxer.feed(data[i : i + step]) for i in range(0, len(data), step))
+    return out + remuxer.flush()
+
+
+def test_crc_known_value() -> None:
+    """The checksum is Ogg's CRC-32: polynomial 0x04C11DB7, no reflection."""
+    assert ogg_crc(b"") == 0
+    assert ogg_crc(b"123456789") == 0x89A1897F
+
+
+@pytest.mark.parametrize("step", [1, 7, 100, 1 << 20])
+def test_chained_files_become_one_stream(step: int) -> None:
+    """Headers are kept once; serial, sequence and granules run on across files."""
+    stream = _opus_file(111, 7, 100) + _opus_file(222, 5, 200) + _opus_file(333, 4, 300)
+
+    pages = _parse(_remux(stream, step))
+
+    assert [page[0] for page in pages[:2]] == [BOS, 0]
+    assert {page[2] for page in pages} == {111}
+    assert [page[3] for page in pages] == list(range(len(pages)))
+    audio = pages[2:]
+    granules = [page[1] for page in audio]
+    assert granules == sorted(granules)
+    # Only the final page ends the stream; its granule drops the last end trim.
+    assert [page[0] & EOS for page in audio] == [0] * (len(audio) - 1) + [EOS]
+    assert granules[-1] == 16 * PACKET_SAMPLES - 300
+
+
+def test_end_trim_never_goes_below_previous_page() -> None:
+    """An end trim longer than the last page is clamped to the page before it."""
+    stream = _opus_file(1, 4, end_trim=2 * PACKET_SAMPLES)
+
+    pages = _parse(_remux(stream, 1 << 20))
+
+    assert pages[-1][0] & EOS
+    assert pages[-1][1] == pages[-2][1] == 3 * PACKET_SAMPLES
+
+
+def test_headers_of_later_files_are_dropped() -> None:
+    """Every file after the first contributes its audio pages only."""
+    stream = _opus_file(1, 3) + _opus_file(2, 3)
+
+    pages = _parse(_remux(stream, 1 << 20))
+
+    assert sum(1 for page in pages if page[0] & BOS) == 1
+    assert len(pages) == 2 + 2
+
+
+def test_audio_without_headers_is_dropped() -> None:
+    """Pages before any OpusHead cannot be decoded and produce nothing."""
+    orphan = _page(0, PACKET_SAMPLES, 9, 2, [PACKET])
+
+    assert _remux(orphan, 1 << 20) == b""
@@ -0,0 +1,142 @@
+"""Tests for text segmentation."""
+from __future__ import annotations
+
+import random
+
+import pytest
+
+from custom_components.kokoro_tts.segmenter import (
+    AdaptiveSegmenter,
+    SentenceScanner,
+    count_sentences,
+    split_sentences,
+)
+
+CASES = [
+    (
+        "Mr. Smith met Dr. Jones at 5 p.m. Then they left, etc. and more. Done! Tail",
+        None,
+        [
+            "Mr. Smith met Dr. Jones at 5 p.m.",
+            "Then they left, etc. and more.",
+            "Done!",
+        ],
+        "Tail",
+    ),
+    (
+        "J. R. R. Tolkien wrote it. I. Was. Here. Pi is 3.14 today. Wait... what? Yes",
+        "a",
+        [
+            "J. R. R. Tolkien wrote it.",
+            "I.",
+            "Was.",
+            "Here.",
+            "Pi is 3.14 today.",
+            "Wait...",
+            "what?",
+        ],
+        "Yes",
+    ),
+    (
+        'He said "Stop." She (quietly) agreed, e.g. by nodding. ',
+        "a",
+        ['He said "Stop."', "She (quietly) agreed, e.g. by nodding."],
+        "",
+    ),
+    (
+        "Sr. García llegó. Bien",
+        "e",
+        ["Sr. García llegó."],
+        "Bien",
+    ),
+    (
+        "これはペンです。あれは本です！まだ",
+        "j",
+        ["これはペンです。", "あれは本です！"],
+        "まだ",
+    ),
+    (
+        "你好。「我很好。」谢谢",
+        "z",
+        ["你好。", "「我很好。」"],
+        "谢谢",
+    ),
+    (
+        "यह किताब है।वह कलम है। अधूरा",
+        "h",
+        ["यह किताब है।", "वह कलम है।"],
+        "अधूरा",
+    ),
+]
+
+
+def _chunked(text: str, rng: random.Random) -> list[str]:
+    """Cut text into pieces of random length, as a language model streams it."""
+    pieces = []
+    pos = 0
+    while pos < len(text):
+        size = rng.randint(1, 6)
+        pieces.append(text[pos : pos + size])
+        pos += size
+    return pieces
+
+
+def _scan(pieces: list[str], lang_code: str | None) -> tuple[list[str], str]:
+    """Feed pieces to a new scanner and return its sentences and remainder."""
+    scanner = SentenceScanner(lang_code)
+    sentences = [sentence for piece in pieces for sentence in scanner.feed(piece)]
+    return sentences, scanner.flush().strip()
+
+
+@pytest.mark.parametrize(("text", "lang_code", "sentences", "remainder"), CASES)
+def test_split_sentences(
+    text: str, lang_code: str | None, sentences: list[str], remainder: str
+) -> None:
+    """Abbreviations, initials, decimals and ellipses follow the language's rules."""
+    assert split_sentences(text, lang_code) == (sentences, remainder)
+
+
+@pytest.mark.parametrize(("text", "lang_code", "sentences", "remainder"), CASES)
+def test_chunking_does_not_change_sentences(
+    text: str, lang_code: str | None, sentences: list[str], remainder: str
+) -> None:
+    """However the text is cut, the scanner finds the same sentences."""
+    assert _scan(list(text), lang_code) == (sentences, remainder)
+    rng = random.Random(text)
+    for _ in range(20):
+        assert _scan(_chunked(text, rng), lang_code) == (sentences, remainder)
+
+
+def test_final_abbreviation_waits_for_next_word() -> None:
+    """After "etc." no sentence is returned until the next word's case is known."""
+    scanner = SentenceScanner()
+
+    assert scanner.feed("Apples, pears, etc. ") == []
+    assert scanner.feed("Then") == ["Apples, pears, etc."]
+    assert scanner.flush() == "Then"
+
+
+def test_count_sentences() -> None:
+    """An unterminated tail counts as a sentence; trailing whitespace does not."""
+    assert count_sentences("One. Two! Three") == 3
+    assert count_sentences("One. Two! ") == 2
+    assert count_sentences("") == 0
+
+
+def test_first_chunk_is_cut_at_a_clause() -> None:
+    """The opening chunk ends at the first clause long enough, before its sentence does."""
+    segmenter = AdaptiveSegmenter(first_chunk_chars=10, merge_chars=0)
+
+    assert segmenter.feed("Well, the weather today is ") == []
+    assert segmenter.feed("sunny, warm and dry") == ["Well, the weather today is sunny,"]
+    assert segmenter.flush() == ["warm and dry"]
+
+
+def test_short_sentences_are_merged() -> None:
+    """Later sentences are sent together until they reach merge_chars."""
+    segmenter = AdaptiveSegmenter(first_chunk_chars=0, merge_chars=15)
+
+    chunks = segmenter.feed("Hi. Done. Anything else? Yes. ")
+
+    assert chunks == ["Hi.", "Done. Anything else?"]
+    assert segmenter.flush() == ["Yes."]